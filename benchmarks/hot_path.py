@@ -0,0 +1,239 @@
+"""Micro-benchmarks for the control hot path of a zone.
+
+Every case is timed per iteration with a monotonic nanosecond clock and summarized
+as percentiles, so a pull request can be compared against its base branch:
+
+    python -m benchmarks.hot_path --output benchmark_results.json
+    python -m benchmarks.hot_path --compare base.json --threshold 1.25
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import gc
+import json
+import platform
+import sys
+from time import perf_counter_ns
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED, STATE_OFF, STATE_ON
+from homeassistant.core import Event, State
+
+from .stub import StubHomeAssistant
+from .zones import create_zone, start_zone, zone_config
+
+DEFAULT_ITERATIONS = 10_000
+DEFAULT_OPENING_ZONES = 100
+
+Timed = Callable[[], Awaitable[None] | None]
+
+
+def summarize(samples: list[int]) -> dict[str, float]:
+    """Summarize nanosecond samples as microsecond statistics."""
+    ordered = sorted(samples)
+    count = len(ordered)
+
+    def _percentile(percent: float) -> float:
+        return ordered[min(count - 1, int(count * percent / 100))] / 1000
+
+    return {
+        "count": count,
+        "mean_us": sum(ordered) / count / 1000,
+        "p50_us": _percentile(50),
+        "p95_us": _percentile(95),
+        "p99_us": _percentile(99),
+        "max_us": ordered[-1] / 1000,
+    }
+
+
+async def async_time(
+    iterations: int, action: Timed, setup: Callable[[], None] | None = None
+) -> dict[str, float]:
+    """Time an action, running the optional setup outside of the measurement."""
+    samples: list[int] = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            if setup is not None:
+                setup()
+            start = perf_counter_ns()
+            if (result := action()) is not None:
+                await result
+            samples.append(perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    return summarize(samples)
+
+
+def _temperature_event(entity_id: str, temperature: float) -> Event:
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            ATTR_ENTITY_ID: entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, str(temperature)),
+        },
+    )
+
+
+async def async_run(iterations: int, opening_zones: int) -> dict[str, Any]:
+    """Run every case and return the results."""
+    hass = StubHomeAssistant(asyncio.get_running_loop())
+    results: dict[str, dict[str, float]] = {}
+
+    # A zone that sits comfortably inside its range, nothing needs to change
+    steady = create_zone(hass, 0)
+    start_zone(hass, steady, 22)
+    await hass.async_block_till_done()
+
+    results["evaluate"] = await async_time(iterations, steady._async_evaluate)
+
+    # A zone that flips between heating and cooling on every evaluation
+    flipping = create_zone(
+        hass, 1, zone_config(1, cycle_delay=timedelta(0), opening_delay=timedelta(0))
+    )
+    start_zone(hass, flipping, 22)
+    await hass.async_block_till_done()
+    toggle = [False]
+
+    def _flip() -> None:
+        toggle[0] = not toggle[0]
+        flipping._state.current_temp = 30 if toggle[0] else 10
+        flipping._async_cancel_timers()
+        flipping._state.is_cycle_locked = False
+
+    results["evaluate_actuate"] = await async_time(
+        iterations, flipping._async_evaluate, _flip
+    )
+    await hass.async_block_till_done()
+
+    # The event handler alone, evaluations are coalesced and run afterwards
+    sensor_events = [
+        _temperature_event(steady._temp_sensor_ids[0], 21 + (index % 10) / 10)
+        for index in range(iterations)
+    ]
+    events = iter(sensor_events)
+    results["temperature_handler"] = await async_time(
+        iterations, lambda: steady._async_on_temperature_changed(next(events))
+    )
+    await hass.async_block_till_done()
+
+    # A sensor update through the bus until the evaluation has finished
+    readings = iter(range(iterations))
+
+    async def _async_temperature_event() -> None:
+        reading = next(readings)
+        hass.states.async_set(steady._temp_sensor_ids[0], str(21 + (reading % 10) / 10))
+        await hass.async_block_till_done()
+
+    results["temperature_event"] = await async_time(
+        iterations, _async_temperature_event
+    )
+
+    # One opening shared by many zones, through the bus and the opening index
+    opening_id = "binary_sensor.shared_opening"
+    shared_zones = [
+        create_zone(
+            hass,
+            index,
+            zone_config(index, openings=[opening_id], opening_delay=timedelta(0)),
+        )
+        for index in range(10, 10 + opening_zones)
+    ]
+    for zone in shared_zones:
+        start_zone(hass, zone, 22)
+    await hass.async_block_till_done()
+
+    opening_states = iter(range(iterations))
+
+    def _reset_opening_locks() -> None:
+        for zone in shared_zones:
+            zone._async_cancel_timers()
+            zone._state.is_openings_locked = False
+
+    async def _async_opening_event() -> None:
+        opened = next(opening_states) % 2 == 0
+        hass.states.async_set(opening_id, STATE_ON if opened else STATE_OFF)
+        await hass.async_block_till_done()
+
+    results["opening_event"] = await async_time(
+        iterations, _async_opening_event, _reset_opening_locks
+    )
+    results["opening_event"]["zones"] = opening_zones
+
+    # State writes, skipped when nothing changed and written otherwise
+    results["state_write_unchanged"] = await async_time(
+        iterations, steady._async_write_state_if_changed
+    )
+
+    def _change_preset() -> None:
+        steady._state.preset = None if steady._state.preset else "Home"
+
+    results["state_write_changed"] = await async_time(
+        iterations, steady._async_write_state_if_changed, _change_preset
+    )
+
+    return {
+        "python": platform.python_version(),
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return the cases whose median regressed past the threshold."""
+    regressions = []
+    for name, current in results["results"].items():
+        if (base := baseline["results"].get(name)) is None or not base["p50_us"]:
+            continue
+        ratio = current["p50_us"] / base["p50_us"]
+        if ratio > threshold:
+            regressions.append(
+                f"{name}: p50 {base['p50_us']:.2f}us -> {current['p50_us']:.2f}us "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the hot path benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--opening-zones", type=int, default=DEFAULT_OPENING_ZONES)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Compare against results from this file")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = asyncio.run(async_run(args.iterations, args.opening_zones))
+
+    print(f"{'case':<24}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for name, stats in results["results"].items():
+        print(
+            f"{name:<24}"
+            + "".join(
+                f"{stats[key]:>10.2f}"
+                for key in ("mean_us", "p50_us", "p95_us", "p99_us", "max_us")
+            )
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if regressions := compare(results, baseline, args.threshold):
+            print("Regressions:", *regressions, sep="\n  ")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
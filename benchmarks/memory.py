@@ -0,0 +1,69 @@
+"""Measure the memory used per zone when running thousands of zones.
+
+Run from the repository root:
+
+    python -m benchmarks.memory --zones 10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Any
+
+from .stub import StubHomeAssistant
+from .zones import create_zone, zone_config
+
+
+async def async_measure(zone_count: int) -> dict[str, Any]:
+    """Create the zones and return the memory they use."""
+    hass = StubHomeAssistant(asyncio.get_running_loop())
+
+    # Validate the configs up front so only the zones themselves are measured
+    configs = [zone_config(index) for index in range(zone_count)]
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    zones = [create_zone(hass, index, config) for index, config in enumerate(configs)]
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = current - baseline
+    return {
+        "zones": zone_count,
+        "total_bytes": total,
+        "bytes_per_zone": total / zone_count,
+        "peak_bytes": peak - baseline,
+        "state_record_bytes": sys.getsizeof(zones[0]._state),
+    }
+
+
+def main() -> None:
+    """Run the memory benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zones", type=int, default=10_000)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_measure(args.zones))
+
+    print(
+        f"{results['zones']} zones use {results['total_bytes'] / 1024 / 1024:.1f} MiB, "
+        f"{results['bytes_per_zone']:.0f} bytes per zone "
+        f"(state record {results['state_record_bytes']} bytes)"
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Replay a recorded trace through real zones on a virtual clock.
+
+The trace is a CSV file with `time,entity_id,state` columns or a JSONL file with
+objects holding the same keys. Times are ISO 8601 timestamps or seconds since the
+start of the trace. Every actuator command is written out with its virtual time:
+
+    python -m benchmarks.replay --config zones.yaml --trace week.csv --output commands.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Iterator
+import csv
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import json
+import sys
+from time import perf_counter
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util, slugify
+import yaml
+
+from custom_components.yas_thermostat.climate import (
+    THERMOSTAT_SCHEMA,
+    YetAnotherSmartThermostat,
+    _create_thermostat,
+)
+from custom_components.yas_thermostat.clock import Clock, ClockAction
+from custom_components.yas_thermostat.const import ATTR_THERMOSTATS, DATA_CLOCK, DOMAIN
+from custom_components.yas_thermostat.startup import async_get_startup_coordinator
+
+from .stub import StubHomeAssistant
+
+# Traces with relative times start at this point in time
+DEFAULT_START = datetime(2023, 1, 1, tzinfo=dt_util.UTC)
+
+TraceEvent = tuple[datetime, str, str]
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when it is advanced, firing due wakeups in order."""
+
+    def __init__(self, hass: StubHomeAssistant, start: datetime) -> None:
+        """Initialize a new instance of the VirtualClock class."""
+        super().__init__(hass)
+        self._now = start
+        self._sequence = itertools.count()
+        self._wakeups: list[list[Any]] = []
+
+    def now(self) -> datetime:
+        """Return the virtual time."""
+        return self._now
+
+    @callback
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        """Call the action once the virtual time reaches the point in time."""
+        entry = [when, next(self._sequence), action]
+        heapq.heappush(self._wakeups, entry)
+
+        @callback
+        def _async_cancel() -> None:
+            entry[2] = None
+
+        return _async_cancel
+
+    async def async_advance_to(self, when: datetime) -> None:
+        """Move the time forward, letting each wakeup settle before the next one."""
+        while self._wakeups and self._wakeups[0][0] <= when:
+            due, _, action = heapq.heappop(self._wakeups)
+            if action is None:
+                continue
+            self._now = max(self._now, due)
+            action(self._now)
+            await self._hass.async_block_till_done()
+
+        self._now = max(self._now, when)
+
+
+def parse_time(value: str | float, start: datetime) -> datetime:
+    """Parse an ISO 8601 timestamp or a number of seconds since the start."""
+    if isinstance(value, int | float):
+        return start + timedelta(seconds=value)
+    try:
+        return start + timedelta(seconds=float(value))
+    except ValueError:
+        pass
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        raise ValueError(f"Invalid time: {value}")
+    return dt_util.as_utc(parsed)
+
+
+def read_trace(path: str, start: datetime) -> list[TraceEvent]:
+    """Read a CSV or JSONL trace, sorted by time."""
+    with open(path, encoding="utf-8") as file:
+        if path.endswith(".jsonl"):
+            rows: Iterator[dict[str, Any]] = (
+                json.loads(line) for line in file if line.strip()
+            )
+        else:
+            rows = csv.DictReader(file)
+        events = [
+            (parse_time(row["time"], start), row["entity_id"], str(row["state"]))
+            for row in rows
+        ]
+
+    # Sorting is stable, events recorded at the same time keep their order
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+def read_zone_configs(path: str) -> list[dict[str, Any]]:
+    """Read the configuration of one or more zones from a YAML or JSON file."""
+    with open(path, encoding="utf-8") as file:
+        config = yaml.safe_load(file)
+    if isinstance(config, list):
+        return [THERMOSTAT_SCHEMA(zone) for zone in config]
+    return [THERMOSTAT_SCHEMA(zone) for zone in config.get(ATTR_THERMOSTATS, [config])]
+
+
+def _source_entity_ids(zone: YetAnotherSmartThermostat) -> list[str]:
+    return [
+        entity_id
+        for entity_id in (
+            zone._heater_switch_id,
+            zone._cooler_switch_id,
+            zone._fan_switch_id,
+            *(zone._opening_entity_ids or ()),
+        )
+        if entity_id is not None
+    ]
+
+
+async def async_replay(
+    configs: list[dict[str, Any]],
+    events: list[TraceEvent],
+    reflect_switches: bool = True,
+    settle: timedelta = timedelta(0),
+) -> list[dict[str, Any]]:
+    """Replay the events through the zones and return the actuator commands."""
+    hass = StubHomeAssistant(asyncio.get_running_loop())
+    hass.services.reflect_switches = reflect_switches
+    start = events[0][0] if events else DEFAULT_START
+    clock = VirtualClock(hass, start)
+    hass.data.setdefault(DOMAIN, {})[DATA_CLOCK] = clock
+
+    commands: list[dict[str, Any]] = []
+    async_call = hass.services.async_call
+
+    async def _async_record_call(domain, service, service_data=None, **kwargs):
+        commands.append(
+            {
+                "time": clock.now().isoformat(),
+                "entity_id": (service_data or {}).get(ATTR_ENTITY_ID),
+                "service": f"{domain}.{service}",
+            }
+        )
+        await async_call(domain, service, service_data, **kwargs)
+
+    hass.services.async_call = _async_record_call
+
+    # Everything recorded at the start is the initial state of the entities
+    index = 0
+    while index < len(events) and events[index][0] == start:
+        hass.states.async_set(events[index][1], events[index][2])
+        index += 1
+
+    zones = []
+    for config in configs:
+        zone = _create_thermostat(hass, config)
+        zone.hass = hass
+        zone.entity_id = f"climate.{slugify(zone.name)}"
+        zone._async_setup_runtime()
+        for entity_id in _source_entity_ids(zone):
+            if hass.states.get(entity_id) is None:
+                hass.states.async_set(entity_id, STATE_OFF)
+        zones.append(zone)
+
+    async_get_startup_coordinator(hass).async_start(zones)
+    await hass.async_block_till_done()
+
+    for when, entity_id, state in events[index:]:
+        await clock.async_advance_to(when)
+        hass.states.async_set(entity_id, state)
+        await hass.async_block_till_done()
+
+    await clock.async_advance_to(clock.now() + settle)
+    return commands
+
+
+def main() -> None:
+    """Replay a trace."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", required=True, help="YAML file with the zones")
+    parser.add_argument("--trace", required=True, help="CSV or JSONL trace")
+    parser.add_argument("--output", help="Write the commands as JSONL to this file")
+    parser.add_argument(
+        "--start",
+        help="Start of traces with relative times (ISO 8601)",
+        default=DEFAULT_START.isoformat(),
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=0,
+        help="Seconds to keep running after the last event",
+    )
+    parser.add_argument(
+        "--no-reflect",
+        action="store_true",
+        help="Don't turn switches on or off in response to commands",
+    )
+    args = parser.parse_args()
+
+    configs = read_zone_configs(args.config)
+    events = read_trace(args.trace, parse_time(args.start, DEFAULT_START))
+
+    started = perf_counter()
+    commands = asyncio.run(
+        async_replay(
+            configs,
+            events,
+            reflect_switches=not args.no_reflect,
+            settle=timedelta(seconds=args.settle),
+        )
+    )
+    elapsed = perf_counter() - started
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for command in commands:
+            output.write(json.dumps(command) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    span = events[-1][0] - events[0][0] if events else timedelta(0)
+    print(
+        f"Replayed {len(events)} events spanning {span} in {elapsed:.2f}s, "
+        f"{len(commands)} commands",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Lightweight stand-in for HomeAssistant used by the benchmarks.
+
+Only the parts of the core the zones touch are implemented: the state machine, the
+event bus, the service registry and job scheduling. Everything runs in-process on
+the current event loop without any of the Home Assistant bootstrap.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+import os
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    CoreState,
+    Event,
+    HassJob,
+    HassJobType,
+    State,
+    DOMAIN as HA_DOMAIN,
+)
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+
+class StubStateMachine:
+    """Dictionary backed state machine that fires state changed events."""
+
+    def __init__(self, bus: StubBus) -> None:
+        """Initialize a new instance of the StubStateMachine class."""
+        self._bus = bus
+        self._states: dict[str, State] = {}
+
+    def get(self, entity_id: str) -> State | None:
+        """Return the state of an entity."""
+        return self._states.get(entity_id)
+
+    def async_all(self) -> list[State]:
+        """Return all states."""
+        return list(self._states.values())
+
+    def async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: dict[str, Any] | None = None,
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of an entity and fire a state changed event."""
+        old_state = self._states.get(entity_id)
+        attributes = attributes or {}
+        if (
+            old_state is not None
+            and old_state.state == new_state
+            and old_state.attributes == attributes
+            and not force_update
+        ):
+            return
+
+        state = State(entity_id, new_state, attributes, context=context)
+        self._states[entity_id] = state
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {ATTR_ENTITY_ID: entity_id, "old_state": old_state, "new_state": state},
+        )
+
+
+class StubBus:
+    """Event bus that calls listeners synchronously."""
+
+    def __init__(self, hass: StubHomeAssistant) -> None:
+        """Initialize a new instance of the StubBus class."""
+        self._hass = hass
+        self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        self.fired_count = 0
+
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable[[Event], Any],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of the given type."""
+        entry = (HassJob(listener), event_filter)
+        listeners = self._listeners.setdefault(event_type, [])
+        listeners.append(entry)
+
+        def _remove() -> None:
+            if entry in listeners:
+                listeners.remove(entry)
+
+        return _remove
+
+    def async_listen_once(
+        self, event_type: str, listener: Callable[[Event], Any]
+    ) -> CALLBACK_TYPE:
+        """Listen for a single event of the given type."""
+        remove: CALLBACK_TYPE | None = None
+
+        def _once(event: Event) -> Any:
+            remove()
+            return listener(event)
+
+        remove = self.async_listen(event_type, _once)
+        return remove
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any] | None = None):
+        """Fire an event to every matching listener."""
+        self.fired_count += 1
+        event = Event(event_type, event_data or {})
+        for job, event_filter in list(self._listeners.get(event_type, ())):
+            if event_filter is not None and not event_filter(event):
+                continue
+            self._hass.async_run_hass_job(job, event)
+
+
+class StubServiceRegistry:
+    """Service registry that records calls and can reflect switch commands."""
+
+    def __init__(self, hass: StubHomeAssistant) -> None:
+        """Initialize a new instance of the StubServiceRegistry class."""
+        self._hass = hass
+        self._services: dict[tuple[str, str], Callable] = {}
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+        self.reflect_switches = True
+        self.latency: float = 0
+
+    def has_service(self, domain: str, service: str) -> bool:
+        """Return whether the service is registered."""
+        return (domain, service) in self._services
+
+    def async_register(
+        self, domain: str, service: str, service_func: Callable, schema: Any = None
+    ) -> None:
+        """Register a service."""
+        self._services[(domain, service)] = service_func
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        blocking: bool = False,
+        context: Context | None = None,
+        limit: float | None = None,
+    ) -> None:
+        """Record a service call and turn switches on or off when reflecting."""
+        service_data = service_data or {}
+        self.calls.append((domain, service, service_data))
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if (domain, service) in self._services:
+            await self._services[(domain, service)](
+                SimpleNamespace(domain=domain, service=service, data=service_data)
+            )
+        elif self.reflect_switches and domain == HA_DOMAIN:
+            if service in (SERVICE_TURN_ON, SERVICE_TURN_OFF):
+                self._hass.states.async_set(
+                    service_data[ATTR_ENTITY_ID],
+                    STATE_ON if service == SERVICE_TURN_ON else STATE_OFF,
+                    context=context,
+                )
+
+
+class StubHomeAssistant:
+    """Minimal HomeAssistant replacement running on the current event loop."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+        config_dir: str | None = None,
+    ) -> None:
+        """Initialize a new instance of the StubHomeAssistant class."""
+        self.loop = loop or asyncio.get_event_loop()
+        self.data: dict[str, Any] = {}
+        self.state = CoreState.running
+        self.bus = StubBus(self)
+        self.states = StubStateMachine(self.bus)
+        self.services = StubServiceRegistry(self)
+        self.config = SimpleNamespace(
+            units=METRIC_SYSTEM,
+            config_dir=config_dir or os.getcwd(),
+            path=lambda *parts: os.path.join(config_dir or os.getcwd(), *parts),
+        )
+        self._tasks: set[asyncio.Task] = set()
+
+    def async_create_task(self, target: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Create a task that is tracked until it is done."""
+        task = self.loop.create_task(target)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_run_hass_job(self, hassjob: HassJob, *args: Any) -> asyncio.Task | None:
+        """Run a job, callbacks run immediately and coroutines become tasks."""
+        if hassjob.job_type == HassJobType.Coroutinefunction:
+            return self.async_create_task(hassjob.target(*args))
+        hassjob.target(*args)
+        return None
+
+    async def async_add_executor_job(self, target: Callable, *args: Any) -> Any:
+        """Run a job in the default executor."""
+        return await self.loop.run_in_executor(None, target, *args)
+
+    async def async_block_till_done(self) -> None:
+        """Wait until all tracked tasks are done."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
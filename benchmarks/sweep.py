@@ -0,0 +1,246 @@
+"""Sweep tolerance, cycle delay and opening delay against a temperature history.
+
+Every combination of the given values is simulated at once, one NumPy array element
+per combination, using the same decisions as the zones: heating and cooling past the
+tolerance, the fan following the fan mode, cycle locks freezing heating and cooling
+and opening locks holding the previous opening state.
+
+The history is a CSV file with `time,temperature` columns and an optional `opening`
+column (1 when open). It is treated as the drift of the room, the simulated heating
+and cooling is added on top of it:
+
+    python -m benchmarks.sweep --history year.csv --tolerance 0.3 0.5 1 --cycle-delay 0 300
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+from datetime import datetime
+import sys
+from time import perf_counter
+
+from homeassistant.components.climate import HVACMode
+import numpy as np
+
+from custom_components.yas_thermostat.climate import YetAnotherSmartThermostat
+from custom_components.yas_thermostat.const import FanMode
+
+from .replay import DEFAULT_START, parse_time
+
+RESULT_FIELDS = (
+    "tolerance",
+    "cycle_delay",
+    "opening_delay",
+    "cycles_per_hour",
+    "heater_hours",
+    "cooler_hours",
+    "fan_hours",
+    "violation_hours",
+    "violation_degree_hours",
+)
+
+
+class History:
+    """A temperature history resampled to a fixed step."""
+
+    def __init__(
+        self, times: list[datetime], temperatures: list[float], openings: list[bool]
+    ) -> None:
+        """Initialize a new instance of the History class."""
+        seconds = np.array([(time - times[0]).total_seconds() for time in times])
+        self.times = seconds
+        self.temperatures = np.array(temperatures, dtype=np.float64)
+        self.openings = np.array(openings, dtype=bool)
+
+    def resample(self, step: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return the temperature and opening state at every step."""
+        grid = np.arange(0, self.times[-1] + step, step)
+        temperatures = np.interp(grid, self.times, self.temperatures)
+        # Openings hold their last recorded state until the next record
+        indices = np.searchsorted(self.times, grid, side="right") - 1
+        return temperatures, self.openings[np.clip(indices, 0, None)]
+
+
+def read_history(path: str, start: datetime) -> History:
+    """Read a temperature history from a CSV file."""
+    times, temperatures, openings = [], [], []
+    with open(path, encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            times.append(parse_time(row["time"], start))
+            temperatures.append(float(row["temperature"]))
+            openings.append(row.get("opening", "0").strip() in ("1", "on", "open"))
+
+    order = sorted(range(len(times)), key=times.__getitem__)
+    return History(
+        [times[i] for i in order],
+        [temperatures[i] for i in order],
+        [openings[i] for i in order],
+    )
+
+
+def simulate(
+    temperatures: np.ndarray,
+    openings: np.ndarray,
+    step: float,
+    tolerance: np.ndarray,
+    cycle_delay: np.ndarray,
+    opening_delay: np.ndarray,
+    temp_low: float,
+    temp_high: float,
+    hvac_mode: HVACMode = HVACMode.HEAT_COOL,
+    fan_mode: FanMode = FanMode.AUTO,
+    heat_rate: float = 2.0,
+    cool_rate: float = 2.0,
+) -> dict[str, np.ndarray]:
+    """Simulate every combination over the history and return the totals.
+
+    Heat and cool rates are in degrees per hour while the equipment runs.
+    """
+    count = tolerance.shape[0]
+    step_hours = step / 3600
+    can_heat = hvac_mode in YetAnotherSmartThermostat._valid_heat_hvac_modes
+    can_cool = hvac_mode in YetAnotherSmartThermostat._valid_cool_hvac_modes
+    fan_always = hvac_mode == HVACMode.FAN_ONLY or fan_mode == FanMode.ON
+    fan_auto = fan_mode == FanMode.AUTO
+    drift = np.diff(temperatures, prepend=temperatures[0])
+
+    temp = np.full(count, temperatures[0])
+    heater = np.zeros(count, dtype=bool)
+    cooler = np.zeros(count, dtype=bool)
+    cycle_until = np.full(count, -np.inf)
+    opening_until = np.full(count, -np.inf)
+    opening_value = np.zeros(count, dtype=bool)
+
+    cycles = np.zeros(count, dtype=np.int64)
+    heater_steps = np.zeros(count, dtype=np.int64)
+    cooler_steps = np.zeros(count, dtype=np.int64)
+    fan_steps = np.zeros(count, dtype=np.int64)
+    violation_steps = np.zeros(count, dtype=np.int64)
+    violation_degrees = np.zeros(count)
+
+    was_open = bool(openings[0])
+    for index in range(temperatures.shape[0]):
+        now = index * step
+        temp += drift[index]
+
+        # A change of the openings is held back until the opening delay passed
+        is_open = bool(openings[index])
+        if is_open != was_open:
+            unlocked = now >= opening_until
+            opening_value = np.where(unlocked, was_open, opening_value)
+            opening_until = np.where(unlocked, now + opening_delay, opening_until)
+            was_open = is_open
+        any_open = np.where(now < opening_until, opening_value, is_open)
+
+        cooling_needed = (temp - temp_high > tolerance) & ~any_open & can_cool
+        heating_needed = (temp_low - temp > tolerance) & ~any_open & can_heat
+
+        # Heating and cooling are frozen in their current state while locked
+        locked = now < cycle_until
+        cooling = np.where(locked, cooler, cooling_needed)
+        heating = np.where(locked, heater, heating_needed)
+        fan = fan_always | (fan_auto & (cooling | heating))
+
+        changed = (cooling != cooler) | (heating != heater)
+        cycle_until = np.where(changed, now + cycle_delay, cycle_until)
+        cycles += cooling & ~cooler
+        cycles += heating & ~heater
+        heater, cooler = heating, cooling
+
+        heater_steps += heater
+        cooler_steps += cooler
+        fan_steps += fan
+        temp += step_hours * (heat_rate * heater - cool_rate * cooler)
+
+        outside = np.maximum(temp_low - temp, 0) + np.maximum(temp - temp_high, 0)
+        violation_steps += outside > 0
+        violation_degrees += outside
+
+    hours = temperatures.shape[0] * step_hours
+    return {
+        "cycles_per_hour": cycles / hours,
+        "heater_hours": heater_steps * step_hours,
+        "cooler_hours": cooler_steps * step_hours,
+        "fan_hours": fan_steps * step_hours,
+        "violation_hours": violation_steps * step_hours,
+        "violation_degree_hours": violation_degrees * step_hours,
+    }
+
+
+def main() -> None:
+    """Run a parameter sweep."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", required=True, help="CSV temperature history")
+    parser.add_argument("--output", help="Write the results as CSV to this file")
+    parser.add_argument("--start", default=DEFAULT_START.isoformat())
+    parser.add_argument("--step", type=float, default=60, help="Seconds per step")
+    parser.add_argument("--temp-low", type=float, default=20)
+    parser.add_argument("--temp-high", type=float, default=24)
+    parser.add_argument(
+        "--hvac-mode", type=HVACMode, default=HVACMode.HEAT_COOL, choices=HVACMode
+    )
+    parser.add_argument(
+        "--fan-mode", type=FanMode, default=FanMode.AUTO, choices=FanMode
+    )
+    parser.add_argument("--heat-rate", type=float, default=2.0)
+    parser.add_argument("--cool-rate", type=float, default=2.0)
+    parser.add_argument("--tolerance", type=float, nargs="+", default=[0.3])
+    parser.add_argument(
+        "--cycle-delay", type=float, nargs="+", default=[0], help="Seconds"
+    )
+    parser.add_argument(
+        "--opening-delay", type=float, nargs="+", default=[0], help="Seconds"
+    )
+    args = parser.parse_args()
+
+    history = read_history(args.history, parse_time(args.start, DEFAULT_START))
+    temperatures, openings = history.resample(args.step)
+    tolerance, cycle_delay, opening_delay = (
+        grid.ravel()
+        for grid in np.meshgrid(
+            args.tolerance, args.cycle_delay, args.opening_delay, indexing="ij"
+        )
+    )
+
+    started = perf_counter()
+    results = simulate(
+        temperatures,
+        openings,
+        args.step,
+        tolerance,
+        cycle_delay,
+        opening_delay,
+        args.temp_low,
+        args.temp_high,
+        args.hvac_mode,
+        args.fan_mode,
+        args.heat_rate,
+        args.cool_rate,
+    )
+    elapsed = perf_counter() - started
+
+    columns = {
+        "tolerance": tolerance,
+        "cycle_delay": cycle_delay,
+        "opening_delay": opening_delay,
+        **results,
+    }
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        writer = csv.writer(output)
+        writer.writerow(RESULT_FIELDS)
+        for row in zip(*(columns[field] for field in RESULT_FIELDS)):
+            writer.writerow(f"{value:g}" for value in row)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(
+        f"Simulated {tolerance.shape[0]} combinations over {temperatures.shape[0]} "
+        f"steps in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
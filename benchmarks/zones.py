@@ -0,0 +1,76 @@
+"""Zone fixtures shared by the benchmarks."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import ATTR_NAME, STATE_OFF
+
+from custom_components.yas_thermostat.climate import (
+    THERMOSTAT_SCHEMA,
+    YetAnotherSmartThermostat,
+    _create_thermostat,
+)
+from custom_components.yas_thermostat.startup import async_get_startup_coordinator
+
+from .stub import StubHomeAssistant
+
+# Zones in the same block share their openings, like an open plan floor
+OPENINGS_PER_BLOCK = 4
+ZONES_PER_BLOCK = 10
+
+
+def zone_config(index: int, **overrides: Any) -> dict[str, Any]:
+    """Return a validated configuration for a zone with every feature enabled."""
+    block = index // ZONES_PER_BLOCK
+    return THERMOSTAT_SCHEMA(
+        {
+            ATTR_NAME: f"Zone {index}",
+            "temp_sensor": f"sensor.zone_{index}_temperature",
+            "heater_switch": f"switch.zone_{index}_heater",
+            "cooler_switch": f"switch.zone_{index}_cooler",
+            "fan_switch": f"switch.zone_{index}_fan",
+            "openings": [
+                f"binary_sensor.block_{block}_opening_{opening}"
+                for opening in range(OPENINGS_PER_BLOCK)
+            ],
+            "preset_modes": [
+                {
+                    ATTR_NAME: "Home",
+                    "target_temp_low": 20,
+                    "target_temp_high": 24,
+                    "hvac_mode": "heat_cool",
+                    "fan_mode": "auto",
+                },
+                {ATTR_NAME: "Away", "target_temp_low": 16, "target_temp_high": 28},
+            ],
+            **overrides,
+        }
+    )
+
+
+def create_zone(
+    hass: StubHomeAssistant, index: int, config: dict[str, Any] | None = None
+) -> YetAnotherSmartThermostat:
+    """Create a zone and wire it up as if it had been added to Home Assistant."""
+    zone = _create_thermostat(hass, config or zone_config(index))
+    zone.hass = hass
+    zone.entity_id = f"climate.zone_{index}"
+    zone._async_setup_runtime()
+    return zone
+
+
+def start_zone(
+    hass: StubHomeAssistant, zone: YetAnotherSmartThermostat, temperature: float
+) -> None:
+    """Seed the source entities of a zone and run its startup."""
+    hass.states.async_set(zone._temp_sensor_ids[0], str(temperature))
+    for entity_id in (
+        zone._heater_switch_id,
+        zone._cooler_switch_id,
+        zone._fan_switch_id,
+        *(zone._opening_entity_ids or ()),
+    ):
+        if entity_id is not None and hass.states.get(entity_id) is None:
+            hass.states.async_set(entity_id, STATE_OFF)
+
+    async_get_startup_coordinator(hass).async_start([zone])
@@ -0,0 +1,278 @@
+"""Switch actuators driven by YAS Thermostat zones."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from time import perf_counter
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    HomeAssistant,
+    State,
+    callback,
+    DOMAIN as HA_DOMAIN,
+)
+from .clock import async_get_clock
+from .const import ActuatorMode
+from .metrics import ActuatorMetrics
+from .reconcile import async_get_reconciler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SwitchActuator:
+    """A switch entity that is turned on and off by a zone.
+
+    `is_active` only ever reflects a state the switch reported through a state
+    change event, while `pending` holds the state of the command that is in flight.
+    Only one command is in flight at a time. Commands requested meanwhile wait in
+    `queued`, where the latest one replaces any that wasn't sent yet, and the queued
+    command is sent once the switch confirmed the one in flight or it timed out.
+    Whenever nothing is in flight, the reconciler compares the reported state with
+    `intended`, the state last commanded by the zone.
+    """
+
+    is_shared = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        timeout: timedelta,
+        mode: ActuatorMode,
+        metrics: ActuatorMetrics | None = None,
+    ) -> None:
+        """Initialize a new instance of the SwitchActuator class."""
+        self._hass = hass
+        self._clock = async_get_clock(hass)
+        self._reconciler = async_get_reconciler(hass)
+        self._timeout = timeout
+        self._mode = mode
+        self._cancel_confirm: CALLBACK_TYPE | None = None
+        self._metrics = metrics
+        self._sent_at: float | None = None
+        self._queued_context: Context | None = None
+        self.entity_id = entity_id
+        self.is_active: bool = False
+        self.pending: bool | None = None
+        self.queued: bool | None = None
+        self.intended: bool | None = None
+
+    @property
+    def target(self) -> bool:
+        """Return the state the switch is expected to end up in."""
+        if self.queued is not None:
+            return self.queued
+        return self.pending if self.pending is not None else self.is_active
+
+    @callback
+    def async_needs(self, active: bool) -> bool:
+        """Return whether a command is needed to reach the given state."""
+        return self.target != active
+
+    @callback
+    def async_handle_state(self, state: State | None) -> bool:
+        """Update from a state reported by the switch, returns whether it changed."""
+        is_active = state.state == STATE_ON if state is not None else False
+        changed = is_active != self.is_active
+        self.is_active = is_active
+
+        if self.pending is not None and self.pending == is_active:
+            if self._metrics is not None and self._sent_at is not None:
+                self._metrics.response.record(perf_counter() - self._sent_at)
+            self._async_clear_pending()
+            self._async_send_queued()
+
+        self._async_settled()
+        return changed
+
+    async def async_turn(self, active: bool, context: Context | None) -> bool:
+        """Command the switch if it isn't already in, or going to, the state.
+
+        While a command is in flight the new one is queued instead, replacing a
+        queued command that wasn't sent yet. Returns whether a command was sent and
+        accepted, or queued.
+        """
+        if active != self.intended:
+            self._reconciler.async_forget(self)
+            self.intended = active
+
+        if self.async_needs(active) is False:
+            return False
+
+        if self.pending is not None:
+            if self.queued is not None and self._metrics is not None:
+                self._metrics.collapsed += 1
+            # Going back to the state in flight only drops the queued command
+            self.queued = active if active != self.pending else None
+            self._queued_context = context
+            return True
+
+        self.pending = active
+        return await self._async_send(active, context)
+
+    async def async_reconcile(self) -> None:
+        """Command the intended state again."""
+        if self.intended is not None:
+            await self.async_turn(self.intended, None)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the queued command and cancel any pending confirmation."""
+        self.queued = None
+        self._queued_context = None
+        self._async_clear_pending()
+        self._reconciler.async_forget(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the intended, reported and in flight state of the switch."""
+        return {
+            "intended": self.intended,
+            "is_active": self.is_active,
+            "pending": self.pending,
+            "queued": self.queued,
+            "retries": self._reconciler.attempts(self),
+        }
+
+    async def _async_send(self, active: bool, context: Context | None) -> bool:
+        """Send the command that was just made pending."""
+        service = SERVICE_TURN_ON if active else SERVICE_TURN_OFF
+        service_data = {ATTR_ENTITY_ID: self.entity_id}
+        if self._metrics is not None:
+            self._metrics.commands += 1
+            self._sent_at = perf_counter()
+
+        if self._mode == ActuatorMode.CONFIRM:
+            # Fire and forget, the state change event confirms the command
+            try:
+                await self._hass.services.async_call(
+                    HA_DOMAIN, service, service_data, blocking=False, context=context
+                )
+            except asyncio.CancelledError:
+                self._async_call_failed(active)
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Turning %s %s failed: %s", self.entity_id, service, err)
+                self._async_call_failed(active)
+                return False
+            self._async_call_succeeded(active)
+            return True
+
+        task = self._hass.async_create_task(
+            self._hass.services.async_call(
+                HA_DOMAIN,
+                service,
+                service_data,
+                blocking=True,
+                context=context,
+                limit=None,
+            )
+        )
+
+        try:
+            await asyncio.wait_for(asyncio.shield(task), self._timeout.total_seconds())
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Turning %s %s did not complete within %s",
+                self.entity_id,
+                service,
+                self._timeout,
+            )
+            if self._metrics is not None:
+                self._metrics.timeouts += 1
+            # Let the call finish in the background, it settles the pending state
+            task.add_done_callback(lambda t: self._async_call_finished(t, active))
+            return False
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Turning %s %s failed: %s", self.entity_id, service, err)
+            self._async_call_failed(active)
+            return False
+
+        self._async_call_succeeded(active)
+        return True
+
+    @callback
+    def _async_send_queued(self) -> None:
+        """Send the queued command now that nothing is in flight."""
+        if (active := self.queued) is None:
+            return
+        context, self.queued, self._queued_context = self._queued_context, None, None
+
+        if active == self.is_active:
+            # The switch already ended up where the queued command would take it
+            if self._metrics is not None:
+                self._metrics.collapsed += 1
+            return
+
+        self.pending = active
+        self._hass.async_create_task(self._async_send(active, context))
+
+    @callback
+    def _async_call_finished(self, task: asyncio.Task, active: bool) -> None:
+        """Settle a call that completed after its timeout."""
+        if task.cancelled() or task.exception() is not None:
+            self._async_call_failed(active)
+            return
+
+        self._async_call_succeeded(active)
+
+    @callback
+    def _async_call_succeeded(self, active: bool) -> None:
+        """Wait for the state change event unless it already confirmed the command."""
+        if self.pending == active and self._cancel_confirm is None:
+            self._cancel_confirm = self._clock.async_call_later(
+                self._timeout, self._async_confirm_expired
+            )
+
+    @callback
+    def _async_call_failed(self, active: bool) -> None:
+        """Give up on a command whose call failed, unless it was settled meanwhile."""
+        if self._metrics is not None:
+            self._metrics.failures += 1
+        if self.pending != active:
+            # Already confirmed by the switch, or replaced by a later command
+            return
+        self._async_clear_pending()
+        self._async_send_queued()
+        self._async_settled()
+
+    @callback
+    def _async_confirm_expired(self, _: datetime) -> None:
+        """Give up on a command the switch never confirmed."""
+        self._cancel_confirm = None
+        if self.pending is not None:
+            if self._metrics is not None:
+                self._metrics.timeouts += 1
+            _LOGGER.warning(
+                "%s did not confirm the %s command within %s",
+                self.entity_id,
+                STATE_ON if self.pending else STATE_OFF,
+                self._timeout,
+            )
+            self._async_clear_pending()
+            self._async_send_queued()
+            self._async_settled()
+
+    @callback
+    def _async_settled(self) -> None:
+        """Let the reconciler check the switch once nothing is in flight."""
+        if self.pending is None and self.queued is None:
+            self._reconciler.async_check(self)
+
+    @callback
+    def _async_clear_pending(self) -> None:
+        self.pending = None
+        self._sent_at = None
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+            self._cancel_confirm = None
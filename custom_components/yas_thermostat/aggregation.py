@@ -0,0 +1,140 @@
+"""Streaming aggregation of the temperature sensors of a YAS Thermostat zone."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Any
+
+from .const import TempAggregation
+
+_value = itemgetter(0)
+
+
+class TemperatureAggregator:
+    """Combines the latest reading of every sensor of a zone into one temperature.
+
+    Readings are kept in a sorted list next to running sums, so a new reading only
+    replaces the previous one of its sensor. The mean and weighted mean come from the
+    sums, the median, minimum and maximum from the sorted list. When an outlier
+    threshold is set, readings further than it from the middle reading are left out,
+    which only costs a walk over the outliers themselves.
+    """
+
+    __slots__ = (
+        "_mode",
+        "_weights",
+        "_outlier_threshold",
+        "_readings",
+        "_sorted",
+        "_sum",
+        "_weighted_sum",
+        "_total_weight",
+    )
+
+    def __init__(
+        self,
+        weights: dict[str, float],
+        mode: TempAggregation,
+        outlier_threshold: float | None = None,
+    ) -> None:
+        """Initialize a new instance of the TemperatureAggregator class."""
+        self._mode = mode
+        self._weights = weights
+        self._outlier_threshold = outlier_threshold
+        self._readings: dict[str, float] = {}
+        self._sorted: list[tuple[float, str]] = []
+        self._sum = 0.0
+        self._weighted_sum = 0.0
+        self._total_weight = 0.0
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the IDs of the sensors."""
+        return list(self._weights)
+
+    def has_reading(self, entity_id: str) -> bool:
+        """Return whether there is a reading for the sensor."""
+        return entity_id in self._readings
+
+    def update(self, entity_id: str, value: float | None) -> float | None:
+        """Replace the reading of a sensor, None drops it, and return the aggregate."""
+        weight = self._weights.get(entity_id, 1.0)
+
+        if (previous := self._readings.pop(entity_id, None)) is not None:
+            del self._sorted[bisect_left(self._sorted, (previous, entity_id))]
+            self._sum -= previous
+            self._weighted_sum -= weight * previous
+            self._total_weight -= weight
+
+        if value is not None:
+            self._readings[entity_id] = value
+            insort(self._sorted, (value, entity_id))
+            self._sum += value
+            self._weighted_sum += weight * value
+            self._total_weight += weight
+
+        return self.value
+
+    @property
+    def value(self) -> float | None:
+        """Return the aggregated temperature, None when there are no readings."""
+        readings = self._sorted
+        if not readings:
+            return None
+
+        low, high = self._bounds()
+        mode = self._mode
+
+        if mode == TempAggregation.MIN:
+            return readings[low][0]
+        if mode == TempAggregation.MAX:
+            return readings[high - 1][0]
+        if mode == TempAggregation.MEDIAN:
+            return _median(readings, low, high)
+
+        # Outliers are taken back out of the running sums
+        outliers = readings[:low] + readings[high:]
+        if mode == TempAggregation.WEIGHTED:
+            weights = self._weights
+            weighted_sum = self._weighted_sum - sum(
+                weights.get(entity_id, 1.0) * value for value, entity_id in outliers
+            )
+            total_weight = self._total_weight - sum(
+                weights.get(entity_id, 1.0) for _, entity_id in outliers
+            )
+            if total_weight > 0:
+                return weighted_sum / total_weight
+
+        return (self._sum - sum(value for value, _ in outliers)) / (high - low)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the readings and which of them are left out as outliers."""
+        low, high = self._bounds()
+        return {
+            "mode": self._mode,
+            "value": self.value,
+            "readings": dict(self._readings),
+            "outliers": [
+                entity_id for _, entity_id in self._sorted[:low] + self._sorted[high:]
+            ],
+        }
+
+    def _bounds(self) -> tuple[int, int]:
+        """Return the slice of the sorted readings that aren't outliers."""
+        readings = self._sorted
+        count = len(readings)
+        if self._outlier_threshold is None or count < 3:
+            return 0, count
+
+        # The middle reading rather than the median, so the range is never empty
+        center = readings[(count - 1) // 2][0]
+        low = bisect_left(readings, center - self._outlier_threshold, key=_value)
+        high = bisect_right(readings, center + self._outlier_threshold, key=_value)
+        return low, high
+
+
+def _median(readings: list[tuple[float, str]], low: int, high: int) -> float:
+    middle = (low + high) // 2
+    if (high - low) % 2:
+        return readings[middle][0]
+    return (readings[middle - 1][0] + readings[middle][0]) / 2
@@ -0,0 +1,254 @@
+"""Power budget shared by the heaters and coolers of YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import heapq
+import itertools
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .clock import async_get_clock
+from .const import BudgetStrategy
+from .timer import TimerHandle, async_get_timer_heap
+
+_LOGGER = logging.getLogger(__name__)
+
+# A heater or cooler of a zone, like ("climate.living_room", "heater")
+BudgetKey = tuple[str, str]
+
+# Rebuild the queue once skipped entries make up more than this share of it
+COMPACT_RATIO = 0.5
+COMPACT_MIN_SIZE = 64
+
+
+class _Request:
+    """Demand of a heater or cooler, waiting for or holding a grant."""
+
+    __slots__ = ("power", "score", "on_change", "granted_at", "revoked")
+
+    def __init__(
+        self, power: float, score: float, on_change: Callable[[], Any]
+    ) -> None:
+        """Initialize a new instance of the _Request class."""
+        self.power = power
+        # Lower is served first
+        self.score = score
+        self.on_change = on_change
+        self.granted_at: datetime | None = None
+        self.revoked = False
+
+
+class PowerBudget:
+    """Limits how many heaters and coolers run at once, or their total power.
+
+    Running actuators hold a grant, the rest wait in a heap ordered by priority or
+    by how far their zone is from its target, first come first served otherwise.
+    The count and power of the grants are kept as running totals, so requests and
+    releases only touch their own entry and waiting ones are only looked at when
+    capacity frees up. For fairness, once a grant was held for the rotation interval
+    while others wait, it is revoked and the zone queues up again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_active: int | None,
+        max_power: float | None,
+        strategy: BudgetStrategy,
+        rotation_interval: timedelta,
+    ) -> None:
+        """Initialize a new instance of the PowerBudget class."""
+        self._clock = async_get_clock(hass)
+        self._timers = async_get_timer_heap(hass)
+        self._max_active = max_active
+        self._max_power = max_power
+        self._strategy = strategy
+        self._rotation_interval = rotation_interval
+        # Grants in the order they were given, the oldest is rotated out first
+        self._grants: dict[BudgetKey, _Request] = {}
+        self._waiting: dict[BudgetKey, tuple[tuple[float, int], _Request]] = {}
+        self._queue: list[tuple[tuple[float, int], BudgetKey]] = []
+        self._sequence = itertools.count()
+        self._active_power = 0.0
+        self._rotation_timer: TimerHandle | None = None
+        self.rotations = 0
+
+    @callback
+    def async_request(
+        self,
+        key: BudgetKey,
+        power: float,
+        priority: int,
+        deficit: float,
+        on_change: Callable[[], Any],
+    ) -> bool:
+        """Ask to run an actuator, returns whether it may run now.
+
+        A waiting actuator is told through on_change once it is granted, and a
+        running one once its grant is revoked.
+        """
+        if (grant := self._grants.get(key)) is not None:
+            if not grant.revoked:
+                return True
+            # Rotated out, the actuator queues up again behind its equals
+            del self._grants[key]
+            self._active_power -= grant.power
+
+        score = self._score(priority, deficit)
+        if (waiting := self._waiting.get(key)) is not None and waiting[0][0] == score:
+            return False
+
+        # Joining or moving in the queue, the previous entry is skipped lazily
+        order = (score, next(self._sequence))
+        self._waiting[key] = (order, _Request(power, score, on_change))
+        heapq.heappush(self._queue, (order, key))
+        if (
+            len(self._queue) > COMPACT_MIN_SIZE
+            and len(self._queue) - len(self._waiting) > len(self._queue) * COMPACT_RATIO
+        ):
+            self._queue = [(order, key) for key, (order, _) in self._waiting.items()]
+            heapq.heapify(self._queue)
+
+        self._async_grant_waiting(notify=key)
+        return key in self._grants
+
+    @callback
+    def async_hold(
+        self,
+        key: BudgetKey,
+        power: float,
+        priority: int,
+        deficit: float,
+        on_change: Callable[[], Any],
+    ) -> None:
+        """Count an actuator that keeps running regardless, like during a cycle lock.
+
+        The actuator gets a grant even when it doesn't fit, a grant that was revoked
+        stays revoked until the actuator requests it again.
+        """
+        if key in self._grants:
+            return
+
+        self._waiting.pop(key, None)
+        request = _Request(power, self._score(priority, deficit), on_change)
+        request.granted_at = self._clock.now()
+        self._grants[key] = request
+        self._active_power += power
+        self._async_arm_rotation()
+
+    @callback
+    def async_release(self, key: BudgetKey) -> None:
+        """Give up the grant or the place in the queue of an actuator."""
+        if self._waiting.pop(key, None) is not None:
+            return
+        if (grant := self._grants.pop(key, None)) is None:
+            return
+
+        self._active_power -= grant.power
+        self._async_grant_waiting()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the usage of the budget."""
+        return {
+            "active": len(self._grants),
+            "max_active": self._max_active,
+            "power": self._active_power,
+            "max_power": self._max_power,
+            "waiting": len(self._waiting),
+            "rotations": self.rotations,
+        }
+
+    def _score(self, priority: int, deficit: float) -> float:
+        return -priority if self._strategy == BudgetStrategy.PRIORITY else -deficit
+
+    def _fits(self, request: _Request) -> bool:
+        if self._max_active is not None and len(self._grants) >= self._max_active:
+            return False
+        return (
+            self._max_power is None
+            or self._active_power + request.power <= self._max_power
+            # A single actuator above the limit may still run on its own
+            or not self._grants
+        )
+
+    @callback
+    def _async_grant_waiting(self, notify: BudgetKey | None = None) -> None:
+        """Grant the waiting actuators in order for as long as they fit."""
+        queue = self._queue
+        while queue:
+            order, key = queue[0]
+            waiting = self._waiting.get(key)
+            if waiting is None or waiting[0] != order:
+                heapq.heappop(queue)
+                continue
+            request = waiting[1]
+            if not self._fits(request):
+                break
+
+            heapq.heappop(queue)
+            del self._waiting[key]
+            request.granted_at = self._clock.now()
+            self._grants[key] = request
+            self._active_power += request.power
+            if key != notify:
+                request.on_change()
+
+        self._async_arm_rotation()
+
+    @callback
+    def _async_arm_rotation(self) -> None:
+        if self._rotation_timer is not None:
+            self._rotation_timer.cancel()
+            self._rotation_timer = None
+
+        if (rotation := self._next_rotation()) is not None:
+            self._rotation_timer = self._timers.async_schedule(
+                rotation[1].granted_at + self._rotation_interval,
+                self._async_on_rotation,
+            )
+
+    @callback
+    def _async_on_rotation(self, now: datetime) -> None:
+        self._rotation_timer = None
+        rotation = self._next_rotation()
+        if (
+            rotation is not None
+            and rotation[1].granted_at + self._rotation_interval <= now
+        ):
+            key, grant = rotation
+            _LOGGER.debug("Rotating %s out of the power budget", key)
+            self.rotations += 1
+            # The capacity frees up once the zone evaluates and gives up the grant
+            grant.revoked = True
+            grant.on_change()
+        self._async_arm_rotation()
+
+    def _next_rotation(self) -> tuple[BudgetKey, _Request] | None:
+        """Return the oldest grant that makes way for the best waiting actuator."""
+        if (best := self._best_waiting()) is None:
+            return None
+        if any(grant.revoked for grant in self._grants.values()):
+            # One rotation at a time, the next once the revoked grant is given up
+            return None
+        # Grants are kept in the order they were given
+        return next(
+            (
+                (key, grant)
+                for key, grant in self._grants.items()
+                # Demand that came first in line keeps running until it ends
+                if grant.score >= best.score
+            ),
+            None,
+        )
+
+    def _best_waiting(self) -> _Request | None:
+        queue = self._queue
+        while queue:
+            order, key = queue[0]
+            if (waiting := self._waiting.get(key)) is not None and waiting[0] == order:
+                return waiting[1]
+            heapq.heappop(queue)
+        return None
@@ -1,35 +1,34 @@
 """The YAS Thermostat integration."""
 from __future__ import annotations
 import asyncio
+from functools import partial
 import logging
+from time import perf_counter
 import voluptuous as vol
 
-from datetime import datetime, timedelta, timezone
+from collections.abc import Coroutine, Mapping
+from datetime import datetime, timedelta
+from typing import Any
 from homeassistant.core import (
+    CALLBACK_TYPE,
     HomeAssistant,
     Event,
     State,
-    CoreState,
     callback,
-    DOMAIN as HA_DOMAIN,
 )
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, discovery
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 from homeassistant.components.climate import PLATFORM_SCHEMA
 from homeassistant.const import (
-    ATTR_NAME,
     ATTR_ENTITY_ID,
+    ATTR_NAME,
     ATTR_TEMPERATURE,
-    SERVICE_TURN_OFF,
-    SERVICE_TURN_ON,
-    STATE_ON,
-    STATE_OPEN,
-    EVENT_HOMEASSISTANT_START,
+    Platform,
     UnitOfTemperature,
 )
 
@@ -49,7 +48,17 @@ from .const import (
     ATTR_HEATER_SWITCH,
     ATTR_COOLER_SWITCH,
     ATTR_FAN_SWITCH,
+    ATTR_DAMPER_SWITCH,
     ATTR_TEMP_SENSOR,
+    ATTR_TEMP_AGGREGATION,
+    ATTR_TEMP_OUTLIER_THRESHOLD,
+    ATTR_WEIGHT,
+    ATTR_TEMP_DEADBAND,
+    ATTR_TEMP_SMOOTHING,
+    ATTR_TEMP_EVALUATION_INTERVAL,
+    ATTR_STALE_TIMEOUT,
+    ATTR_STALE_BEHAVIOR,
+    ATTR_FALLBACK_TEMP_SENSOR,
     ATTR_DEFAULT_PRESET,
     ATTR_TEMP_TOLERANCE,
     ATTR_TEMP_STEP,
@@ -62,8 +71,58 @@ from .const import (
     ATTR_MANUAL_HVAC_MODE,
     ATTR_MANUAL_TEMP_LOW,
     ATTR_MANUAL_TEMP_HIGH,
+    ATTR_THERMOSTATS,
+    ATTR_ACTUATOR_TIMEOUT,
+    ATTR_ACTUATOR_MODE,
+    ATTR_TEMP_WRITE_INTERVAL,
+    ATTR_METRICS,
+    ATTR_RUNTIME_STATS,
+    ATTR_HEATER_STATS,
+    ATTR_COOLER_STATS,
+    ATTR_TRACE_SIZE,
+    ATTR_SCHEDULE,
+    ATTR_DAYS,
+    ATTR_AT,
+    ATTR_PRIORITY,
+    ATTR_HEATER_POWER,
+    ATTR_COOLER_POWER,
+    ATTR_POWER_BUDGET,
+    ATTR_MAX_ACTIVE,
+    ATTR_MAX_POWER,
+    ATTR_BUDGET_STRATEGY,
+    ATTR_ROTATION_INTERVAL,
+    DISCOVERY_ZONES,
+    DOMAIN,
+    ActuatorMode,
+    BudgetStrategy,
     FanMode,
+    ReadingStatus,
+    StaleBehavior,
+    TempAggregation,
 )
+from .actuator import SwitchActuator
+from .aggregation import TemperatureAggregator
+from .budget import PowerBudget
+from .clock import Clock, async_get_clock
+from .dispatcher import async_get_dispatcher
+from .equipment import EquipmentDemand, async_get_equipment_manager
+from .ingestion import SensorFilter, parse_temperature
+from .metrics import ZoneMetrics
+from .openings import OpeningGroup, async_get_opening_index
+from .profiler import ZoneProfile
+from .schedule import (
+    ScheduledTransition,
+    async_get_schedule_engine,
+    compile_schedule,
+    latest_transition,
+)
+from .scheduler import UpdateScheduler
+from .services import async_get_zones, async_setup_services
+from .startup import async_get_startup_coordinator
+from .stats import RuntimeStats
+from .store import RuntimeStore, ZoneData, async_get_runtime_store
+from .timer import TimerHandle, TimerHeap, async_get_timer_heap
+from .trace import DecisionRecord, DecisionTrace
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TEMP_MIN = 7
@@ -73,6 +132,16 @@ DEFAULT_OPENING_DELAY = timedelta(seconds=30)
 DEFAULT_TEMP_TOLERANCE = 0.75
 DEFAULT_FAN_MODE = FanMode.OFF
 DEFAULT_HVAC_MODE = HVACMode.OFF
+DEFAULT_ACTUATOR_TIMEOUT = timedelta(seconds=10)
+DEFAULT_ACTUATOR_MODE = ActuatorMode.WAIT
+DEFAULT_TRACE_SIZE = 20
+DEFAULT_TEMP_AGGREGATION = TempAggregation.MEAN
+DEFAULT_STALE_BEHAVIOR = StaleBehavior.HOLD
+DEFAULT_BUDGET_STRATEGY = BudgetStrategy.PRIORITY
+DEFAULT_ROTATION_INTERVAL = timedelta(minutes=30)
+
+# State attributes holding the runtime statistics of the heater and cooler
+_STATS_ATTRIBUTES = {"heater": ATTR_HEATER_STATS, "cooler": ATTR_COOLER_STATS}
 
 PRESET_SCHEMA = vol.Schema(
     {
@@ -92,44 +161,168 @@ PRESET_SCHEMA = vol.Schema(
     }
 )
 
-PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
-    {
-        vol.Required(ATTR_NAME): cv.string,
-        vol.Required(ATTR_TEMP_SENSOR): cv.entity_id,
-        vol.Required(ATTR_PRESET_MODES): vol.All(cv.ensure_list, [PRESET_SCHEMA]),
-        # Optional Values
-        vol.Optional(ATTR_COOLER_SWITCH): cv.entity_id,
-        vol.Optional(ATTR_HEATER_SWITCH): cv.entity_id,
-        vol.Optional(ATTR_FAN_SWITCH): cv.entity_id,
-        vol.Optional(ATTR_OPENING_ENTITIES): cv.entity_ids,
-        vol.Optional(ATTR_MIN_TEMP): vol.Coerce(float),
-        vol.Optional(ATTR_MAX_TEMP): vol.Coerce(float),
-        vol.Optional(ATTR_TEMP_STEP): vol.Coerce(float),
-        vol.Optional(ATTR_OPENING_DELAY): vol.All(
-            cv.time_period, cv.positive_timedelta
-        ),
-        vol.Optional(ATTR_CYCLE_DELAY): vol.All(cv.time_period, cv.positive_timedelta),
-        vol.Optional(ATTR_TEMP_TOLERANCE): vol.Coerce(float),
-        vol.Optional(ATTR_DEFAULT_PRESET): cv.string,
-        vol.Optional(ATTR_DEFAULT_HVAC_MODE): vol.In(
-            [
-                HVACMode.COOL,
-                HVACMode.HEAT,
-                HVACMode.OFF,
-                HVACMode.HEAT_COOL,
-                HVACMode.FAN_ONLY,
-            ]
-        ),
-        vol.Optional(ATTR_DEFAULT_FAN_MODE): vol.In(
-            [FanMode.ON, FanMode.OFF, FanMode.AUTO]
-        ),
-    }
+TEMP_SENSOR_SCHEMA = vol.Any(
+    cv.entity_id,
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+            vol.Optional(ATTR_WEIGHT, default=1.0): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
+        }
+    ),
+)
+
+SCHEDULE_TRANSITION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_DAYS): cv.weekdays,
+            vol.Required(ATTR_AT): cv.time,
+            vol.Optional(ATTR_PRESET_MODE): cv.string,
+            vol.Inclusive(ATTR_TARGET_TEMP_LOW, "range"): vol.Coerce(float),
+            vol.Inclusive(ATTR_TARGET_TEMP_HIGH, "range"): vol.Coerce(float),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_PRESET_MODE, ATTR_TARGET_TEMP_LOW),
+)
+
+THERMOSTAT_FIELDS = {
+    vol.Required(ATTR_NAME): cv.string,
+    vol.Required(ATTR_TEMP_SENSOR): vol.All(
+        cv.ensure_list, [TEMP_SENSOR_SCHEMA], vol.Length(min=1)
+    ),
+    vol.Required(ATTR_PRESET_MODES): vol.All(cv.ensure_list, [PRESET_SCHEMA]),
+    # Optional Values
+    vol.Optional(ATTR_COOLER_SWITCH): cv.entity_id,
+    vol.Optional(ATTR_HEATER_SWITCH): cv.entity_id,
+    vol.Optional(ATTR_FAN_SWITCH): cv.entity_id,
+    vol.Optional(ATTR_DAMPER_SWITCH): cv.entity_id,
+    vol.Optional(ATTR_OPENING_ENTITIES): cv.entity_ids,
+    vol.Optional(ATTR_MIN_TEMP): vol.Coerce(float),
+    vol.Optional(ATTR_MAX_TEMP): vol.Coerce(float),
+    vol.Optional(ATTR_TEMP_STEP): vol.Coerce(float),
+    vol.Optional(ATTR_OPENING_DELAY): vol.All(cv.time_period, cv.positive_timedelta),
+    vol.Optional(ATTR_CYCLE_DELAY): vol.All(cv.time_period, cv.positive_timedelta),
+    vol.Optional(ATTR_TEMP_TOLERANCE): vol.Coerce(float),
+    vol.Optional(ATTR_DEFAULT_PRESET): cv.string,
+    vol.Optional(ATTR_DEFAULT_HVAC_MODE): vol.In(
+        [
+            HVACMode.COOL,
+            HVACMode.HEAT,
+            HVACMode.OFF,
+            HVACMode.HEAT_COOL,
+            HVACMode.FAN_ONLY,
+        ]
+    ),
+    vol.Optional(ATTR_DEFAULT_FAN_MODE): vol.In(
+        [FanMode.ON, FanMode.OFF, FanMode.AUTO]
+    ),
+    vol.Optional(ATTR_ACTUATOR_TIMEOUT): vol.All(cv.time_period, cv.positive_timedelta),
+    vol.Optional(ATTR_ACTUATOR_MODE): vol.In([ActuatorMode.WAIT, ActuatorMode.CONFIRM]),
+    vol.Optional(ATTR_TEMP_WRITE_INTERVAL): vol.All(
+        cv.time_period, cv.positive_timedelta
+    ),
+    vol.Optional(ATTR_METRICS): cv.boolean,
+    vol.Optional(ATTR_RUNTIME_STATS): cv.boolean,
+    vol.Optional(ATTR_TRACE_SIZE): cv.positive_int,
+    vol.Optional(ATTR_TEMP_AGGREGATION): vol.In(
+        [mode.value for mode in TempAggregation]
+    ),
+    vol.Optional(ATTR_TEMP_OUTLIER_THRESHOLD): vol.All(
+        vol.Coerce(float), vol.Range(min=0, min_included=False)
+    ),
+    vol.Optional(ATTR_TEMP_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(ATTR_TEMP_SMOOTHING): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1, min_included=False)
+    ),
+    vol.Optional(ATTR_TEMP_EVALUATION_INTERVAL): vol.All(
+        cv.time_period, cv.positive_timedelta
+    ),
+    vol.Optional(ATTR_STALE_TIMEOUT): vol.All(cv.time_period, cv.positive_timedelta),
+    vol.Optional(ATTR_STALE_BEHAVIOR): vol.In(
+        [behavior.value for behavior in StaleBehavior]
+    ),
+    vol.Optional(ATTR_FALLBACK_TEMP_SENSOR): cv.entity_id,
+    vol.Optional(ATTR_PRIORITY): vol.Coerce(int),
+    vol.Optional(ATTR_HEATER_POWER): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(ATTR_COOLER_POWER): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(ATTR_SCHEDULE): vol.All(
+        cv.ensure_list, [SCHEDULE_TRANSITION_SCHEMA], vol.Length(min=1)
+    ),
+}
+
+
+def _validate_stale_behavior(config: ConfigType) -> ConfigType:
+    """Make sure the fallback behavior has a sensor to fall back to."""
+    if (
+        config.get(ATTR_STALE_BEHAVIOR) == StaleBehavior.FALLBACK
+        and ATTR_FALLBACK_TEMP_SENSOR not in config
+    ):
+        raise vol.Invalid(
+            f"{ATTR_FALLBACK_TEMP_SENSOR} is required when {ATTR_STALE_BEHAVIOR} is "
+            f"{StaleBehavior.FALLBACK}"
+        )
+    return config
+
+
+def _validate_schedule(config: ConfigType) -> ConfigType:
+    """Make sure the schedule only uses presets of the zone."""
+    presets = {preset[ATTR_NAME] for preset in config[ATTR_PRESET_MODES]}
+    for transition in config.get(ATTR_SCHEDULE, []):
+        preset = transition.get(ATTR_PRESET_MODE)
+        if preset is not None and preset not in presets:
+            raise vol.Invalid(f"{ATTR_SCHEDULE} uses unknown preset {preset}")
+        if ATTR_TARGET_TEMP_LOW in transition and ATTR_PRESET_MODE in transition:
+            raise vol.Invalid(
+                f"{ATTR_SCHEDULE} transitions set either a preset or a range"
+            )
+    return config
+
+
+POWER_BUDGET_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_MAX_ACTIVE): cv.positive_int,
+            vol.Optional(ATTR_MAX_POWER): vol.All(
+                vol.Coerce(float), vol.Range(min=0, min_included=False)
+            ),
+            vol.Optional(ATTR_BUDGET_STRATEGY, default=DEFAULT_BUDGET_STRATEGY): vol.In(
+                [strategy.value for strategy in BudgetStrategy]
+            ),
+            vol.Optional(
+                ATTR_ROTATION_INTERVAL, default=DEFAULT_ROTATION_INTERVAL
+            ): vol.All(cv.time_period, cv.positive_timedelta),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_MAX_ACTIVE, ATTR_MAX_POWER),
 )
 
 # Additional validations
-PLATFORM_SCHEMA = vol.All(
+THERMOSTAT_SCHEMA = vol.All(
     cv.has_at_least_one_key(ATTR_COOLER_SWITCH, ATTR_HEATER_SWITCH, ATTR_FAN_SWITCH),
-    PLATFORM_SCHEMA,
+    vol.Schema(THERMOSTAT_FIELDS),
+    _validate_stale_behavior,
+    _validate_schedule,
+)
+
+# The platform either configures a single thermostat or a list of them
+PLATFORM_SCHEMA = vol.Any(
+    PLATFORM_SCHEMA.extend(
+        {
+            vol.Required(ATTR_THERMOSTATS): vol.All(
+                cv.ensure_list, [THERMOSTAT_SCHEMA]
+            ),
+            vol.Optional(ATTR_POWER_BUDGET): POWER_BUDGET_SCHEMA,
+        }
+    ),
+    vol.All(
+        cv.has_at_least_one_key(
+            ATTR_COOLER_SWITCH, ATTR_HEATER_SWITCH, ATTR_FAN_SWITCH
+        ),
+        PLATFORM_SCHEMA.extend(THERMOSTAT_FIELDS),
+        _validate_stale_behavior,
+        _validate_schedule,
+    ),
 )
 
 
@@ -141,6 +334,53 @@ async def async_setup_platform(
 ) -> None:
     """Initialize the YAS Thermostat Platform."""
 
+    zone_configs: list[ConfigType] = config.get(ATTR_THERMOSTATS, [config])
+
+    # Make sure the shared dispatcher exists before any of the zones are added
+    async_get_dispatcher(hass)
+    async_setup_services(hass)
+
+    # The budget is shared by the zones of this platform entry only
+    power_budget = (
+        PowerBudget(
+            hass,
+            budget_config.get(ATTR_MAX_ACTIVE),
+            budget_config.get(ATTR_MAX_POWER),
+            BudgetStrategy(budget_config[ATTR_BUDGET_STRATEGY]),
+            budget_config[ATTR_ROTATION_INTERVAL],
+        )
+        if (budget_config := config.get(ATTR_POWER_BUDGET)) is not None
+        else None
+    )
+
+    entities = [
+        _create_thermostat(hass, zone_config, power_budget)
+        for zone_config in zone_configs
+    ]
+    async_add_entities(entities, update_before_add=True)
+
+    # Zones with metrics or a trace publish them through diagnostic sensors
+    if diagnostic_zones := [
+        zone for zone in entities if zone.metrics is not None or zone.trace is not None
+    ]:
+        hass.async_create_task(
+            discovery.async_load_platform(
+                hass,
+                Platform.SENSOR,
+                DOMAIN,
+                {DISCOVERY_ZONES: diagnostic_zones},
+                config,
+            )
+        )
+
+
+def _create_thermostat(
+    hass: HomeAssistant,
+    config: ConfigType,
+    power_budget: PowerBudget | None = None,
+) -> YetAnotherSmartThermostat:
+    """Create a thermostat entity from a single zone configuration."""
+
     name: str = config[ATTR_NAME]
     default_hvac_mode = config.get(ATTR_DEFAULT_HVAC_MODE, DEFAULT_HVAC_MODE)
     default_fan_mode = config.get(ATTR_DEFAULT_FAN_MODE, DEFAULT_FAN_MODE)
@@ -157,9 +397,29 @@ async def async_setup_platform(
     heater_switch_id = config.get(ATTR_HEATER_SWITCH)
     cooler_switch_id = config.get(ATTR_COOLER_SWITCH)
     fan_switch_id = config.get(ATTR_FAN_SWITCH)
+    damper_switch_id = config.get(ATTR_DAMPER_SWITCH)
     opening_entity_ids = config.get(ATTR_OPENING_ENTITIES)
     default_preset: str = config.get(ATTR_DEFAULT_PRESET, next(iter(presets)))
-    temp_sensor_id = config.get(ATTR_TEMP_SENSOR)
+    temp_sensors: dict[str, float] = {}
+    for sensor in config[ATTR_TEMP_SENSOR]:
+        if isinstance(sensor, str):
+            temp_sensors[sensor] = 1.0
+        else:
+            temp_sensors[sensor[ATTR_ENTITY_ID]] = sensor[ATTR_WEIGHT]
+    temp_aggregation = TempAggregation(
+        config.get(ATTR_TEMP_AGGREGATION, DEFAULT_TEMP_AGGREGATION)
+    )
+    temp_outlier_threshold: float | None = config.get(ATTR_TEMP_OUTLIER_THRESHOLD)
+    temp_deadband: float | None = config.get(ATTR_TEMP_DEADBAND)
+    temp_smoothing: float | None = config.get(ATTR_TEMP_SMOOTHING)
+    temp_evaluation_interval: timedelta | None = config.get(
+        ATTR_TEMP_EVALUATION_INTERVAL
+    )
+    stale_timeout: timedelta | None = config.get(ATTR_STALE_TIMEOUT)
+    stale_behavior = StaleBehavior(
+        config.get(ATTR_STALE_BEHAVIOR, DEFAULT_STALE_BEHAVIOR)
+    )
+    fallback_temp_sensor_id: str | None = config.get(ATTR_FALLBACK_TEMP_SENSOR)
     temp_unit: UnitOfTemperature = hass.config.units.temperature_unit
     temp_min: float = config.get(ATTR_MIN_TEMP, DEFAULT_TEMP_MIN)
     temp_max: float = config.get(ATTR_MAX_TEMP, DEFAULT_TEMP_MAX)
@@ -167,29 +427,60 @@ async def async_setup_platform(
     temp_step: float = config.get(ATTR_TEMP_STEP, 1.0)
     cycle_delay: timedelta = config.get(ATTR_CYCLE_DELAY, DEFAULT_CYCLE_DELAY)
     opening_delay: timedelta = config.get(ATTR_OPENING_DELAY, DEFAULT_OPENING_DELAY)
+    actuator_timeout: timedelta = config.get(
+        ATTR_ACTUATOR_TIMEOUT, DEFAULT_ACTUATOR_TIMEOUT
+    )
+    actuator_mode: ActuatorMode = config.get(ATTR_ACTUATOR_MODE, DEFAULT_ACTUATOR_MODE)
+    temp_write_interval: timedelta | None = config.get(ATTR_TEMP_WRITE_INTERVAL)
+    metrics: bool = config.get(ATTR_METRICS, False)
+    trace_size: int = config.get(ATTR_TRACE_SIZE, DEFAULT_TRACE_SIZE)
+    priority: int = config.get(ATTR_PRIORITY, 0)
+    heater_power: float = config.get(ATTR_HEATER_POWER, 0.0)
+    cooler_power: float = config.get(ATTR_COOLER_POWER, 0.0)
+    runtime_stats: bool = config.get(ATTR_RUNTIME_STATS, False)
+    schedule = (
+        compile_schedule(config[ATTR_SCHEDULE]) if ATTR_SCHEDULE in config else None
+    )
 
-    entities = [
-        YetAnotherSmartThermostat(
-            name,
-            temp_sensor_id,
-            heater_switch_id,
-            cooler_switch_id,
-            fan_switch_id,
-            opening_entity_ids,
-            temp_min,
-            temp_max,
-            temp_unit,
-            temp_tolerance,
-            temp_step,
-            cycle_delay,
-            opening_delay,
-            presets,
-            default_preset,
-            default_fan_mode,
-            default_hvac_mode,
-        )
-    ]
-    async_add_entities(entities, update_before_add=True)
+    return YetAnotherSmartThermostat(
+        name,
+        temp_sensors,
+        heater_switch_id,
+        cooler_switch_id,
+        fan_switch_id,
+        opening_entity_ids,
+        temp_min,
+        temp_max,
+        temp_unit,
+        temp_tolerance,
+        temp_step,
+        cycle_delay,
+        opening_delay,
+        presets,
+        default_preset,
+        default_fan_mode,
+        default_hvac_mode,
+        actuator_timeout,
+        actuator_mode,
+        temp_write_interval,
+        metrics,
+        trace_size,
+        temp_aggregation,
+        temp_outlier_threshold,
+        temp_deadband,
+        temp_smoothing,
+        temp_evaluation_interval,
+        stale_timeout,
+        stale_behavior,
+        fallback_temp_sensor_id,
+        schedule,
+        damper_switch_id,
+        priority,
+        heater_power,
+        cooler_power,
+        runtime_stats,
+        power_budget,
+    )
 
 
 class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
@@ -198,8 +489,9 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     # Settings
     _heater_switch_id: str | None = None
     _cooler_switch_id: str | None = None
-    _temp_sensor_id: str
+    _temp_sensor_ids: list[str]
     _fan_switch_id: str | None = None
+    _damper_switch_id: str | None = None
     _opening_entity_ids: list[str] | None = None
     _presets: dict[str, ClimateSettings]
     _temp_min: float
@@ -209,24 +501,60 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     _temp_step: float
     _cycle_delay: timedelta
     _opening_delay: timedelta = timedelta(seconds=30)
+    _actuator_timeout: timedelta = DEFAULT_ACTUATOR_TIMEOUT
+    _actuator_mode: ActuatorMode = DEFAULT_ACTUATOR_MODE
 
     # Current values
-    _current_settings: ClimateSettings
-    _current_preset: str | None = None
-    _current_temp: float | None = None
-    _current_opening_states: dict[str, bool] = {}
-    _is_heater_active: bool = False
-    _is_cooler_active: bool = False
-    _is_fan_active: bool = False
-    _is_initialized: bool = False
-    _openings_locked_value: bool | None = None
-    _openings_lock_expiry: datetime | None = None
-    _cycle_lock_expiry: datetime | None = None
+    _state: ZoneState
+    _temperature: TemperatureAggregator
+    _temp_filters: dict[str, SensorFilter] | None = None
+    _temp_evaluation_interval: timedelta | None = None
+    _temp_evaluation_timer: TimerHandle | None = None
+    _rate_limited_count: int = 0
+    _stale_timeout: timedelta | None = None
+    _stale_behavior: StaleBehavior = DEFAULT_STALE_BEHAVIOR
+    _stale_timer: TimerHandle | None = None
+    _fallback_temp_sensor_id: str | None = None
+    _fallback_temp: float | None = None
+    _sensor_seen_at: dict[str, datetime] | None = None
+    _sensor_status: dict[str, ReadingStatus]
+    _openings: OpeningGroup | None = None
+    _heater: SwitchActuator | EquipmentDemand | None = None
+    _cooler: SwitchActuator | EquipmentDemand | None = None
+    _fan: SwitchActuator | EquipmentDemand | None = None
+    _damper: SwitchActuator | None = None
+    _scheduler: UpdateScheduler | None = None
+    _openings_lock_timer: TimerHandle | None = None
+    _cycle_lock_timer: TimerHandle | None = None
+    _timers: TimerHeap | None = None
+    _clock: Clock | None = None
+    _metrics: ZoneMetrics | None = None
+    _trace: DecisionTrace | None = None
+    _profile: ZoneProfile | None = None
+    _power_budget: PowerBudget | None = None
+    _runtime_store: RuntimeStore | None = None
+    _runtime_stats: dict[str, RuntimeStats] | None = None
+    _schedule: list[ScheduledTransition] | None = None
+    _restored_at: datetime | None = None
+
+    _switch_listeners: dict[str, CALLBACK_TYPE]
+
+    # State write tracking
+    _temp_write_interval: timedelta | None = None
+    _deferred_write_timer: TimerHandle | None = None
+    _cached_attributes: dict[str, Any] | None = None
+    _cached_attributes_key: tuple | None = None
+    _preset_modes: list[str] | None = None
+
+    # Nothing is polled: sensor, switch and opening events, the cycle, openings,
+    # stale sensor and deferred write deadlines on the timer heap, schedule
+    # transitions and power budget changes each request their own evaluation
+    _attr_should_poll = False
 
     _supported_features: ClimateEntityFeature = (
         ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
     )
-    _available_hvac_modes: list[HVACMode] = [HVACMode.OFF]
+    _available_hvac_modes: list[HVACMode]
     _available_fan_modes: list[FanMode] | None = None
     _valid_heat_hvac_modes: list[HVACMode] = [
         HVACMode.HEAT_COOL,
@@ -240,7 +568,7 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     def __init__(
         self,
         name: str,
-        temp_sensor_id: str,
+        temp_sensors: dict[str, float],
         heater_entity_id: str | None,
         cooler_entity_id: str | None,
         fan_entity_id: str | None,
@@ -256,14 +584,54 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
         default_preset: str,
         default_hvac_mode: HVACMode,
         default_fan_mode: FanMode,
+        actuator_timeout: timedelta = DEFAULT_ACTUATOR_TIMEOUT,
+        actuator_mode: ActuatorMode = DEFAULT_ACTUATOR_MODE,
+        temp_write_interval: timedelta | None = None,
+        metrics: bool = False,
+        trace_size: int = DEFAULT_TRACE_SIZE,
+        temp_aggregation: TempAggregation = DEFAULT_TEMP_AGGREGATION,
+        temp_outlier_threshold: float | None = None,
+        temp_deadband: float | None = None,
+        temp_smoothing: float | None = None,
+        temp_evaluation_interval: timedelta | None = None,
+        stale_timeout: timedelta | None = None,
+        stale_behavior: StaleBehavior = DEFAULT_STALE_BEHAVIOR,
+        fallback_temp_sensor_id: str | None = None,
+        schedule: list[ScheduledTransition] | None = None,
+        damper_entity_id: str | None = None,
+        priority: int = 0,
+        heater_power: float = 0.0,
+        cooler_power: float = 0.0,
+        runtime_stats: bool = False,
+        power_budget: PowerBudget | None = None,
     ) -> None:
         """Initialize a new instance of the YetAnotherSmartThermostat class."""
         self._name = name
         self._presets = presets
-        self._temp_sensor_id = temp_sensor_id
+        self._temp_sensor_ids = list(temp_sensors)
+        self._temperature = TemperatureAggregator(
+            temp_sensors, temp_aggregation, temp_outlier_threshold
+        )
+        if temp_deadband is not None or temp_smoothing is not None:
+            self._temp_filters = {
+                entity_id: SensorFilter(temp_smoothing or 1.0, temp_deadband or 0.0)
+                for entity_id in temp_sensors
+            }
+        self._temp_evaluation_interval = temp_evaluation_interval
+        self._stale_timeout = stale_timeout
+        self._stale_behavior = stale_behavior
+        self._fallback_temp_sensor_id = fallback_temp_sensor_id
+        self._sensor_seen_at = {} if stale_timeout is not None else None
+        self._sensor_status = {}
         self._heater_switch_id = heater_entity_id
         self._cooler_switch_id = cooler_entity_id
         self._fan_switch_id = fan_entity_id
+        self._damper_switch_id = damper_entity_id
+        self._priority = priority
+        self._heater_power = heater_power
+        self._cooler_power = cooler_power
+        self._runtime_stats_enabled = runtime_stats
+        self._power_budget = power_budget
         self._opening_entity_ids = opening_entity_ids
         self._temp_min = temp_min
         self._temp_max = temp_max
@@ -274,8 +642,15 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
         self._opening_delay = opening_delay
         self._default_hvac_mode = default_hvac_mode
         self._default_fan_mode = default_fan_mode
+        self._actuator_timeout = actuator_timeout
+        self._actuator_mode = actuator_mode
+        self._temp_write_interval = temp_write_interval
+        self._metrics = ZoneMetrics() if metrics else None
+        self._trace = DecisionTrace(trace_size) if trace_size > 0 else None
+        self._schedule = schedule
 
         # Setup modes and features
+        self._available_hvac_modes = [HVACMode.OFF]
         if fan_entity_id is not None:
             self._available_hvac_modes.append(HVACMode.FAN_ONLY)
             self._available_fan_modes = [FanMode.OFF, FanMode.ON, FanMode.AUTO]
@@ -287,128 +662,238 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
         if heater_entity_id is not None and cooler_entity_id is not None:
             self._available_hvac_modes.append(HVACMode.HEAT_COOL)
 
-        # Initialize the default preset
-        self._current_preset = default_preset
-        self._current_settings = self._presets[default_preset].clone()
+        # Initialize the runtime state with the default preset
+        self._state = ZoneState(default_preset, self._presets[default_preset].clone())
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
 
         await super().async_added_to_hass()
 
-        self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self._temp_sensor_id], self._async_on_temperature_changed
-            )
-        )
+        self._async_setup_runtime()
 
-        if self._heater_switch_id is not None:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, [self._heater_switch_id], self._on_heater_switch_changed
-                )
+        # Restore and start together with the other zones of the platform
+        startup = async_get_startup_coordinator(self.hass)
+        await startup.async_restore(self)
+        startup.async_register(self)
+
+    @callback
+    def async_restore(
+        self, previous_state: State | None, runtime: ZoneData | None = None
+    ) -> None:
+        """Load the previous state and the stored runtime data if they're present."""
+        if runtime is not None:
+            self._async_restore_runtime(runtime)
+
+        if previous_state is None:
+            return
+
+        _LOGGER.debug("Previous state found, loading data")
+        self._restored_at = previous_state.last_updated
+        # Set the previous preset
+        if (
+            previous_preset := previous_state.attributes.get(ATTR_PRESET_MODE)
+        ) is not None and previous_preset in self._presets:
+            _LOGGER.debug("Previous state had preset %s", previous_preset)
+            self._state.preset = previous_preset
+            self._state.settings = self._presets[previous_preset].clone()
+        elif (
+            previous_settings := self._read_manual_settings(previous_state)
+        ) is not None:
+            _LOGGER.debug("Previous state had manual settings %s", previous_settings)
+            self._state.preset = None
+            self._state.settings = previous_settings
+        # Otherwise something is weird or we have no state so use the default which is set already
+
+    @callback
+    def _async_restore_runtime(self, runtime: ZoneData) -> None:
+        """Resume the locks that hadn't expired yet and continue the counters."""
+        now = self._clock.now()
+        if (expiry := _parse_expiry(runtime.get("cycle_lock_expiry"), now)) is not None:
+            _LOGGER.debug("Restoring the cycle lock until %s", expiry)
+            self._async_lock_cycle(expiry)
+        if (openings_lock := runtime.get("openings_lock")) is not None and (
+            expiry := _parse_expiry(openings_lock.get("expiry"), now)
+        ) is not None:
+            _LOGGER.debug("Restoring the openings lock until %s", expiry)
+            self._async_lock_openings(openings_lock.get("value"), expiry)
+        if self._metrics is not None and (counters := runtime.get("counters")):
+            self._metrics.restore_counters(counters)
+        if self._runtime_stats is not None and (stored := runtime.get("stats")):
+            for name, stats in self._runtime_stats.items():
+                if name in stored:
+                    stats.restore(stored[name], now)
+
+    def _runtime_data(self) -> ZoneData:
+        """Return the runtime data that is kept across restarts."""
+        state = self._state
+        return {
+            "cycle_lock_expiry": state.cycle_lock_expiry.isoformat()
+            if state.is_cycle_locked
+            else None,
+            "openings_lock": {
+                "value": state.openings_locked_value,
+                "expiry": state.openings_lock_expiry.isoformat(),
+            }
+            if state.is_openings_locked
+            else None,
+            "counters": self._metrics.counters() if self._metrics is not None else None,
+            "stats": {
+                name: stats.as_stored() for name, stats in self._runtime_stats.items()
+            }
+            if self._runtime_stats is not None
+            else None,
+        }
+
+    @callback
+    def _async_runtime_changed(self) -> None:
+        if self._runtime_store is not None:
+            self._runtime_store.async_changed(self.entity_id, self._runtime_data)
+
+    @property
+    def referenced_entity_ids(self) -> list[str]:
+        """Return the IDs of the entities read at startup."""
+        entity_ids = list(self._temp_sensor_ids)
+        if self._fallback_temp_sensor_id is not None:
+            entity_ids.append(self._fallback_temp_sensor_id)
+        entity_ids.extend(
+            actuator.entity_id
+            for actuator in (self._cooler, self._heater, self._fan, self._damper)
+            if actuator is not None
+        )
+        if self._opening_entity_ids:
+            entity_ids.extend(self._opening_entity_ids)
+        return entity_ids
+
+    @callback
+    def async_startup(self, states: Mapping[str, State | None]) -> None:
+        """Load the current values from a snapshot of the referenced entities."""
+        for entity_id in self._temp_sensor_ids:
+            value = self._async_read_temperature(entity_id, states.get(entity_id))
+            if value is None:
+                continue
+            if self._temp_filters is not None:
+                value = self._temp_filters[entity_id].process(value)
+            if self._sensor_seen_at is not None:
+                self._sensor_seen_at[entity_id] = self._clock.now()
+            self._temperature.update(entity_id, value)
+
+        if self._fallback_temp_sensor_id is not None:
+            self._fallback_temp = self._async_read_temperature(
+                self._fallback_temp_sensor_id,
+                states.get(self._fallback_temp_sensor_id),
             )
+        self._async_apply_temperature()
+        if self._sensor_seen_at is not None:
+            self._async_arm_stale_timer()
+
+        # Set the current switch states
+        for actuator in (self._cooler, self._heater, self._fan, self._damper):
+            if actuator is not None:
+                actuator.async_handle_state(states.get(actuator.entity_id))
+        self._async_record_runtime()
+
+        if self._openings is not None:
+            async_get_opening_index(self.hass).async_seed(states)
+
+        # Catch up with the last transition missed while the zone was down
+        if self._schedule is not None and (
+            transition := latest_transition(
+                self._schedule, self._restored_at, self._clock.now()
+            )
+        ):
+            self.async_apply_transition(transition)
+
+        self._state.is_initialized = True
+
+    @callback
+    def async_request_evaluation(self) -> asyncio.Future[None]:
+        """Request an evaluation, the future completes once it has finished."""
+        return self._scheduler.async_schedule()
+
+    @callback
+    def _async_setup_runtime(self) -> None:
+        """Create the runtime helpers of the zone and subscribe to its entities."""
+        self._scheduler = UpdateScheduler(self.hass, self._name, self._async_evaluate)
+        self.async_on_remove(self._scheduler.async_shutdown)
+
+        self._clock = async_get_clock(self.hass)
+        self._timers = async_get_timer_heap(self.hass)
+        self.async_on_remove(self._async_cancel_timers)
+        self._runtime_store = async_get_runtime_store(self.hass)
+
+        if self._runtime_stats_enabled:
+            now = self._clock.now()
+            self._runtime_stats = {}
+            if self._heater_switch_id is not None:
+                self._runtime_stats["heater"] = RuntimeStats(self._heater_power, now)
+            if self._cooler_switch_id is not None:
+                self._runtime_stats["cooler"] = RuntimeStats(self._cooler_power, now)
 
+        # Create the actuators for the configured switches
+        self._switch_listeners = {}
+        self.async_on_remove(self._async_remove_switch_listeners)
+        if self._heater_switch_id is not None:
+            self._heater = self._create_actuator(self._heater_switch_id, "heater")
         if self._cooler_switch_id is not None:
+            self._cooler = self._create_actuator(self._cooler_switch_id, "cooler")
+        if self._fan_switch_id is not None:
+            self._fan = self._create_actuator(self._fan_switch_id, "fan")
+        if self._damper_switch_id is not None:
+            self._damper = self._create_actuator(self._damper_switch_id, "damper")
+
+        if (budget := self._power_budget) is not None:
             self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, [self._cooler_switch_id], self._on_cooler_switch_changed
-                )
+                lambda: budget.async_release((self.entity_id, "heater"))
             )
-
-        # Setup the listener for the openings if they are set
-        if self._opening_entity_ids:
             self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    self._opening_entity_ids,
-                    self._on_opening_entity_changed,
-                )
+                lambda: budget.async_release((self.entity_id, "cooler"))
             )
 
-        # Load the previous state if it's present
-        previous_state: State | None = await self.async_get_last_state()
-        if previous_state is not None:
-            _LOGGER.debug("Previous state found, loading data")
-            # Set the previous preset
-            if (
-                previous_preset := previous_state.attributes.get(ATTR_PRESET_MODE)
-            ) is not None and previous_preset in self._presets:
-                _LOGGER.debug("Previous state had preset %s", previous_preset)
-                self._current_preset = previous_preset
-                self._current_settings = self._presets[previous_preset].clone()
-            elif (
-                previous_settings := self._read_manual_settings(previous_state)
-            ) is not None:
-                _LOGGER.debug(
-                    "Previous state had manual settings %s", previous_settings
-                )
-                self._current_preset = None
-                self._current_settings = previous_settings
-            # Otherwise something is weird or we have no state so use the default which is set already
-
-        # Startup function to run at HA startup or on creation, loads current values and old state
-        @callback
-        def _async_startup(*_) -> None:
-            sensor_state = self.hass.states.get(self._temp_sensor_id)
-            self._current_temp = (
-                float(sensor_state.state) if sensor_state is not None else None
-            )
+        zones = async_get_zones(self.hass)
+        zones[self.entity_id] = self
+        self.async_on_remove(lambda: zones.pop(self.entity_id, None))
 
-            # Set the current cooler siwtch state
-            if self._cooler_switch_id is not None:
-                cooler_state: State | None = self.hass.states.get(
-                    self._cooler_switch_id
-                )
-                self._is_cooler_active = (
-                    cooler_state.state == STATE_ON
-                    if cooler_state is not None
-                    else False
-                )
+        dispatcher = async_get_dispatcher(self.hass)
 
-            # Set the current heater siwtch state
-            if self._heater_switch_id is not None:
-                heater_state: State | None = self.hass.states.get(
-                    self._heater_switch_id
-                )
-                self._is_heater_active = (
-                    heater_state.state == STATE_ON
-                    if heater_state is not None
-                    else False
+        self.async_on_remove(
+            dispatcher.async_track(
+                self._temp_sensor_ids, self._async_on_temperature_changed
+            )
+        )
+
+        if self._fallback_temp_sensor_id is not None:
+            self.async_on_remove(
+                dispatcher.async_track(
+                    [self._fallback_temp_sensor_id],
+                    self._async_on_fallback_temperature_changed,
                 )
+            )
 
-            # Set the current fan state
-            if self._fan_switch_id is not None:
-                fan_state: State | None = self.hass.states.get(self._fan_switch_id)
-                self._is_fan_active = (
-                    fan_state.state == STATE_ON if fan_state is not None else False
+        if self._schedule is not None:
+            self.async_on_remove(
+                async_get_schedule_engine(self.hass).async_register(
+                    self, self._schedule
                 )
+            )
 
-            # Build the dictionary of opening states
-            if self._opening_entity_ids:
-                _LOGGER.debug("Initializing openings %s", self._opening_entity_ids)
-                for entity_id in self._opening_entity_ids:
-                    opening_state: State | None = self.hass.states.get(entity_id)
-                    self._current_opening_states[entity_id] = (
-                        opening_state in [STATE_OPEN, STATE_ON]
-                        if opening_state is not None
-                        else False
-                    )
-
-            self._is_initialized = True
-
-            # Call update to get things going
-            asyncio.run_coroutine_threadsafe(self.async_update(), self.hass.loop)
-
-        # Call the startup function immediately if HA is running or wait until it is to run it
-        if self.hass.state == CoreState.running:
-            _async_startup()
-        else:
-            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _async_startup)
+        # Join the shared group for the openings if they are set
+        if self._opening_entity_ids:
+            self._openings, remove_openings = async_get_opening_index(
+                self.hass
+            ).async_subscribe(self._opening_entity_ids, self._async_on_openings_changed)
+            self.async_on_remove(remove_openings)
 
     @property
     def extra_state_attributes(self):
         """Return entity specific state attributes to be saved."""
+        settings_key = (self._state.preset, self._state.settings.as_tuple())
+        if (
+            self._cached_attributes is not None
+            and settings_key == self._cached_attributes_key
+        ):
+            return self._with_runtime_stats(self._cached_attributes)
+
         data = {
             ATTR_MANUAL_HVAC_MODE: None,
             ATTR_MANUAL_FAN_MODE: None,
@@ -416,13 +901,46 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
             ATTR_MANUAL_TEMP_HIGH: None,
         }
 
-        if self._current_preset is None:
-            data[ATTR_MANUAL_HVAC_MODE] = self._current_settings.hvac_mode
-            data[ATTR_MANUAL_FAN_MODE] = self._current_settings.fan_mode
-            data[ATTR_MANUAL_TEMP_LOW] = self._current_settings.temp_low
-            data[ATTR_MANUAL_TEMP_HIGH] = self._current_settings.temp_high
+        if self._state.preset is None:
+            data[ATTR_MANUAL_HVAC_MODE] = self._state.settings.hvac_mode
+            data[ATTR_MANUAL_FAN_MODE] = self._state.settings.fan_mode
+            data[ATTR_MANUAL_TEMP_LOW] = self._state.settings.temp_low
+            data[ATTR_MANUAL_TEMP_HIGH] = self._state.settings.temp_high
+
+        self._cached_attributes = data
+        self._cached_attributes_key = settings_key
+        return self._with_runtime_stats(data)
+
+    def _with_runtime_stats(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Add the runtime statistics, which change with every write, to the attributes."""
+        if self._runtime_stats is None:
+            return data
+
+        now = self._clock.now()
+        return {
+            **data,
+            **{
+                _STATS_ATTRIBUTES[name]: stats.as_dict(now)
+                for name, stats in self._runtime_stats.items()
+            },
+        }
+
+    @callback
+    def _async_record_runtime(self) -> None:
+        """Count the heater and cooler transitions in the runtime statistics."""
+        if self._runtime_stats is None:
+            return
 
-        return data
+        now = self._clock.now()
+        changed = False
+        for name, stats in self._runtime_stats.items():
+            actuator = self._heater if name == "heater" else self._cooler
+            changed |= stats.record(actuator.is_active, now)
+        if changed:
+            self._async_runtime_changed()
+            # The statistics are only published with the state
+            if self._state.is_initialized:
+                self._async_write_state_if_changed(force=True)
 
     @property
     def name(self) -> str:
@@ -437,17 +955,17 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     @property
     def target_temperature_low(self) -> float | None:
         """Return the lowbound target temperature we try to reach."""
-        return self._current_settings.temp_low
+        return self._state.settings.temp_low
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the highbound target temperature we try to reach."""
-        return self._current_settings.temp_high
+        return self._state.settings.temp_high
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._current_temp
+        return self._state.current_temp
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set the new temperature."""
@@ -458,22 +976,27 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
         if temp is not None:
             raise ValueError("Target temperature mode not supported")
 
+        self.async_apply_temperature_range(temp_low, temp_high)
+        await self._scheduler.async_request()
+
+    @callback
+    def async_apply_temperature_range(
+        self, temp_low: float | None, temp_high: float | None
+    ) -> None:
+        """Change the temperature range without evaluating."""
         if temp_low is None and temp_high is None:
             raise ValueError("At least one temperature value is required")
 
-        self._current_preset = None
-        self._current_settings.temp_low = (
-            temp_low if temp_low is not None else self._current_settings.temp_low
+        self._state.preset = None
+        self._state.settings.temp_low = (
+            temp_low if temp_low is not None else self._state.settings.temp_low
         )
-        self._current_settings.temp_high = (
-            temp_high if temp_high is not None else self._current_settings.temp_high
+        self._state.settings.temp_high = (
+            temp_high if temp_high is not None else self._state.settings.temp_high
         )
 
         _LOGGER.debug("Temperate range changed to %s - %s", temp_low, temp_high)
 
-        await self.async_update()
-        self.async_write_ha_state()
-
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """List of available operation modes."""
@@ -482,40 +1005,59 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Returns the current HVAC mode."""
-        return self._current_settings.hvac_mode
+        return self._state.settings.hvac_mode
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new hvac mode."""
-        _LOGGER.debug("Setting HVac Mode to %s", hvac_mode)
+        self.async_apply_hvac_mode(hvac_mode)
+        await self._scheduler.async_request()
 
-        self._current_preset = None
-        self._current_settings.hvac_mode = hvac_mode
+    @callback
+    def async_apply_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Change the hvac mode without evaluating."""
+        _LOGGER.debug("Setting HVac Mode to %s", hvac_mode)
 
-        await self.async_update()
-        self.async_write_ha_state()
+        self._state.preset = None
+        self._state.settings.hvac_mode = hvac_mode
 
     @property
     def preset_modes(self) -> list[str] | None:
         """Returns the available preset modes."""
-        return list(self._presets.keys())
+        if self._preset_modes is None:
+            self._preset_modes = list(self._presets)
+        return self._preset_modes
 
     @property
     def preset_mode(self) -> str | None:
         """Returns the current preset mode or none."""
-        return self._current_preset
+        return self._state.preset
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
+        self.async_apply_preset_mode(preset_mode)
+        await self._scheduler.async_request()
+
+    @callback
+    def async_apply_preset_mode(self, preset_mode: str) -> None:
+        """Change the preset mode without evaluating."""
         if preset_mode not in self._presets:
             raise KeyError("Preset does not exist")
 
         _LOGGER.debug("Changing preset to %s", preset_mode)
 
-        self._current_preset = preset_mode
-        self._current_settings = self._presets[preset_mode].clone()
+        self._state.preset = preset_mode
+        self._state.settings = self._presets[preset_mode].clone()
 
-        await self.async_update()
-        self.async_write_ha_state()
+    @callback
+    def async_apply_transition(self, transition: ScheduledTransition) -> None:
+        """Change to the preset or range of a scheduled transition."""
+        _LOGGER.debug("Applying scheduled transition %s", transition)
+        if transition.preset_mode is not None:
+            self.async_apply_preset_mode(transition.preset_mode)
+        else:
+            self.async_apply_temperature_range(
+                transition.temp_low, transition.temp_high
+            )
 
     @property
     def fan_modes(self) -> list[str]:
@@ -525,17 +1067,16 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     @property
     def fan_mode(self) -> str:
         """Returns the current fan mode."""
-        return self._current_settings.fan_mode
+        return self._state.settings.fan_mode
 
     async def async_set_fan_mode(self, fan_mode: str | FanMode) -> None:
         """Set the the new fan mode."""
         _LOGGER.debug("Changing Fan Mode to %s", fan_mode)
 
-        self._current_preset = None
-        self._current_settings.fan_mode = fan_mode
+        self._state.preset = None
+        self._state.settings.fan_mode = fan_mode
 
-        await self.async_update()
-        self.async_write_ha_state()
+        await self._scheduler.async_request()
 
     @property
     def temperature_unit(self) -> UnitOfTemperature:
@@ -560,222 +1101,665 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
     @property
     def _is_cooling_needed(self) -> bool:
         return (
-            self._current_temp - self._current_settings.temp_high > self._temp_tolerance
-            and self._current_settings.hvac_mode in self._valid_cool_hvac_modes
+            self._state.current_temp - self._state.settings.temp_high
+            > self._temp_tolerance
+            and self._state.settings.hvac_mode in self._valid_cool_hvac_modes
             and self._is_any_opening_open is False
         )
 
     @property
     def _is_heating_needed(self) -> bool:
         return (
-            self._current_settings.temp_low - self._current_temp > self._temp_tolerance
-            and self._current_settings.hvac_mode in self._valid_heat_hvac_modes
+            self._state.settings.temp_low - self._state.current_temp
+            > self._temp_tolerance
+            and self._state.settings.hvac_mode in self._valid_heat_hvac_modes
             and self._is_any_opening_open is False
         )
 
     @property
-    def _is_fan_needed(self) -> bool:
-        return (
-            self._current_settings.hvac_mode == HVACMode.FAN_ONLY
-            or self._current_settings.fan_mode == FanMode.ON
-            or (
-                self._current_settings.fan_mode == FanMode.AUTO
-                and (self._is_cooler_active is True or self._is_heater_active is True)
-            )
-        )
+    def _is_heater_active(self) -> bool:
+        return self._heater is not None and self._heater.is_active
+
+    @property
+    def _is_cooler_active(self) -> bool:
+        return self._cooler is not None and self._cooler.is_active
 
     @property
-    def _is_openings_value_locked(self) -> bool:
-        _LOGGER.debug("Opening lock expiry %s", self._openings_lock_expiry)
+    def _is_fan_active(self) -> bool:
+        return self._fan is not None and self._fan.is_active
+
+    def _is_fan_needed(self, heating: bool, cooling: bool) -> bool:
         return (
-            self._openings_lock_expiry is not None
-            and self._openings_lock_expiry >= datetime.now(timezone.utc)
+            self._state.settings.hvac_mode == HVACMode.FAN_ONLY
+            or self._state.settings.fan_mode == FanMode.ON
+            or (
+                self._state.settings.fan_mode == FanMode.AUTO
+                and (cooling is True or heating is True)
+            )
         )
 
     @property
     def _is_any_opening_open(self) -> bool:
-        if self._is_openings_value_locked:
-            _LOGGER.debug("Openings value locked, using locked value")
-            return self._openings_locked_value
+        if self._state.is_openings_locked:
+            return self._state.openings_locked_value
         else:
-            return (
-                any(self._current_opening_states.values())
-                if self._current_opening_states is not None
-                else False
-            )
+            return self._openings is not None and self._openings.is_open
+
+    @property
+    def metrics(self) -> ZoneMetrics | None:
+        """Return the metrics of the zone, None when they aren't enabled."""
+        return self._metrics
+
+    @property
+    def trace(self) -> DecisionTrace | None:
+        """Return the decision trace of the zone, None when it is disabled."""
+        return self._trace
+
+    @property
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the diagnostics payload of the zone."""
+        return {
+            "scheduler": self._scheduler.as_dict()
+            if self._scheduler is not None
+            else None,
+            "cycle_lock_expiry": self._state.cycle_lock_expiry
+            if self._state.is_cycle_locked
+            else None,
+            "openings_lock_expiry": self._state.openings_lock_expiry
+            if self._state.is_openings_locked
+            else None,
+            "open_openings": self._openings.open_count
+            if self._openings is not None
+            else None,
+            "temperature": self._temperature.as_dict(),
+            "invalid_sensors": dict(self._sensor_status),
+            "stale_sensors": [
+                entity_id
+                for entity_id in self._temp_sensor_ids
+                if not self._temperature.has_reading(entity_id)
+            ],
+            "fallback_temp": self._fallback_temp,
+            "ingestion": {
+                "sensors": {
+                    entity_id: sensor_filter.as_dict()
+                    for entity_id, sensor_filter in self._temp_filters.items()
+                }
+                if self._temp_filters is not None
+                else None,
+                "rate_limited": self._rate_limited_count,
+            },
+            "actuators": {
+                name: actuator.as_dict()
+                for name, actuator in (
+                    ("heater", self._heater),
+                    ("cooler", self._cooler),
+                    ("fan", self._fan),
+                    ("damper", self._damper),
+                )
+                if actuator is not None
+            },
+            "runtime_stats": {
+                name: stats.as_dict(self._clock.now())
+                for name, stats in self._runtime_stats.items()
+            }
+            if self._runtime_stats is not None
+            else None,
+            "power_budget": self._power_budget.as_dict()
+            if self._power_budget is not None
+            else None,
+            "metrics": self._metrics.as_dict() if self._metrics is not None else None,
+            "trace": self._trace.as_list() if self._trace is not None else None,
+        }
 
     async def async_update(self) -> None:
         """Update the entity."""
-        current_time = datetime.now(timezone.utc)
-        cooler_changed: bool = False
-        heater_changed: bool = False
-        fan_changed: bool = False
-
-        if self._is_initialized is False:
+        if self._state.is_initialized is False:
             _LOGGER.debug("Not ready")
             return
 
-        if self._cycle_lock_expiry is None or current_time >= self._cycle_lock_expiry:
-            if self._is_cooling_needed is True:
-                cooler_changed |= await self._async_cooler_on()
-                if cooler_changed:
-                    _LOGGER.debug("Cooler required and was enabled")
-            else:
-                cooler_changed |= await self._async_cooler_off()
-                if cooler_changed:
-                    _LOGGER.debug("Cooler not required and was disabled")
-
-            if self._is_heating_needed is True:
-                heater_changed |= await self._async_heater_on()
-                if heater_changed:
-                    _LOGGER.debug("Heater required and was enabled")
-            else:
-                heater_changed |= await self._async_heater_off()
-                if heater_changed:
-                    _LOGGER.debug("Heater not required and was disabled")
-
-        if self._is_fan_needed is True:
-            fan_changed |= await self._async_fan_on()
-            if fan_changed:
-                _LOGGER.debug("Fan required and was enabled")
-        else:
-            fan_changed |= await self._async_fan_off()
-            if fan_changed:
-                _LOGGER.debug("Fan not required and was disabled")
+        await self._scheduler.async_request()
 
-        if cooler_changed or heater_changed:
-            self._cycle_lock_expiry = datetime.now(timezone.utc) + self._cycle_delay
+    async def _async_evaluate(self) -> None:
+        """Evaluate the control logic, only ever called through the scheduler."""
+        if self._state.is_initialized is False:
+            self._async_write_state_if_changed()
+            return
 
-        if cooler_changed or heater_changed or fan_changed:
-            self.async_write_ha_state()
+        metrics = self._metrics
+        profile = self._profile
+        started = perf_counter() if metrics is not None or profile is not None else 0.0
 
-    async def _async_cooler_on(self) -> bool:
-        if self._cooler_switch_id is not None and self._is_cooler_active is False:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_ON,
-                {ATTR_ENTITY_ID: self._cooler_switch_id},
-                context=self._context,
+        locked = False
+        if self._state.current_temp is None:
+            # Without a valid temperature the zone follows its stale behavior
+            if self._stale_behavior == StaleBehavior.OFF:
+                cooling = heating = False
+            else:
+                cooling = self._cooler is not None and self._cooler.target
+                heating = self._heater is not None and self._heater.target
+        elif self._state.is_cycle_locked is False:
+            cooling = self._is_cooling_needed
+            heating = self._is_heating_needed
+        else:
+            # Heating and cooling are locked in their current state
+            cooling = self._cooler is not None and self._cooler.target
+            heating = self._heater is not None and self._heater.target
+            # Except shared equipment, it has its own cycle delay
+            if self._cooler is not None and self._cooler.is_shared:
+                cooling = self._is_cooling_needed and not heating
+            if self._heater is not None and self._heater.is_shared:
+                heating = self._is_heating_needed and not cooling
+            locked = True
+
+        if self._power_budget is not None:
+            settings = self._state.settings
+            current_temp = self._state.current_temp
+            cooling = self._async_request_power(
+                "cooler",
+                self._cooler,
+                cooling,
+                self._cooler_power,
+                current_temp - settings.temp_high if current_temp is not None else 0,
+                locked,
+            )
+            heating = self._async_request_power(
+                "heater",
+                self._heater,
+                heating,
+                self._heater_power,
+                settings.temp_low - current_temp if current_temp is not None else 0,
+                locked,
             )
+        fan_needed = self._is_fan_needed(heating, cooling)
 
-            self._is_cooler_active = True
-            return True
-        return False
+        # Only the actuators that need to change are dispatched, all at once
+        calls: dict[str, Coroutine[Any, Any, bool]] = {}
+        if self._cooler is not None and self._cooler.async_needs(cooling):
+            calls["cooler"] = (
+                self._async_cooler_on() if cooling else self._async_cooler_off()
+            )
+        if self._heater is not None and self._heater.async_needs(heating):
+            calls["heater"] = (
+                self._async_heater_on() if heating else self._async_heater_off()
+            )
+        if self._fan is not None and self._fan.async_needs(fan_needed):
+            calls["fan"] = self._async_fan_on() if fan_needed else self._async_fan_off()
+
+        if metrics is not None:
+            if calls and metrics.pending_since is not None:
+                metrics.decision.record(perf_counter() - metrics.pending_since)
+            metrics.pending_since = None
+
+        # The damper opens before the equipment starts and closes after it stopped
+        damper_needed = heating or cooling or fan_needed
+        damper_changed = False
+        if damper_needed and self._damper is not None:
+            damper_changed = await self._async_set_actuator(self._damper, True)
+
+        changed: dict[str, bool] = (
+            dict(zip(calls, await asyncio.gather(*calls.values()))) if calls else {}
+        )
 
-    async def _async_cooler_off(self) -> bool:
-        if self._cooler_switch_id is not None and self._is_cooler_active is True:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_OFF,
-                {ATTR_ENTITY_ID: self._cooler_switch_id},
-                context=self._context,
+        if not damper_needed and self._damper is not None:
+            damper_changed = await self._async_set_actuator(self._damper, False)
+        if damper_changed:
+            changed["damper"] = True
+
+        if self._trace is not None:
+            settings = self._state.settings
+            self._trace.append(
+                DecisionRecord(
+                    self._clock.now(),
+                    self._state.current_temp,
+                    settings.temp_low,
+                    settings.temp_high,
+                    self._temp_tolerance,
+                    settings.hvac_mode,
+                    settings.fan_mode,
+                    self._state.is_cycle_locked,
+                    self._is_any_opening_open,
+                    self._state.is_openings_locked,
+                    heating,
+                    cooling,
+                    fan_needed,
+                    tuple(name for name, sent in changed.items() if sent),
+                )
             )
 
-            self._is_cooler_active = False
+        # Shared equipment keeps its own cycle delay
+        if (changed.get("cooler") and not self._cooler.is_shared) or (
+            changed.get("heater") and not self._heater.is_shared
+        ):
+            self._async_lock_cycle(self._clock.now() + self._cycle_delay)
+
+        self._async_record_runtime()
+        self._async_write_state_if_changed()
+
+        if metrics is not None:
+            metrics.evaluations += 1
+            metrics.evaluation.record(perf_counter() - started)
+            self._async_runtime_changed()
+        if profile is not None:
+            profile.evaluations += 1
+            profile.evaluation_seconds += perf_counter() - started
+
+    @callback
+    def _async_request_power(
+        self,
+        name: str,
+        actuator: SwitchActuator | EquipmentDemand | None,
+        needed: bool,
+        power: float,
+        deficit: float,
+        locked: bool,
+    ) -> bool:
+        """Return whether the power budget lets the heater or cooler run."""
+        if actuator is None or actuator.is_shared:
+            return needed
+        if not needed:
+            self._power_budget.async_release((self.entity_id, name))
+            return False
+        if locked:
+            # Held on by the cycle lock, it still counts against the budget
+            self._power_budget.async_hold(
+                (self.entity_id, name),
+                power,
+                self._priority,
+                deficit,
+                self.async_request_evaluation,
+            )
             return True
-        return False
+        return self._power_budget.async_request(
+            (self.entity_id, name),
+            power,
+            self._priority,
+            deficit,
+            self.async_request_evaluation,
+        )
 
-    async def _async_heater_on(self) -> bool:
-        if self._heater_switch_id is not None and self._is_heater_active is False:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_ON,
-                {ATTR_ENTITY_ID: self._heater_switch_id},
-                context=self._context,
-            )
+    def _state_snapshot(self) -> tuple:
+        """Return a compact snapshot of everything visible in the state."""
+        return (
+            self._state.current_temp,
+            self._state.preset,
+            *self._state.settings.as_tuple(),
+        )
 
-            self._is_heater_active = True
-            return True
-        return False
+    @callback
+    def async_write_settings(self) -> None:
+        """Write the state if the settings changed since the last write."""
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_write_state_if_changed(self, force: bool = False) -> None:
+        """Write the state only when something visible changed since the last write.
+
+        Forcing writes the state even if the snapshot is unchanged, for attributes
+        that aren't part of it.
+        """
+        snapshot = self._state_snapshot()
+        last_snapshot = self._state.last_written_snapshot
+        if snapshot == last_snapshot and not force:
+            return
 
-    async def _async_heater_off(self) -> bool:
-        if self._heater_switch_id is not None and self._is_heater_active is True:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_OFF,
-                {ATTR_ENTITY_ID: self._heater_switch_id},
-                context=self._context,
-            )
+        now = self._clock.now()
+
+        # Temperature only changes are throttled to the configured interval
+        if (
+            self._temp_write_interval is not None
+            and not force
+            and last_snapshot is not None
+            and snapshot[1:] == last_snapshot[1:]
+            and now - self._state.last_written_at < self._temp_write_interval
+        ):
+            if self._deferred_write_timer is None:
+                self._deferred_write_timer = self._timers.async_schedule(
+                    self._state.last_written_at + self._temp_write_interval,
+                    self._async_on_deferred_write,
+                )
+            return
 
-            self._is_heater_active = False
-            return True
-        return False
+        if self._deferred_write_timer is not None:
+            self._deferred_write_timer.cancel()
+            self._deferred_write_timer = None
 
-    async def _async_fan_on(self) -> bool:
-        if self._fan_switch_id is not None and self._is_fan_active is False:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_ON,
-                {ATTR_ENTITY_ID: self._fan_switch_id},
-                context=self._context,
+        self._state.last_written_snapshot = snapshot
+        self._state.last_written_at = now
+        self.async_write_ha_state()
+
+    @callback
+    def _async_on_deferred_write(self, _: datetime) -> None:
+        self._deferred_write_timer = None
+        self._async_write_state_if_changed()
+
+    def _create_actuator(
+        self, entity_id: str, name: str
+    ) -> SwitchActuator | EquipmentDemand:
+        if name != "damper":
+            # Switches used by several zones are driven by their combined demand
+            manager = async_get_equipment_manager(self.hass)
+            demand = manager.async_acquire(
+                entity_id,
+                self.entity_id,
+                self._cycle_delay,
+                self._actuator_timeout,
+                self._actuator_mode,
+                partial(self._async_on_switch_shared, name),
+            )
+            if demand is not None:
+                self.async_on_remove(demand.async_shutdown)
+                return demand
+            self.async_on_remove(
+                partial(manager.async_release, entity_id, self.entity_id)
             )
 
-            self._is_fan_active = True
-            return True
-        return False
+        actuator = SwitchActuator(
+            self.hass,
+            entity_id,
+            self._actuator_timeout,
+            self._actuator_mode,
+            self._metrics.actuator(name) if self._metrics is not None else None,
+        )
+        self.async_on_remove(actuator.async_shutdown)
+        self._switch_listeners[name] = async_get_dispatcher(self.hass).async_track(
+            [entity_id], getattr(self, f"_on_{name}_switch_changed")
+        )
+        return actuator
+
+    @callback
+    def _async_on_switch_shared(self, name: str, demand: EquipmentDemand) -> None:
+        """Follow the combined demand once another zone uses the same switch."""
+        self._switch_listeners.pop(name)()
+        if name == "heater":
+            previous, self._heater = self._heater, demand
+        elif name == "cooler":
+            previous, self._cooler = self._cooler, demand
+        else:
+            previous, self._fan = self._fan, demand
+        previous.async_shutdown()
+        self.async_on_remove(demand.async_shutdown)
+
+        # Carry the demand of the zone over to the shared switch
+        if self._state.is_initialized:
+            self._scheduler.async_schedule()
+
+    @callback
+    def _async_remove_switch_listeners(self) -> None:
+        for remove in self._switch_listeners.values():
+            remove()
+        self._switch_listeners.clear()
+
+    async def _async_set_actuator(
+        self, actuator: SwitchActuator | EquipmentDemand | None, active: bool
+    ) -> bool:
+        if actuator is None or actuator.async_needs(active) is False:
+            return False
+        return await actuator.async_turn(active, self._context)
+
+    async def _async_cooler_on(self) -> bool:
+        return await self._async_set_actuator(self._cooler, True)
+
+    async def _async_cooler_off(self) -> bool:
+        return await self._async_set_actuator(self._cooler, False)
+
+    async def _async_heater_on(self) -> bool:
+        return await self._async_set_actuator(self._heater, True)
+
+    async def _async_heater_off(self) -> bool:
+        return await self._async_set_actuator(self._heater, False)
+
+    async def _async_fan_on(self) -> bool:
+        return await self._async_set_actuator(self._fan, True)
 
     async def _async_fan_off(self) -> bool:
-        if self._fan_switch_id is not None and self._is_fan_active is True:
-            await self.hass.services.async_call(
-                HA_DOMAIN,
-                SERVICE_TURN_OFF,
-                {ATTR_ENTITY_ID: self._fan_switch_id},
-                context=self._context,
+        return await self._async_set_actuator(self._fan, False)
+
+    @callback
+    def async_set_profile(self, profile: ZoneProfile | None) -> None:
+        """Start or stop recording the time spent by the zone."""
+        self._profile = profile
+
+    @callback
+    def _async_on_temperature_changed(self, event: Event) -> None:
+        if (profile := self._profile) is not None:
+            started = perf_counter()
+
+        if (metrics := self._metrics) is not None:
+            metrics.temperature_events += 1
+
+        self._async_ingest_temperature(
+            event.data[ATTR_ENTITY_ID], event.data.get("new_state")
+        )
+
+        if profile is not None:
+            profile.callbacks += 1
+            profile.callback_seconds += perf_counter() - started
+
+    @callback
+    def _async_ingest_temperature(self, entity_id: str, state: State | None) -> None:
+        """Filter a reading, update the temperature and request an evaluation."""
+        if (value := self._async_read_temperature(entity_id, state)) is None:
+            # The sensor is left out until it reports a valid reading again
+            if self._temperature.has_reading(entity_id):
+                self._async_drop_sensor(entity_id)
+                self._async_apply_temperature()
+                self._scheduler.async_schedule()
+            return
+
+        if self._sensor_seen_at is not None:
+            self._sensor_seen_at[entity_id] = self._clock.now()
+            if self._stale_timer is None:
+                self._async_arm_stale_timer()
+
+        if self._temp_filters is not None:
+            value = self._temp_filters[entity_id].process(value)
+            if value is None:
+                return
+
+        self._temperature.update(entity_id, value)
+        self._async_apply_temperature()
+
+        if (metrics := self._metrics) is not None and metrics.pending_since is None:
+            metrics.pending_since = perf_counter()
+
+        if self._temp_evaluation_interval is None:
+            self._scheduler.async_schedule()
+            return
+
+        # At most one temperature driven evaluation per interval, the latest wins
+        if self._temp_evaluation_timer is not None:
+            self._rate_limited_count += 1
+            return
+
+        now = self._clock.now()
+        evaluated_at = self._state.temp_evaluated_at
+        if evaluated_at is None or now >= evaluated_at + self._temp_evaluation_interval:
+            self._state.temp_evaluated_at = now
+            self._scheduler.async_schedule()
+            return
+
+        self._rate_limited_count += 1
+        self._temp_evaluation_timer = self._timers.async_schedule(
+            evaluated_at + self._temp_evaluation_interval,
+            self._async_on_temp_evaluation_due,
+        )
+
+    @callback
+    def _async_read_temperature(
+        self, entity_id: str, state: State | None
+    ) -> float | None:
+        """Parse the state of a sensor, logging when it turns invalid or recovers."""
+        status, value = parse_temperature(state)
+        previous = self._sensor_status.get(entity_id, ReadingStatus.VALID)
+        if status != previous:
+            if status == ReadingStatus.VALID:
+                del self._sensor_status[entity_id]
+                _LOGGER.info("%s reports a valid temperature again", entity_id)
+            else:
+                self._sensor_status[entity_id] = status
+                _LOGGER.warning("%s has no valid temperature: %s", entity_id, status)
+        return value
+
+    @callback
+    def _async_apply_temperature(self) -> None:
+        """Use the aggregated temperature, or the fallback sensor without one."""
+        temperature = self._temperature.value
+        if temperature is None and self._stale_behavior == StaleBehavior.FALLBACK:
+            temperature = self._fallback_temp
+        self._state.current_temp = temperature
+
+    @callback
+    def _async_drop_sensor(self, entity_id: str) -> None:
+        self._temperature.update(entity_id, None)
+        if self._temp_filters is not None:
+            self._temp_filters[entity_id].reset()
+
+    @callback
+    def _async_arm_stale_timer(self) -> None:
+        """Wake up when the longest silent sensor that still counts becomes stale."""
+        seen_at = [
+            at
+            for entity_id, at in self._sensor_seen_at.items()
+            if self._temperature.has_reading(entity_id)
+        ]
+        self._stale_timer = (
+            self._timers.async_schedule(
+                min(seen_at) + self._stale_timeout, self._async_on_stale_check
             )
+            if seen_at
+            else None
+        )
 
-            self._is_fan_active = False
-            return True
-        return False
+    @callback
+    def _async_on_stale_check(self, now: datetime) -> None:
+        self._stale_timer = None
+        stale = [
+            entity_id
+            for entity_id, at in self._sensor_seen_at.items()
+            if now - at >= self._stale_timeout
+            and self._temperature.has_reading(entity_id)
+        ]
+        for entity_id in stale:
+            _LOGGER.warning(
+                "%s has not reported for %s, leaving it out",
+                entity_id,
+                self._stale_timeout,
+            )
+            self._async_drop_sensor(entity_id)
 
-    async def _async_on_temperature_changed(self, event: Event):
-        _LOGGER.debug("Temperature sensor updated")
+        if stale:
+            self._async_apply_temperature()
+            self._scheduler.async_schedule()
+        self._async_arm_stale_timer()
 
-        new_state = event.data.get("new_state")
-        self._current_temp = float(new_state.state)
-        await self.async_update()
-        self.async_write_ha_state()
+    @callback
+    def _async_on_fallback_temperature_changed(self, event: Event) -> None:
+        self._fallback_temp = self._async_read_temperature(
+            self._fallback_temp_sensor_id, event.data.get("new_state")
+        )
+        if self._temperature.value is None:
+            self._async_apply_temperature()
+            self._scheduler.async_schedule()
 
-    def _on_heater_switch_changed(self, event: Event) -> None:
-        new_state = event.data.get("new_state")
-        is_active = new_state.state == STATE_ON if new_state is not None else False
+    @callback
+    def _async_on_temp_evaluation_due(self, now: datetime) -> None:
+        self._temp_evaluation_timer = None
+        self._state.temp_evaluated_at = now
+        self._scheduler.async_schedule()
 
-        if is_active != self._is_heater_active:
+    @callback
+    def _on_heater_switch_changed(self, event: Event) -> None:
+        if self._heater.async_handle_state(event.data.get("new_state")):
             _LOGGER.debug(
                 "Heater switch changed and differs from current value, updating"
             )
-            self._is_heater_active = is_active
+            self._async_record_runtime()
 
+    @callback
     def _on_cooler_switch_changed(self, event: Event) -> None:
-        new_state = event.data.get("new_state")
-        is_active = new_state.state == STATE_ON if new_state is not None else False
-
-        if is_active != self._is_cooler_active:
+        if self._cooler.async_handle_state(event.data.get("new_state")):
             _LOGGER.debug(
                 "Cooler switch changed and differs from current value, updating"
             )
-            self._is_cooler_active = is_active
-
-    def _on_opening_entity_changed(self, event: Event) -> None:
-        new_state = event.data.get("new_state")
-        entity_id = event.data.get("entity_id")
-        is_open = (
-            new_state.state in [STATE_OPEN, STATE_ON]
-            if new_state is not None
-            else False
-        )
+            self._async_record_runtime()
 
-        if self._current_opening_states.get(entity_id, False) != is_open:
-            # If there's no delay on the openings or it's expired, create a new one
-            if self._is_openings_value_locked is False:
-                self._openings_locked_value = self._is_any_opening_open
-                self._openings_lock_expiry = (
-                    datetime.now(timezone.utc) + self._opening_delay
-                )
+    @callback
+    def _on_fan_switch_changed(self, event: Event) -> None:
+        if self._fan.async_handle_state(event.data.get("new_state")):
+            _LOGGER.debug("Fan switch changed and differs from current value, updating")
+
+    @callback
+    def _on_damper_switch_changed(self, event: Event) -> None:
+        if self._damper.async_handle_state(event.data.get("new_state")):
+            _LOGGER.debug(
+                "Damper switch changed and differs from current value, updating"
+            )
 
-            _LOGGER.debug("Opening %s changed to state %s", entity_id, is_open)
+    @callback
+    def _async_lock_cycle(self, expiry: datetime) -> None:
+        """Hold heating and cooling in their current state until the expiry."""
+        if self._cycle_lock_timer is not None:
+            self._cycle_lock_timer.cancel()
 
-            self._current_opening_states[entity_id] = is_open
-            self.async_write_ha_state()
+        self._state.cycle_lock_expiry = expiry
+        self._state.is_cycle_locked = True
+        self._cycle_lock_timer = self._timers.async_schedule(
+            expiry, self._async_on_cycle_lock_expired
+        )
+        self._async_runtime_changed()
+
+    @callback
+    def _async_on_cycle_lock_expired(self, _: datetime) -> None:
+        self._cycle_lock_timer = None
+        self._state.is_cycle_locked = False
+        self._scheduler.async_schedule()
+
+    @callback
+    def _async_lock_openings(self, value: bool, expiry: datetime) -> None:
+        """Hold the openings value until the expiry."""
+        if self._openings_lock_timer is not None:
+            self._openings_lock_timer.cancel()
+
+        self._state.openings_locked_value = value
+        self._state.openings_lock_expiry = expiry
+        self._state.is_openings_locked = True
+        self._openings_lock_timer = self._timers.async_schedule(
+            expiry, self._async_on_openings_lock_expired
+        )
+        self._async_runtime_changed()
+
+    @callback
+    def _async_on_openings_lock_expired(self, _: datetime) -> None:
+        self._openings_lock_timer = None
+        self._state.is_openings_locked = False
+        self._scheduler.async_schedule()
+
+    @callback
+    def _async_cancel_timers(self) -> None:
+        for handle in (
+            self._cycle_lock_timer,
+            self._openings_lock_timer,
+            self._deferred_write_timer,
+            self._temp_evaluation_timer,
+            self._stale_timer,
+        ):
+            if handle is not None:
+                handle.cancel()
+        self._cycle_lock_timer = None
+        self._openings_lock_timer = None
+        self._deferred_write_timer = None
+        self._temp_evaluation_timer = None
+        self._stale_timer = None
+
+    @callback
+    def _async_on_openings_changed(self, is_open: bool) -> None:
+        # If there's no delay on the openings or it's expired, create a new one
+        if self._state.is_openings_locked is False:
+            self._async_lock_openings(
+                not is_open, self._clock.now() + self._opening_delay
+            )
+
+        _LOGGER.debug("Openings changed to state %s", is_open)
 
     def _read_manual_settings(self, state: State) -> ClimateSettings:
         """Read the manually set values from the state into a ClimateSettings object."""
@@ -795,9 +1779,18 @@ class YetAnotherSmartThermostat(ClimateEntity, RestoreEntity):
         )
 
 
+def _parse_expiry(value: str | None, now: datetime) -> datetime | None:
+    """Return a stored lock expiry, None if there's none or it has passed."""
+    if value is None or (expiry := dt_util.parse_datetime(value)) is None:
+        return None
+    return expiry if expiry > now else None
+
+
 class ClimateSettings:
     """Class to store current and preset thermostat settings."""
 
+    __slots__ = ("temp_high", "temp_low", "hvac_mode", "fan_mode")
+
     temp_high: float
     temp_low: float
     hvac_mode: HVACMode
@@ -816,8 +1809,62 @@ class ClimateSettings:
         self.hvac_mode = hvac_mode
         self.fan_mode = fan_mode
 
+    def as_tuple(self) -> tuple[float, float, HVACMode, FanMode | None]:
+        """Return the settings as a tuple for cheap comparisons."""
+        return (self.temp_low, self.temp_high, self.hvac_mode, self.fan_mode)
+
     def clone(self) -> ClimateSettings:
         """Create a clone of the settings."""
         return ClimateSettings(
             self.temp_low, self.temp_high, self.hvac_mode, self.fan_mode
         )
+
+
+class ZoneState:
+    """Compact runtime state of a single zone.
+
+    Slotted so every zone only pays for its own fields.
+    """
+
+    __slots__ = (
+        "preset",
+        "settings",
+        "current_temp",
+        "is_initialized",
+        "is_cycle_locked",
+        "cycle_lock_expiry",
+        "is_openings_locked",
+        "openings_locked_value",
+        "openings_lock_expiry",
+        "last_written_snapshot",
+        "last_written_at",
+        "temp_evaluated_at",
+    )
+
+    preset: str | None
+    settings: ClimateSettings
+    current_temp: float | None
+    is_initialized: bool
+    is_cycle_locked: bool
+    cycle_lock_expiry: datetime | None
+    is_openings_locked: bool
+    openings_locked_value: bool | None
+    openings_lock_expiry: datetime | None
+    last_written_snapshot: tuple | None
+    last_written_at: datetime | None
+    temp_evaluated_at: datetime | None
+
+    def __init__(self, preset: str | None, settings: ClimateSettings) -> None:
+        """Initialize the state of a zone with the given preset and settings."""
+        self.preset = preset
+        self.settings = settings
+        self.current_temp = None
+        self.is_initialized = False
+        self.is_cycle_locked = False
+        self.cycle_lock_expiry = None
+        self.is_openings_locked = False
+        self.openings_locked_value = None
+        self.openings_lock_expiry = None
+        self.last_written_snapshot = None
+        self.last_written_at = None
+        self.temp_evaluated_at = None
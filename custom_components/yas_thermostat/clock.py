@@ -0,0 +1,51 @@
+"""Clock used by YAS Thermostat zones to read the time and schedule wakeups."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_CLOCK, DOMAIN
+
+ClockAction = Callable[[datetime], None]
+
+
+class Clock:
+    """Wall clock backed by Home Assistant.
+
+    Everything time related in the zones goes through the clock, so it can be
+    replaced by a virtual one that replays recorded traces faster than real time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the Clock class."""
+        self._hass = hass
+
+    def now(self) -> datetime:
+        """Return the current time in UTC."""
+        return dt_util.utcnow()
+
+    @callback
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        """Call the action with the current time once the point in time is reached."""
+        return async_track_point_in_utc_time(self._hass, action, when)
+
+    @callback
+    def async_call_later(self, delay: timedelta, action: ClockAction) -> CALLBACK_TYPE:
+        """Call the action with the current time once the delay has passed."""
+        return self.async_track_point_in_time(action, self.now() + delay)
+
+
+@callback
+def async_get_clock(hass: HomeAssistant) -> Clock:
+    """Return the clock shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (clock := domain_data.get(DATA_CLOCK)) is None:
+        clock = domain_data[DATA_CLOCK] = Clock(hass)
+    return clock
@@ -1,11 +1,39 @@
 """YetAnotherSmartThermostat Constants."""
 from homeassistant.backports.enum import StrEnum
 
+DOMAIN = "yas_thermostat"
+
+# Keys for shared platform data stored in hass.data[DOMAIN]
+DATA_DISPATCHER = "dispatcher"
+DATA_ZONES = "zones"
+DATA_TIMERS = "timers"
+DATA_OPENINGS = "openings"
+DATA_CLOCK = "clock"
+DATA_PROFILER = "profiler"
+DATA_STARTUP = "startup"
+DATA_SCHEDULE = "schedule"
+DATA_RECONCILER = "reconciler"
+DATA_EQUIPMENT = "equipment"
+DATA_RUNTIME_STORE = "runtime_store"
+
+# Key of the zones in the discovery info of the diagnostic sensors
+DISCOVERY_ZONES = "zones"
+
 # Config attribute names
 ATTR_HEATER_SWITCH = "heater_switch"
 ATTR_COOLER_SWITCH = "cooler_switch"
 ATTR_FAN_SWITCH = "fan_switch"
+ATTR_DAMPER_SWITCH = "damper_switch"
 ATTR_TEMP_SENSOR = "temp_sensor"
+ATTR_TEMP_AGGREGATION = "temp_aggregation"
+ATTR_TEMP_OUTLIER_THRESHOLD = "temp_outlier_threshold"
+ATTR_WEIGHT = "weight"
+ATTR_TEMP_DEADBAND = "temp_deadband"
+ATTR_TEMP_SMOOTHING = "temp_smoothing"
+ATTR_TEMP_EVALUATION_INTERVAL = "temp_evaluation_interval"
+ATTR_STALE_TIMEOUT = "stale_timeout"
+ATTR_STALE_BEHAVIOR = "stale_behavior"
+ATTR_FALLBACK_TEMP_SENSOR = "fallback_temp_sensor"
 ATTR_DEFAULT_PRESET = "default_preset"
 ATTR_CYCLE_DELAY = "cycle_delay"
 ATTR_OPENING_DELAY = "opening_delay"
@@ -14,6 +42,24 @@ ATTR_TEMP_STEP = "temp_step"
 ATTR_OPENING_ENTITIES = "openings"
 ATTR_DEFAULT_HVAC_MODE = "default_hvac_mode"
 ATTR_DEFAULT_FAN_MODE = "default_fan_mode"
+ATTR_THERMOSTATS = "thermostats"
+ATTR_ACTUATOR_TIMEOUT = "actuator_timeout"
+ATTR_ACTUATOR_MODE = "actuator_mode"
+ATTR_TEMP_WRITE_INTERVAL = "temp_write_interval"
+ATTR_METRICS = "metrics"
+ATTR_RUNTIME_STATS = "runtime_stats"
+ATTR_TRACE_SIZE = "trace_size"
+ATTR_SCHEDULE = "schedule"
+ATTR_DAYS = "days"
+ATTR_AT = "at"
+ATTR_PRIORITY = "priority"
+ATTR_HEATER_POWER = "heater_power"
+ATTR_COOLER_POWER = "cooler_power"
+ATTR_POWER_BUDGET = "power_budget"
+ATTR_MAX_ACTIVE = "max_active"
+ATTR_MAX_POWER = "max_power"
+ATTR_BUDGET_STRATEGY = "strategy"
+ATTR_ROTATION_INTERVAL = "rotation_interval"
 
 # State Attribute names
 ATTR_MANUAL_FAN_MODE = "manual_fan_mode"
@@ -21,6 +67,8 @@ ATTR_MANUAL_HVAC_MODE = "manual_hvac_mode"
 ATTR_MANUAL_TEMP_LOW = "manual_temp_low"
 ATTR_MANUAL_TEMP_HIGH = "manual_temp_high"
 ATTR_LAST_CYCLE = "last_cycle"
+ATTR_HEATER_STATS = "heater_stats"
+ATTR_COOLER_STATS = "cooler_stats"
 
 
 class FanMode(StrEnum):
@@ -29,3 +77,45 @@ class FanMode(StrEnum):
     OFF = "off"
     ON = "on"
     AUTO = "auto"
+
+
+class TempAggregation(StrEnum):
+    """How the readings of several temperature sensors are combined."""
+
+    MEAN = "mean"
+    WEIGHTED = "weighted"
+    MEDIAN = "median"
+    MIN = "min"
+    MAX = "max"
+
+
+class ReadingStatus(StrEnum):
+    """How the state of a temperature sensor was classified."""
+
+    VALID = "valid"
+    MISSING = "missing"
+    UNAVAILABLE = "unavailable"
+    UNKNOWN = "unknown"
+    INVALID = "invalid"
+
+
+class StaleBehavior(StrEnum):
+    """What a zone does while it has no valid temperature."""
+
+    HOLD = "hold"
+    OFF = "off"
+    FALLBACK = "fallback"
+
+
+class ActuatorMode(StrEnum):
+    """How commands sent to the switches are confirmed."""
+
+    WAIT = "wait"
+    CONFIRM = "confirm"
+
+
+class BudgetStrategy(StrEnum):
+    """The order in which the power budget serves waiting heaters and coolers."""
+
+    PRIORITY = "priority"
+    DEFICIT = "deficit"
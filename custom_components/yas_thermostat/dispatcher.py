@@ -0,0 +1,98 @@
+"""Shared state change dispatcher for YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
+
+from .const import DATA_DISPATCHER, DOMAIN
+
+StateChangeAction = Callable[[Event], Coroutine[Any, Any, None] | None]
+
+
+class StateChangeDispatcher:
+    """Route state changes for every zone through a single bus listener.
+
+    Each source entity is indexed to the jobs of the zones interested in it, so an
+    entity shared between zones is tracked once and each state change is only
+    delivered to the zones that care about it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the StateChangeDispatcher class."""
+        self._hass = hass
+        self._jobs: dict[str, list[HassJob]] = {}
+        self._unsubscribe: CALLBACK_TYPE | None = None
+
+    @property
+    def tracked_entity_ids(self) -> set[str]:
+        """Return the entity IDs that currently have at least one subscriber."""
+        return set(self._jobs)
+
+    @callback
+    def async_track(
+        self, entity_ids: Iterable[str], action: StateChangeAction
+    ) -> CALLBACK_TYPE:
+        """Deliver state changes of the given entities to the action."""
+        job = HassJob(action)
+        tracked_ids = list(dict.fromkeys(entity_ids))
+
+        for entity_id in tracked_ids:
+            self._jobs.setdefault(entity_id, []).append(job)
+
+        if self._unsubscribe is None and self._jobs:
+            self._unsubscribe = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_dispatch,
+                event_filter=self._async_filter,
+            )
+
+        @callback
+        def _async_remove() -> None:
+            for entity_id in tracked_ids:
+                jobs = self._jobs.get(entity_id)
+                if jobs is None:
+                    continue
+                if job in jobs:
+                    jobs.remove(job)
+                if not jobs:
+                    del self._jobs[entity_id]
+
+            if not self._jobs and self._unsubscribe is not None:
+                self._unsubscribe()
+                self._unsubscribe = None
+
+        return _async_remove
+
+    @callback
+    def _async_filter(self, event: Event) -> bool:
+        """Only let through events for entities that have a subscriber."""
+        return event.data.get(ATTR_ENTITY_ID) in self._jobs
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        """Deliver the event to every job subscribed to its entity."""
+        jobs = self._jobs.get(event.data.get(ATTR_ENTITY_ID))
+        if not jobs:
+            return
+
+        # Copy the list so a subscriber can unsubscribe while being called
+        for job in list(jobs):
+            self._hass.async_run_hass_job(job, event)
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> StateChangeDispatcher:
+    """Return the dispatcher shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (dispatcher := domain_data.get(DATA_DISPATCHER)) is None:
+        dispatcher = domain_data[DATA_DISPATCHER] = StateChangeDispatcher(hass)
+    return dispatcher
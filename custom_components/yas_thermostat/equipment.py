@@ -0,0 +1,271 @@
+"""Equipment shared by several YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+from typing import Any, NamedTuple
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    callback,
+)
+
+from .actuator import SwitchActuator
+from .clock import async_get_clock
+from .const import DATA_EQUIPMENT, DOMAIN, ActuatorMode
+from .dispatcher import async_get_dispatcher
+from .timer import TimerHandle, async_get_timer_heap
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SharedSwitch:
+    """A switch, like a furnace or compressor, that is on while any zone demands it.
+
+    Demand is counted per zone and the switch only gets a command when the total
+    demand turns on or off. The cycle delay applies to the switch itself, the
+    longest one of its zones, and demand changes during it are applied once it
+    expires.
+    """
+
+    def __init__(
+        self,
+        manager: EquipmentManager,
+        entity_id: str,
+        timeout: timedelta,
+        mode: ActuatorMode,
+    ) -> None:
+        """Initialize a new instance of the SharedSwitch class."""
+        self._manager = manager
+        self._hass = manager.hass
+        self.actuator = SwitchActuator(self._hass, entity_id, timeout, mode)
+        self.demand: set[str] = set()
+        self.cycle_delays: dict[str, timedelta] = {}
+        self.locked_until: datetime | None = None
+        self._lock_timer: TimerHandle | None = None
+        self._remove_listener: CALLBACK_TYPE = async_get_dispatcher(
+            self._hass
+        ).async_track([entity_id], self._async_on_switch_changed)
+        # A single zone may have driven the switch until now
+        self.actuator.async_handle_state(self._hass.states.get(entity_id))
+
+    @property
+    def entity_id(self) -> str:
+        """Return the ID of the switch."""
+        return self.actuator.entity_id
+
+    @property
+    def is_locked(self) -> bool:
+        """Return whether the switch is waiting for its cycle delay."""
+        return self._lock_timer is not None
+
+    @property
+    def needs_command(self) -> bool:
+        """Return whether the switch can and should follow the total demand."""
+        return not self.is_locked and self.actuator.async_needs(bool(self.demand))
+
+    async def async_set_demand(
+        self, zone_id: str, active: bool, context: Context | None
+    ) -> bool:
+        """Update the demand of a zone, returns whether the switch got a command."""
+        if active:
+            self.demand.add(zone_id)
+        else:
+            self.demand.discard(zone_id)
+        return await self._async_apply(context)
+
+    @callback
+    def async_release(self, zone_id: str) -> None:
+        """Remove a zone, shutting the switch down once no zone uses it."""
+        self.demand.discard(zone_id)
+        self.cycle_delays.pop(zone_id, None)
+        if self.cycle_delays:
+            self._hass.async_create_task(self._async_apply(None))
+            return
+
+        self._remove_listener()
+        if self._lock_timer is not None:
+            self._lock_timer.cancel()
+            self._lock_timer = None
+        self.actuator.async_shutdown()
+        self._manager.async_remove(self.entity_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the switch and which zones demand it."""
+        return {
+            **self.actuator.as_dict(),
+            "demand": sorted(self.demand),
+            "zones": len(self.cycle_delays),
+            "locked_until": self.locked_until if self.is_locked else None,
+        }
+
+    async def _async_apply(self, context: Context | None) -> bool:
+        if not self.needs_command:
+            return False
+
+        active = bool(self.demand)
+        _LOGGER.debug(
+            "Turning shared %s %s for %s zones",
+            self.entity_id,
+            "on" if active else "off",
+            len(self.demand),
+        )
+        if not await self.actuator.async_turn(active, context):
+            return False
+
+        self.locked_until = self._manager.clock.now() + max(
+            self.cycle_delays.values(), default=timedelta()
+        )
+        self._lock_timer = self._manager.timers.async_schedule(
+            self.locked_until, self._async_on_lock_expired
+        )
+        return True
+
+    @callback
+    def _async_on_lock_expired(self, _: datetime) -> None:
+        self._lock_timer = None
+        if self.needs_command:
+            self._hass.async_create_task(self._async_apply(None))
+
+    @callback
+    def _async_on_switch_changed(self, event: Event) -> None:
+        self.actuator.async_handle_state(event.data.get("new_state"))
+
+
+class EquipmentDemand:
+    """The demand of one zone on a shared switch.
+
+    Offers the same interface as a SwitchActuator, so a zone drives shared equipment
+    like its own switches, except that the zone's cycle lock doesn't apply to it.
+    """
+
+    is_shared = True
+
+    def __init__(self, switch: SharedSwitch, zone_id: str) -> None:
+        """Initialize a new instance of the EquipmentDemand class."""
+        self._switch = switch
+        self._zone_id = zone_id
+
+    @property
+    def entity_id(self) -> str:
+        """Return the ID of the shared switch."""
+        return self._switch.entity_id
+
+    @property
+    def target(self) -> bool:
+        """Return whether the zone demands the switch."""
+        return self._zone_id in self._switch.demand
+
+    @property
+    def is_active(self) -> bool:
+        """Return whether the switch is on for the zone."""
+        return self.target and self._switch.actuator.is_active
+
+    @callback
+    def async_needs(self, active: bool) -> bool:
+        """Return whether the demand changes, or the switch should follow it."""
+        return self.target != active or self._switch.needs_command
+
+    @callback
+    def async_handle_state(self, state: State | None) -> bool:
+        """Update the switch from a state, like the snapshot read at startup."""
+        return self._switch.actuator.async_handle_state(state)
+
+    async def async_turn(self, active: bool, context: Context | None) -> bool:
+        """Set the demand of the zone, returns whether the switch got a command."""
+        return await self._switch.async_set_demand(self._zone_id, active, context)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Withdraw the zone from the switch."""
+        self._switch.async_release(self._zone_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the shared switch."""
+        return self._switch.as_dict()
+
+
+class _Owner(NamedTuple):
+    """The only zone using a switch so far."""
+
+    zone_id: str
+    cycle_delay: timedelta
+    on_shared: Callable[[EquipmentDemand], None]
+
+
+class EquipmentManager:
+    """The switches of all zones, shared once a second zone uses one.
+
+    Every zone acquires its heater, cooler and fan switches here, whichever platform
+    entry it comes from. A switch used by one zone stays with that zone, the second
+    zone to acquire it turns it into a SharedSwitch for both of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the EquipmentManager class."""
+        self.hass = hass
+        self.clock = async_get_clock(hass)
+        self.timers = async_get_timer_heap(hass)
+        self._switches: dict[str, SharedSwitch] = {}
+        self._owners: dict[str, _Owner] = {}
+
+    @callback
+    def async_acquire(
+        self,
+        entity_id: str,
+        zone_id: str,
+        cycle_delay: timedelta,
+        timeout: timedelta,
+        mode: ActuatorMode,
+        on_shared: Callable[[EquipmentDemand], None],
+    ) -> EquipmentDemand | None:
+        """Return the demand of a zone on a shared switch, None if it's the only user.
+
+        When the switch becomes shared, the zone that used it alone until then gets
+        its demand through its on_shared callback.
+        """
+        if (switch := self._switches.get(entity_id)) is None:
+            owner = self._owners.get(entity_id)
+            if owner is None or owner.zone_id == zone_id:
+                self._owners[entity_id] = _Owner(zone_id, cycle_delay, on_shared)
+                return None
+
+            _LOGGER.debug("%s is used by several zones, sharing it", entity_id)
+            del self._owners[entity_id]
+            switch = self._switches[entity_id] = SharedSwitch(
+                self, entity_id, timeout, mode
+            )
+            switch.cycle_delays[owner.zone_id] = owner.cycle_delay
+            switch.cycle_delays[zone_id] = cycle_delay
+            owner.on_shared(EquipmentDemand(switch, owner.zone_id))
+            return EquipmentDemand(switch, zone_id)
+
+        switch.cycle_delays[zone_id] = cycle_delay
+        return EquipmentDemand(switch, zone_id)
+
+    @callback
+    def async_release(self, entity_id: str, zone_id: str) -> None:
+        """Forget a zone that used a switch alone."""
+        if (owner := self._owners.get(entity_id)) is not None and (
+            owner.zone_id == zone_id
+        ):
+            del self._owners[entity_id]
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Forget a switch that no zone uses anymore."""
+        self._switches.pop(entity_id, None)
+
+
+@callback
+def async_get_equipment_manager(hass: HomeAssistant) -> EquipmentManager:
+    """Return the equipment manager shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (manager := domain_data.get(DATA_EQUIPMENT)) is None:
+        manager = domain_data[DATA_EQUIPMENT] = EquipmentManager(hass)
+    return manager
@@ -0,0 +1,93 @@
+"""Ingestion filter for the temperature sensors of YAS Thermostat zones."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import State
+
+from .const import ReadingStatus
+
+
+def parse_temperature(state: State | None) -> tuple[ReadingStatus, float | None]:
+    """Classify the state of a temperature sensor and return its value if valid."""
+    if state is None:
+        return ReadingStatus.MISSING, None
+    if state.state == STATE_UNAVAILABLE:
+        return ReadingStatus.UNAVAILABLE, None
+    if state.state == STATE_UNKNOWN:
+        return ReadingStatus.UNKNOWN, None
+    try:
+        value = float(state.state)
+    except ValueError:
+        return ReadingStatus.INVALID, None
+    if not math.isfinite(value):
+        return ReadingStatus.INVALID, None
+    return ReadingStatus.VALID, value
+
+
+class SensorFilter:
+    """Smooths the readings of a sensor and absorbs changes inside the deadband.
+
+    Readings go through an exponential moving average first. The smoothed value is
+    only forwarded once it moved at least the deadband away from the value that was
+    last forwarded, everything else is absorbed.
+    """
+
+    __slots__ = (
+        "_smoothing",
+        "_deadband",
+        "_value",
+        "_forwarded_value",
+        "received",
+        "forwarded",
+    )
+
+    def __init__(self, smoothing: float = 1.0, deadband: float = 0.0) -> None:
+        """Initialize a new instance of the SensorFilter class."""
+        self._smoothing = smoothing
+        self._deadband = deadband
+        self._value: float | None = None
+        self._forwarded_value: float | None = None
+        self.received = 0
+        self.forwarded = 0
+
+    @property
+    def absorbed(self) -> int:
+        """Return the number of readings that weren't forwarded."""
+        return self.received - self.forwarded
+
+    def process(self, reading: float) -> float | None:
+        """Return the value to forward for a reading, None when it is absorbed."""
+        self.received += 1
+
+        if self._value is None:
+            value = reading
+        else:
+            value = self._value + self._smoothing * (reading - self._value)
+        self._value = value
+
+        if (
+            self._forwarded_value is not None
+            and abs(value - self._forwarded_value) < self._deadband
+        ):
+            return None
+
+        self._forwarded_value = value
+        self.forwarded += 1
+        return value
+
+    def reset(self) -> None:
+        """Forget the smoothed value, the next reading is forwarded as is."""
+        self._value = None
+        self._forwarded_value = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters of the sensor."""
+        return {
+            "received": self.received,
+            "forwarded": self.forwarded,
+            "absorbed": self.absorbed,
+            "value": self._value,
+        }
@@ -0,0 +1,145 @@
+"""Hot path metrics of YAS Thermostat zones."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the latency buckets in milliseconds, the last bucket is unbounded
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Latencies counted in fixed buckets, recording one is a bisect and an add."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the LatencyHistogram class."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record a latency given in seconds."""
+        milliseconds = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        if milliseconds > self.max:
+            self.max = milliseconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram with the buckets keyed by their upper bound."""
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else None,
+            "max_ms": self.max if self.count else None,
+            "buckets_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)
+                },
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class ActuatorMetrics:
+    """Commands sent to a switch and how it answered them."""
+
+    __slots__ = ("response", "commands", "collapsed", "failures", "timeouts")
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the ActuatorMetrics class."""
+        self.response = LatencyHistogram()
+        self.commands = 0
+        # Queued commands replaced by a later one, or made moot, before being sent
+        self.collapsed = 0
+        self.failures = 0
+        self.timeouts = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of the switch."""
+        return {
+            "commands": self.commands,
+            "collapsed": self.collapsed,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "response": self.response.as_dict(),
+        }
+
+    def counters(self) -> dict[str, int]:
+        """Return the counters that are kept across restarts."""
+        return {
+            "commands": self.commands,
+            "collapsed": self.collapsed,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+        }
+
+    def restore_counters(self, counters: dict[str, int]) -> None:
+        """Continue counting from stored counters."""
+        self.commands = counters.get("commands", 0)
+        self.collapsed = counters.get("collapsed", 0)
+        self.failures = counters.get("failures", 0)
+        self.timeouts = counters.get("timeouts", 0)
+
+
+class ZoneMetrics:
+    """Metrics of a zone, only created when the zone has metrics enabled."""
+
+    __slots__ = (
+        "temperature_events",
+        "evaluations",
+        "evaluation",
+        "decision",
+        "pending_since",
+        "actuators",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the ZoneMetrics class."""
+        self.temperature_events = 0
+        self.evaluations = 0
+        # Time spent evaluating and from a temperature event to the commands it caused
+        self.evaluation = LatencyHistogram()
+        self.decision = LatencyHistogram()
+        # When the oldest temperature event not yet evaluated arrived
+        self.pending_since: float | None = None
+        self.actuators: dict[str, ActuatorMetrics] = {}
+
+    def actuator(self, name: str) -> ActuatorMetrics:
+        """Return the metrics of an actuator, creating them if needed."""
+        if (metrics := self.actuators.get(name)) is None:
+            metrics = self.actuators[name] = ActuatorMetrics()
+        return metrics
+
+    def counters(self) -> dict[str, Any]:
+        """Return the counters that are kept across restarts, latencies aren't."""
+        return {
+            "temperature_events": self.temperature_events,
+            "evaluations": self.evaluations,
+            "actuators": {
+                name: metrics.counters() for name, metrics in self.actuators.items()
+            },
+        }
+
+    def restore_counters(self, counters: dict[str, Any]) -> None:
+        """Continue counting from stored counters."""
+        self.temperature_events = counters.get("temperature_events", 0)
+        self.evaluations = counters.get("evaluations", 0)
+        for name, actuator_counters in counters.get("actuators", {}).items():
+            self.actuator(name).restore_counters(actuator_counters)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of the zone."""
+        return {
+            "temperature_events": self.temperature_events,
+            "evaluations": self.evaluations,
+            "evaluation": self.evaluation.as_dict(),
+            "decision": self.decision.as_dict(),
+            "actuators": {
+                name: metrics.as_dict() for name, metrics in self.actuators.items()
+            },
+        }
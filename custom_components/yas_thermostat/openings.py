@@ -0,0 +1,162 @@
+"""Shared index of openings for YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, STATE_ON, STATE_OPEN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+
+from .const import DATA_OPENINGS, DOMAIN
+from .dispatcher import async_get_dispatcher
+
+OpeningListener = Callable[[bool], None]
+
+
+def is_opening_open(state: State | None) -> bool:
+    """Return whether the state of an opening entity means it is open."""
+    return state is not None and state.state in (STATE_OPEN, STATE_ON)
+
+
+class OpeningGroup:
+    """A set of openings shared by one or more zones.
+
+    The group keeps a count of its open members, so whether any of them is open is
+    answered in constant time.
+    """
+
+    __slots__ = ("entity_ids", "open_count", "listeners")
+
+    def __init__(self, entity_ids: frozenset[str]) -> None:
+        """Initialize a new instance of the OpeningGroup class."""
+        self.entity_ids = entity_ids
+        self.open_count = 0
+        self.listeners: list[OpeningListener] = []
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether any opening in the group is open."""
+        return self.open_count > 0
+
+
+class OpeningIndex:
+    """Tracks every opening once and keeps the open count of each group current.
+
+    Zones with the same openings share a group. A single opening event updates the
+    counts of every group it belongs to and notifies the zones of the groups whose
+    open state flipped, all in one pass.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the OpeningIndex class."""
+        self._hass = hass
+        self._states: dict[str, bool] = {}
+        self._groups: dict[frozenset[str], OpeningGroup] = {}
+        self._entity_groups: dict[str, list[OpeningGroup]] = {}
+        self._unsubscribes: dict[str, CALLBACK_TYPE] = {}
+        # Openings tracked before their state was read from a startup snapshot
+        self._unseeded: set[str] = set()
+
+    @property
+    def group_count(self) -> int:
+        """Return the number of distinct opening groups."""
+        return len(self._groups)
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: Iterable[str], listener: OpeningListener
+    ) -> tuple[OpeningGroup, CALLBACK_TYPE]:
+        """Join the group for the openings and get notified when it opens or closes."""
+        key = frozenset(entity_ids)
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = self._async_create_group(key)
+
+        group.listeners.append(listener)
+
+        @callback
+        def _async_remove() -> None:
+            if listener in group.listeners:
+                group.listeners.remove(listener)
+            if not group.listeners and self._groups.get(key) is group:
+                self._async_remove_group(group)
+
+        return group, _async_remove
+
+    @callback
+    def async_seed(self, states: Mapping[str, State | None]) -> None:
+        """Read the openings that weren't read yet from a snapshot of states.
+
+        Zones are seeded before they start, so no listener is notified.
+        """
+        for entity_id in self._unseeded.intersection(states):
+            self._unseeded.discard(entity_id)
+            is_open = is_opening_open(states[entity_id])
+            if self._states[entity_id] == is_open:
+                continue
+
+            self._states[entity_id] = is_open
+            delta = 1 if is_open else -1
+            for group in self._entity_groups[entity_id]:
+                group.open_count += delta
+
+    @callback
+    def _async_create_group(self, entity_ids: frozenset[str]) -> OpeningGroup:
+        group = OpeningGroup(entity_ids)
+        dispatcher = async_get_dispatcher(self._hass)
+
+        for entity_id in entity_ids:
+            if entity_id not in self._entity_groups:
+                self._entity_groups[entity_id] = []
+                # Counted as closed until the startup snapshot or an event says otherwise
+                self._states[entity_id] = False
+                self._unseeded.add(entity_id)
+                self._unsubscribes[entity_id] = dispatcher.async_track(
+                    [entity_id], self._async_on_opening_changed
+                )
+
+            self._entity_groups[entity_id].append(group)
+            if self._states[entity_id]:
+                group.open_count += 1
+
+        return group
+
+    @callback
+    def _async_remove_group(self, group: OpeningGroup) -> None:
+        del self._groups[group.entity_ids]
+
+        for entity_id in group.entity_ids:
+            groups = self._entity_groups[entity_id]
+            groups.remove(group)
+            if not groups:
+                del self._entity_groups[entity_id]
+                del self._states[entity_id]
+                self._unseeded.discard(entity_id)
+                self._unsubscribes.pop(entity_id)()
+
+    @callback
+    def _async_on_opening_changed(self, event: Event) -> None:
+        entity_id: str = event.data[ATTR_ENTITY_ID]
+        is_open = is_opening_open(event.data.get("new_state"))
+        self._unseeded.discard(entity_id)
+
+        if self._states.get(entity_id, is_open) == is_open:
+            return
+
+        self._states[entity_id] = is_open
+        delta = 1 if is_open else -1
+
+        for group in self._entity_groups.get(entity_id, ()):
+            was_open = group.is_open
+            group.open_count += delta
+            if group.is_open != was_open:
+                for listener in list(group.listeners):
+                    listener(group.is_open)
+
+
+@callback
+def async_get_opening_index(hass: HomeAssistant) -> OpeningIndex:
+    """Return the opening index shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (index := domain_data.get(DATA_OPENINGS)) is None:
+        index = domain_data[DATA_OPENINGS] = OpeningIndex(hass)
+    return index
@@ -0,0 +1,176 @@
+"""On demand profiling of YAS Thermostat zones."""
+from __future__ import annotations
+
+import cProfile
+from datetime import datetime, timedelta
+import io
+import logging
+import os
+import pstats
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.util.json import save_json
+
+from .clock import async_get_clock
+from .const import DATA_PROFILER, DOMAIN
+
+if TYPE_CHECKING:
+    from .climate import YetAnotherSmartThermostat
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_FILENAME = "yas_thermostat_profile_{}.prof"
+SUMMARY_FILENAME = "yas_thermostat_profile_{}.json"
+
+# Number of integration functions listed in the summary
+TOP_FUNCTIONS = 25
+
+
+class ZoneProfile:
+    """Time spent by a zone while a profile is running."""
+
+    __slots__ = ("evaluations", "evaluation_seconds", "callbacks", "callback_seconds")
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the ZoneProfile class."""
+        self.evaluations = 0
+        self.evaluation_seconds = 0.0
+        self.callbacks = 0
+        self.callback_seconds = 0.0
+
+    def as_dict(self, duration: float) -> dict[str, Any]:
+        """Return the cost of the zone, with its share of the profiled duration."""
+        total = self.evaluation_seconds + self.callback_seconds
+        return {
+            "evaluations": self.evaluations,
+            "evaluation_ms": self.evaluation_seconds * 1000,
+            "callbacks": self.callbacks,
+            "callback_ms": self.callback_seconds * 1000,
+            "total_ms": total * 1000,
+            "loop_share": total / duration if duration else None,
+        }
+
+
+class ZoneProfiler:
+    """Profiles the event loop and the selected zones for a limited time.
+
+    Only one profile runs at a time. It stops on its own once the duration passed
+    and writes a cProfile file and a per-zone cost summary to the config directory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the ZoneProfiler class."""
+        self._hass = hass
+        self._profiler: cProfile.Profile | None = None
+        self._zones: dict[str, tuple[YetAnotherSmartThermostat, ZoneProfile]] = {}
+        self._started_at: datetime | None = None
+        self._cancel_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return whether a profile is running."""
+        return self._profiler is not None
+
+    @callback
+    def async_start(
+        self, zones: list[YetAnotherSmartThermostat], duration: timedelta
+    ) -> None:
+        """Start profiling the zones for the duration."""
+        if self.is_running:
+            raise HomeAssistantError("A profile is already running")
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Unable to start profiling: {err}") from err
+
+        clock = async_get_clock(self._hass)
+        self._profiler = profiler
+        self._started_at = clock.now()
+        for zone in zones:
+            profile = ZoneProfile()
+            zone.async_set_profile(profile)
+            self._zones[zone.entity_id] = (zone, profile)
+
+        self._cancel_stop = clock.async_call_later(duration, self._async_stop)
+        _LOGGER.info("Profiling %s zones for %s", len(zones), duration)
+
+    @callback
+    def _async_detach(self) -> dict[str, ZoneProfile]:
+        profiles = {}
+        for entity_id, (zone, profile) in self._zones.items():
+            zone.async_set_profile(None)
+            profiles[entity_id] = profile
+        self._zones = {}
+        return profiles
+
+    @callback
+    def _async_stop(self, now: datetime) -> None:
+        self._cancel_stop = None
+        profiler, self._profiler = self._profiler, None
+        if profiler is None:
+            return
+        profiler.disable()
+
+        duration = (now - self._started_at).total_seconds()
+        summary = {
+            "started_at": self._started_at,
+            "duration_s": duration,
+            "zones": {
+                entity_id: profile.as_dict(duration)
+                for entity_id, profile in self._async_detach().items()
+            },
+        }
+        suffix = self._started_at.strftime("%Y%m%d_%H%M%S")
+        self._hass.async_create_task(
+            self._hass.async_add_executor_job(
+                _write_profile,
+                profiler,
+                summary,
+                self._hass.config.path(PROFILE_FILENAME.format(suffix)),
+                self._hass.config.path(SUMMARY_FILENAME.format(suffix)),
+            )
+        )
+
+
+def _write_profile(
+    profiler: cProfile.Profile,
+    summary: dict[str, Any],
+    profile_path: str,
+    summary_path: str,
+) -> None:
+    """Write the profile and the summary with the costliest integration functions."""
+    profiler.dump_stats(profile_path)
+
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    package = os.path.dirname(__file__)
+    functions = [
+        {
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": calls,
+            "own_ms": own * 1000,
+            "cumulative_ms": cumulative * 1000,
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in (
+            stats.stats.items()  # type: ignore[attr-defined]
+        )
+        if filename.startswith(package)
+    ]
+    functions.sort(key=lambda function: function["cumulative_ms"], reverse=True)
+    summary["functions"] = functions[:TOP_FUNCTIONS]
+
+    save_json(summary_path, summary, encoder=JSONEncoder)
+    _LOGGER.info("Wrote profile to %s and summary to %s", profile_path, summary_path)
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> ZoneProfiler:
+    """Return the profiler shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (profiler := domain_data.get(DATA_PROFILER)) is None:
+        profiler = domain_data[DATA_PROFILER] = ZoneProfiler(hass)
+    return profiler
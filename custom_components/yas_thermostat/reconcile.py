@@ -0,0 +1,146 @@
+"""Reconciliation of the switches driven by YAS Thermostat zones."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+
+from .clock import async_get_clock
+from .const import DATA_RECONCILER, DOMAIN
+from .timer import TimerHandle, async_get_timer_heap
+
+if TYPE_CHECKING:
+    from .actuator import SwitchActuator
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_RETRY_DELAY = timedelta(seconds=15)
+MAX_RETRY_DELAY = timedelta(minutes=10)
+# Retries before a switch is reported as unresponsive and left alone
+MAX_RETRIES = 6
+
+ISSUE_UNRESPONSIVE_SWITCH = "unresponsive_switch"
+
+
+class _Retry:
+    """Backoff of a switch that doesn't report the state it was commanded to."""
+
+    __slots__ = ("attempts", "handle")
+
+    def __init__(self) -> None:
+        """Initialize a new instance of the _Retry class."""
+        self.attempts = 0
+        self.handle: TimerHandle | None = None
+
+
+class ActuatorReconciler:
+    """Re-sends commands to switches whose reported state differs from the intended one.
+
+    Switches are only checked when a command settles or the switch reports a state,
+    nothing is polled. Retries back off exponentially on the shared timer heap, and
+    a switch that still doesn't match after MAX_RETRIES gets a repair issue instead
+    of more commands until it reports the intended state again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the ActuatorReconciler class."""
+        self._hass = hass
+        self._clock = async_get_clock(hass)
+        self._timers = async_get_timer_heap(hass)
+        self._retries: dict[SwitchActuator, _Retry] = {}
+
+    def attempts(self, actuator: SwitchActuator) -> int:
+        """Return the number of retries sent to the switch since it last matched."""
+        retry = self._retries.get(actuator)
+        return min(retry.attempts, MAX_RETRIES) if retry is not None else 0
+
+    @callback
+    def async_check(self, actuator: SwitchActuator) -> None:
+        """Compare a settled switch with its intended state."""
+        if actuator.intended is None or actuator.is_active == actuator.intended:
+            self.async_forget(actuator)
+            return
+
+        if (retry := self._retries.get(actuator)) is None:
+            retry = self._retries[actuator] = _Retry()
+        if retry.handle is not None:
+            return
+
+        if retry.attempts >= MAX_RETRIES:
+            if retry.attempts == MAX_RETRIES:
+                retry.attempts += 1
+                self._async_report_unresponsive(actuator)
+            return
+
+        delay = min(INITIAL_RETRY_DELAY * 2**retry.attempts, MAX_RETRY_DELAY)
+        retry.handle = self._timers.async_schedule(
+            self._clock.now() + delay,
+            lambda now: self._async_retry(actuator, now),
+        )
+
+    @callback
+    def async_forget(self, actuator: SwitchActuator) -> None:
+        """Stop reconciling the switch and clear its repair issue."""
+        if (retry := self._retries.pop(actuator, None)) is None:
+            return
+        if retry.handle is not None:
+            retry.handle.cancel()
+        if retry.attempts > MAX_RETRIES:
+            _LOGGER.info("%s responds again", actuator.entity_id)
+            ir.async_delete_issue(self._hass, DOMAIN, _issue_id(actuator.entity_id))
+
+    @callback
+    def _async_retry(self, actuator: SwitchActuator, _: datetime) -> None:
+        retry = self._retries[actuator]
+        retry.handle = None
+
+        # A command sent meanwhile settles on its own and is checked again then
+        if actuator.pending is not None or actuator.queued is not None:
+            return
+        if actuator.intended is None or actuator.is_active == actuator.intended:
+            self.async_forget(actuator)
+            return
+
+        retry.attempts += 1
+        _LOGGER.info(
+            "%s still isn't %s, sending the command again (attempt %s of %s)",
+            actuator.entity_id,
+            "on" if actuator.intended else "off",
+            retry.attempts,
+            MAX_RETRIES,
+        )
+        self._hass.async_create_task(actuator.async_reconcile())
+
+    @callback
+    def _async_report_unresponsive(self, actuator: SwitchActuator) -> None:
+        _LOGGER.warning(
+            "%s did not turn %s after %s retries, giving up until it does",
+            actuator.entity_id,
+            "on" if actuator.intended else "off",
+            MAX_RETRIES,
+        )
+        ir.async_create_issue(
+            self._hass,
+            DOMAIN,
+            _issue_id(actuator.entity_id),
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=ISSUE_UNRESPONSIVE_SWITCH,
+            translation_placeholders={"entity_id": actuator.entity_id},
+        )
+
+
+def _issue_id(entity_id: str) -> str:
+    return f"{ISSUE_UNRESPONSIVE_SWITCH}_{entity_id}"
+
+
+@callback
+def async_get_reconciler(hass: HomeAssistant) -> ActuatorReconciler:
+    """Return the reconciler shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (reconciler := domain_data.get(DATA_RECONCILER)) is None:
+        reconciler = domain_data[DATA_RECONCILER] = ActuatorReconciler(hass)
+    return reconciler
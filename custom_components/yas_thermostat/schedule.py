@@ -0,0 +1,198 @@
+"""Weekly schedules of YAS Thermostat zones."""
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.climate.const import (
+    ATTR_PRESET_MODE,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+)
+from homeassistant.const import WEEKDAYS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .clock import async_get_clock
+from .const import ATTR_AT, ATTR_DAYS, DATA_SCHEDULE, DOMAIN
+from .services import async_apply_to_zones
+
+if TYPE_CHECKING:
+    from .climate import YetAnotherSmartThermostat
+
+MINUTES_PER_DAY = 24 * 60
+
+_minute = itemgetter(0)
+
+
+class ScheduledTransition(NamedTuple):
+    """A weekly change to a preset or a temperature range."""
+
+    # Minutes since Monday 00:00, local time
+    minute: int
+    preset_mode: str | None
+    temp_low: float | None
+    temp_high: float | None
+
+
+def compile_schedule(config: list[ConfigType]) -> list[ScheduledTransition]:
+    """Expand the configured transitions to every day and sort them by time."""
+    transitions = []
+    for item in config:
+        at: time = item[ATTR_AT]
+        for day in item.get(ATTR_DAYS, WEEKDAYS):
+            transitions.append(
+                ScheduledTransition(
+                    WEEKDAYS.index(day) * MINUTES_PER_DAY + at.hour * 60 + at.minute,
+                    item.get(ATTR_PRESET_MODE),
+                    item.get(ATTR_TARGET_TEMP_LOW),
+                    item.get(ATTR_TARGET_TEMP_HIGH),
+                )
+            )
+    # Stable, so the last configured transition of a minute wins
+    transitions.sort(key=_minute)
+    return transitions
+
+
+def latest_transition(
+    transitions: Sequence[ScheduledTransition], since: datetime | None, now: datetime
+) -> ScheduledTransition | None:
+    """Return the last transition after since and up to now, None if there's none.
+
+    Without since, this is the transition that is in effect now.
+    """
+    return next(_walk_back(transitions, since, now), None)
+
+
+class ScheduleEngine:
+    """Applies the transitions of every scheduled zone from one timer.
+
+    The transitions of all zones are kept in a single index sorted by their minute
+    of the week, so the timer only wakes up at the next transition of any zone. When
+    it wakes up late, only the last transition each zone missed is applied.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the ScheduleEngine class."""
+        self._hass = hass
+        self._clock = async_get_clock(hass)
+        self._index: list[tuple[int, str, ScheduledTransition]] = []
+        self._zones: dict[str, YetAnotherSmartThermostat] = {}
+        self._last_run = self._clock.now()
+        self._cancel_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self,
+        zone: YetAnotherSmartThermostat,
+        transitions: list[ScheduledTransition],
+    ) -> CALLBACK_TYPE:
+        """Add the transitions of a zone to the index and return how to remove them."""
+        entity_id = zone.entity_id
+        self._zones[entity_id] = zone
+        for transition in transitions:
+            insort(self._index, (transition.minute, entity_id, transition), key=_minute)
+        self._async_arm()
+
+        @callback
+        def _async_remove() -> None:
+            self._zones.pop(entity_id, None)
+            self._index = [entry for entry in self._index if entry[1] != entity_id]
+            self._async_arm()
+
+        return _async_remove
+
+    def _next_run(self, now: datetime) -> datetime:
+        now_local = dt_util.as_local(now)
+        position = bisect_right(self._index, _minute_of_week(now_local), key=_minute)
+        return _occurrence_after(now_local, self._index[position % len(self._index)][0])
+
+    @callback
+    def _async_arm(self) -> None:
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if self._index:
+            self._cancel_timer = self._clock.async_track_point_in_time(
+                self._async_on_transition, self._next_run(self._clock.now())
+            )
+
+    @callback
+    def _async_on_transition(self, now: datetime) -> None:
+        self._cancel_timer = None
+
+        # Walk back from now, so the first transition found for a zone is its latest
+        due: dict[str, ScheduledTransition] = {}
+        for _, entity_id, transition in _walk_back(self._index, self._last_run, now):
+            due.setdefault(entity_id, transition)
+        self._last_run = now
+        self._async_arm()
+
+        zones = [self._zones[entity_id] for entity_id in due]
+        if zones:
+            self._hass.async_create_task(
+                async_apply_to_zones(
+                    zones, lambda zone: zone.async_apply_transition(due[zone.entity_id])
+                )
+            )
+
+
+def _minute_of_week(moment: datetime) -> int:
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def _wall_time(day: date, minute: int) -> datetime:
+    minute %= MINUTES_PER_DAY
+    return datetime.combine(
+        day, time(minute // 60, minute % 60), tzinfo=dt_util.DEFAULT_TIME_ZONE
+    )
+
+
+def _occurrence_before(now_local: datetime, minute: int) -> datetime:
+    """Return the last time the minute of the week was reached, at or before now."""
+    days_back = (now_local.weekday() - minute // MINUTES_PER_DAY) % 7
+    occurrence = _wall_time(now_local.date() - timedelta(days=days_back), minute)
+    if occurrence > now_local:
+        occurrence = _wall_time(occurrence.date() - timedelta(days=7), minute)
+    return occurrence
+
+
+def _occurrence_after(now_local: datetime, minute: int) -> datetime:
+    """Return the next time the minute of the week is reached, after now."""
+    days_ahead = (minute // MINUTES_PER_DAY - now_local.weekday()) % 7
+    occurrence = _wall_time(now_local.date() + timedelta(days=days_ahead), minute)
+    if occurrence <= now_local:
+        occurrence = _wall_time(occurrence.date() + timedelta(days=7), minute)
+    return occurrence
+
+
+def _walk_back(
+    entries: Sequence[tuple], since: datetime | None, now: datetime
+) -> Iterator[Any]:
+    """Yield the entries reached after since and up to now, latest first.
+
+    Entries are sorted tuples starting with their minute of the week. Each entry is
+    yielded at most once, so without since this covers the week before now.
+    """
+    if not entries:
+        return
+    now_local = dt_util.as_local(now)
+    position = bisect_right(entries, _minute_of_week(now_local), key=_minute)
+    for step in range(1, len(entries) + 1):
+        entry = entries[(position - step) % len(entries)]
+        if since is not None and _occurrence_before(now_local, entry[0]) <= since:
+            return
+        yield entry
+
+
+@callback
+def async_get_schedule_engine(hass: HomeAssistant) -> ScheduleEngine:
+    """Return the schedule engine shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (engine := domain_data.get(DATA_SCHEDULE)) is None:
+        engine = domain_data[DATA_SCHEDULE] = ScheduleEngine(hass)
+    return engine
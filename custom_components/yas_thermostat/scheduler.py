@@ -0,0 +1,113 @@
+"""Single-flight update scheduler for YAS Thermostat zones."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UpdateScheduler:
+    """Run a zone evaluation single-flight, coalescing pending triggers.
+
+    Any number of triggers that arrive while an evaluation is running are folded
+    into a single follow up evaluation, so two evaluations never overlap. Errors of
+    an evaluation reach the callers waiting for it through async_request, and are
+    logged when it was only triggered by events.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        evaluate: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize a new instance of the UpdateScheduler class."""
+        self._hass = hass
+        self._name = name
+        self._evaluate = evaluate
+        self._task: asyncio.Task | None = None
+        self._next_run: asyncio.Future[None] | None = None
+        # Whether a caller of async_request waits for the next evaluation
+        self._next_run_awaited = False
+        self.trigger_count: int = 0
+        self.evaluation_count: int = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return the number of triggers that did not need their own evaluation."""
+        return max(self.trigger_count - self.evaluation_count, 0)
+
+    @property
+    def is_running(self) -> bool:
+        """Return whether an evaluation is currently in progress."""
+        return self._task is not None
+
+    @callback
+    def async_schedule(self) -> asyncio.Future[None]:
+        """Request an evaluation.
+
+        Returns a future that completes once an evaluation that started after this
+        request has finished.
+        """
+        self.trigger_count += 1
+
+        if self._next_run is None:
+            self._next_run = self._hass.loop.create_future()
+        next_run = self._next_run
+
+        if self._task is None:
+            self._task = self._hass.async_create_task(self._async_run())
+
+        return next_run
+
+    async def async_request(self) -> None:
+        """Request an evaluation and wait for it to finish, raising its error."""
+        next_run = self.async_schedule()
+        self._next_run_awaited = True
+        await next_run
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any running evaluation and release waiting callers."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._next_run is not None:
+            if not self._next_run.done():
+                self._next_run.set_result(None)
+            self._next_run = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scheduler counters."""
+        return {
+            "triggers": self.trigger_count,
+            "evaluations": self.evaluation_count,
+            "coalesced": self.coalesced_count,
+        }
+
+    async def _async_run(self) -> None:
+        """Keep evaluating until no more triggers are pending."""
+        try:
+            while (current_run := self._next_run) is not None:
+                awaited = self._next_run_awaited
+                self._next_run = None
+                self._next_run_awaited = False
+                self.evaluation_count += 1
+                try:
+                    await self._evaluate()
+                except Exception as err:  # pylint: disable=broad-except
+                    if awaited and not current_run.done():
+                        current_run.set_exception(err)
+                    else:
+                        _LOGGER.exception("Error evaluating %s", self._name)
+                finally:
+                    if not current_run.done():
+                        current_run.set_result(None)
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
@@ -0,0 +1,95 @@
+"""Diagnostic sensors of YAS Thermostat zones."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DISCOVERY_ZONES
+
+if TYPE_CHECKING:
+    from .climate import YetAnotherSmartThermostat
+
+# The sensors read what the zones already hold in memory
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Add the diagnostic sensors of the zones discovered by the climate platform."""
+    if discovery_info is None:
+        return
+
+    zones: list[YetAnotherSmartThermostat] = discovery_info[DISCOVERY_ZONES]
+    entities: list[SensorEntity] = []
+    for zone in zones:
+        if zone.metrics is not None:
+            entities.append(ZoneLatencySensor(zone))
+        if zone.trace is not None:
+            entities.append(ZoneTraceSensor(zone))
+    async_add_entities(entities)
+
+
+class ZoneLatencySensor(SensorEntity):
+    """Mean time from a temperature change to the switch commands it caused.
+
+    The latency histograms and counters of the zone are its attributes.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, zone: YetAnotherSmartThermostat) -> None:
+        """Initialize a new instance of the ZoneLatencySensor class."""
+        self._zone = zone
+        self._attr_name = f"{zone.name} Decision Latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean decision latency in milliseconds."""
+        decision = self._zone.metrics.decision
+        return round(decision.total / decision.count, 2) if decision.count else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the metrics of the zone."""
+        return self._zone.metrics.as_dict()
+
+
+class ZoneTraceSensor(SensorEntity):
+    """Time of the latest decision of a zone, with the recent ones as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, zone: YetAnotherSmartThermostat) -> None:
+        """Initialize a new instance of the ZoneTraceSensor class."""
+        self._zone = zone
+        self._attr_name = f"{zone.name} Decision Trace"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the zone last evaluated."""
+        latest = self._zone.trace.latest
+        return latest.time if latest is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the recent decisions of the zone, oldest first."""
+        return {"decisions": self._zone.trace.as_list()}
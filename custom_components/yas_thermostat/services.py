@@ -0,0 +1,207 @@
+"""Platform services for YAS Thermostat zones."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate.const import (
+    ATTR_HVAC_MODE,
+    ATTR_PRESET_MODE,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+    HVACMode,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import JSONEncoder
+from homeassistant.util.json import save_json
+
+from .const import DATA_ZONES, DOMAIN
+from .profiler import async_get_profiler
+
+if TYPE_CHECKING:
+    from .climate import YetAnotherSmartThermostat
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_DUMP_DIAGNOSTICS = "dump_diagnostics"
+DIAGNOSTICS_FILENAME = "yas_thermostat_diagnostics.json"
+
+SERVICE_PROFILE = "profile"
+
+SERVICE_SET_PRESET_MODE = "set_preset_mode"
+SERVICE_SET_TEMPERATURE_RANGE = "set_temperature_range"
+SERVICE_SET_HVAC_MODE = "set_hvac_mode"
+
+ATTR_DURATION = "duration"
+DEFAULT_PROFILE_DURATION = timedelta(seconds=60)
+MAX_PROFILE_DURATION = timedelta(hours=1)
+
+# Evaluations run at once by the bulk services, each may call switch services
+MAX_CONCURRENT_EVALUATIONS = 20
+
+DUMP_DIAGNOSTICS_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            cv.time_period,
+            cv.positive_timedelta,
+            vol.Range(max=MAX_PROFILE_DURATION),
+        ),
+    }
+)
+SET_PRESET_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_PRESET_MODE): cv.string,
+    }
+)
+SET_TEMPERATURE_RANGE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(ATTR_TARGET_TEMP_LOW): vol.Coerce(float),
+            vol.Optional(ATTR_TARGET_TEMP_HIGH): vol.Coerce(float),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH),
+)
+SET_HVAC_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_HVAC_MODE): vol.Coerce(HVACMode),
+    }
+)
+
+
+@callback
+def async_get_zones(hass: HomeAssistant) -> dict[str, YetAnotherSmartThermostat]:
+    """Return the zones that are currently added to Home Assistant by entity ID."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    return domain_data.setdefault(DATA_ZONES, {})
+
+
+@callback
+def async_select_zones(
+    hass: HomeAssistant, entity_ids: list[str] | None
+) -> list[YetAnotherSmartThermostat]:
+    """Return the selected zones, or all of them when no selection is given."""
+    zones = async_get_zones(hass)
+    if entity_ids is None:
+        return list(zones.values())
+    return [zones[entity_id] for entity_id in entity_ids if entity_id in zones]
+
+
+async def async_apply_to_zones(
+    zones: list[YetAnotherSmartThermostat],
+    apply: Callable[[YetAnotherSmartThermostat], None],
+) -> None:
+    """Change the settings of the zones in one pass, then evaluate them.
+
+    The settings of every zone change and are written in the same tick. The
+    evaluations follow concurrently, at most MAX_CONCURRENT_EVALUATIONS at a time.
+    """
+    applied = []
+    for zone in zones:
+        try:
+            apply(zone)
+        except (KeyError, ValueError) as err:
+            _LOGGER.warning(
+                "Unable to change the settings of %s: %s", zone.entity_id, err
+            )
+            continue
+        applied.append(zone)
+
+    for zone in applied:
+        zone.async_write_settings()
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+
+    async def _async_evaluate(zone: YetAnotherSmartThermostat) -> None:
+        async with semaphore:
+            await zone.async_request_evaluation()
+
+    await asyncio.gather(*(_async_evaluate(zone) for zone in applied))
+
+
+@callback
+def _apply_hvac_mode(hvac_mode: HVACMode, zone: YetAnotherSmartThermostat) -> None:
+    if hvac_mode not in zone.hvac_modes:
+        raise ValueError(f"HVAC mode {hvac_mode} is not available")
+    zone.async_apply_hvac_mode(hvac_mode)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the platform services once for all zones."""
+    if hass.services.has_service(DOMAIN, SERVICE_DUMP_DIAGNOSTICS):
+        return
+
+    async def _async_dump_diagnostics(call: ServiceCall) -> None:
+        zones = async_select_zones(hass, call.data.get(ATTR_ENTITY_ID))
+        payload = {zone.entity_id: zone.diagnostics for zone in zones}
+        path = hass.config.path(DIAGNOSTICS_FILENAME)
+
+        await hass.async_add_executor_job(
+            partial(save_json, path, payload, encoder=JSONEncoder)
+        )
+        _LOGGER.info("Wrote diagnostics for %s zones to %s", len(payload), path)
+
+    @callback
+    def _async_profile(call: ServiceCall) -> None:
+        zones = async_select_zones(hass, call.data.get(ATTR_ENTITY_ID))
+        async_get_profiler(hass).async_start(zones, call.data[ATTR_DURATION])
+
+    async def _async_set_preset_mode(call: ServiceCall) -> None:
+        zones = async_select_zones(hass, call.data.get(ATTR_ENTITY_ID))
+        preset_mode = call.data[ATTR_PRESET_MODE]
+        await async_apply_to_zones(
+            zones, lambda zone: zone.async_apply_preset_mode(preset_mode)
+        )
+
+    async def _async_set_temperature_range(call: ServiceCall) -> None:
+        zones = async_select_zones(hass, call.data.get(ATTR_ENTITY_ID))
+        temp_low = call.data.get(ATTR_TARGET_TEMP_LOW)
+        temp_high = call.data.get(ATTR_TARGET_TEMP_HIGH)
+        await async_apply_to_zones(
+            zones, lambda zone: zone.async_apply_temperature_range(temp_low, temp_high)
+        )
+
+    async def _async_set_hvac_mode(call: ServiceCall) -> None:
+        zones = async_select_zones(hass, call.data.get(ATTR_ENTITY_ID))
+        await async_apply_to_zones(
+            zones, partial(_apply_hvac_mode, call.data[ATTR_HVAC_MODE])
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_DIAGNOSTICS,
+        _async_dump_diagnostics,
+        schema=DUMP_DIAGNOSTICS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PRESET_MODE,
+        _async_set_preset_mode,
+        schema=SET_PRESET_MODE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TEMPERATURE_RANGE,
+        _async_set_temperature_range,
+        schema=SET_TEMPERATURE_RANGE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_HVAC_MODE, _async_set_hvac_mode, schema=SET_HVAC_MODE_SCHEMA
+    )
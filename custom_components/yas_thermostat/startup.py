@@ -0,0 +1,157 @@
+"""Batched restore and startup of YAS Thermostat zones."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_START
+from homeassistant.core import CoreState, Event, HomeAssistant, State, callback
+from homeassistant.helpers.restore_state import RestoreStateData
+
+from .const import DATA_STARTUP, DOMAIN
+from .services import async_get_zones
+from .store import async_get_runtime_store
+
+if TYPE_CHECKING:
+    from .climate import YetAnotherSmartThermostat
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StartupCoordinator:
+    """Restores and starts the zones added together in one pass each.
+
+    Zones that are added in the same tick share a single lookup of the restored
+    states and the runtime store. Once Home Assistant is running every referenced entity is read once
+    into a snapshot, all zones start from it and their first evaluations run as
+    one batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the StartupCoordinator class."""
+        self._hass = hass
+        self._restore_pending: list[YetAnotherSmartThermostat] = []
+        self._restore_batch: asyncio.Future[None] | None = None
+        self._startup_pending: list[YetAnotherSmartThermostat] = []
+        self._startup_scheduled = False
+        self.last_startup: dict[str, Any] | None = None
+
+    async def async_restore(self, zone: YetAnotherSmartThermostat) -> None:
+        """Restore the zone along with the others added in the same tick."""
+        self._restore_pending.append(zone)
+        if self._restore_batch is None:
+            self._restore_batch = self._hass.loop.create_future()
+            self._hass.async_create_task(self._async_restore_pending())
+        await self._restore_batch
+
+    @callback
+    def async_register(self, zone: YetAnotherSmartThermostat) -> None:
+        """Start the zone with the next batch, once Home Assistant is running."""
+        self._startup_pending.append(zone)
+        if self._startup_scheduled:
+            return
+
+        self._startup_scheduled = True
+        if self._hass.state == CoreState.running:
+            self._hass.loop.call_soon(self._async_start_pending)
+        else:
+            self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_START, self._async_on_started
+            )
+
+    @callback
+    def async_start(self, zones: Iterable[YetAnotherSmartThermostat]) -> asyncio.Task:
+        """Start the zones from one snapshot and run their first evaluations.
+
+        Returns the task running the first evaluations.
+        """
+        started = perf_counter()
+        zones = list(zones)
+        entity_ids = {
+            entity_id for zone in zones for entity_id in zone.referenced_entity_ids
+        }
+        states: dict[str, State | None] = {
+            entity_id: self._hass.states.get(entity_id) for entity_id in entity_ids
+        }
+
+        for zone in zones:
+            zone.async_startup(states)
+
+        return self._hass.async_create_task(
+            self._async_evaluate(zones, len(entity_ids), started, perf_counter())
+        )
+
+    async def _async_restore_pending(self) -> None:
+        zones, self._restore_pending = self._restore_pending, []
+        batch, self._restore_batch = self._restore_batch, None
+
+        try:
+            runtime = async_get_runtime_store(self._hass)
+            data, _ = await asyncio.gather(
+                RestoreStateData.async_get_instance(self._hass), runtime.async_load()
+            )
+            for zone in zones:
+                stored = data.last_states.get(zone.entity_id)
+                zone.async_restore(
+                    stored.state if stored is not None else None,
+                    runtime.get(zone.entity_id),
+                )
+        finally:
+            batch.set_result(None)
+
+    @callback
+    def _async_on_started(self, _: Event) -> None:
+        self._async_start_pending()
+
+        # Every configured zone has been set up by now, the rest were removed
+        async_get_runtime_store(self._hass).async_prune(async_get_zones(self._hass))
+
+    @callback
+    def _async_start_pending(self, *_: Any) -> None:
+        zones, self._startup_pending = self._startup_pending, []
+        self._startup_scheduled = False
+
+        # Zones removed before the batch ran don't need to start
+        current = async_get_zones(self._hass)
+        zones = [zone for zone in zones if current.get(zone.entity_id) is zone]
+        if zones:
+            self.async_start(zones)
+
+    async def _async_evaluate(
+        self,
+        zones: list[YetAnotherSmartThermostat],
+        entity_count: int,
+        started: float,
+        started_evaluations: float,
+    ) -> None:
+        await asyncio.gather(*(zone.async_request_evaluation() for zone in zones))
+
+        finished = perf_counter()
+        self.last_startup = {
+            "zones": len(zones),
+            "entities": entity_count,
+            "snapshot_ms": (started_evaluations - started) * 1000,
+            "evaluation_ms": (finished - started_evaluations) * 1000,
+            "total_ms": (finished - started) * 1000,
+        }
+        _LOGGER.info(
+            "Started %s zones in %.1f ms (%s entities read in %.1f ms, first "
+            "evaluations took %.1f ms)",
+            len(zones),
+            self.last_startup["total_ms"],
+            entity_count,
+            self.last_startup["snapshot_ms"],
+            self.last_startup["evaluation_ms"],
+        )
+
+
+@callback
+def async_get_startup_coordinator(hass: HomeAssistant) -> StartupCoordinator:
+    """Return the startup coordinator shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (coordinator := domain_data.get(DATA_STARTUP)) is None:
+        coordinator = domain_data[DATA_STARTUP] = StartupCoordinator(hass)
+    return coordinator
@@ -0,0 +1,180 @@
+"""Rolling runtime statistics of the heaters and coolers of YAS Thermostat zones."""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Any
+
+BUCKET_SECONDS = 300
+BUCKETS_PER_HOUR = 3600 // BUCKET_SECONDS
+BUCKETS = 24 * BUCKETS_PER_HOUR
+
+
+class RuntimeStats:
+    """On-time, cycles and energy of a switch, in total and over the last hour and day.
+
+    On-time and started cycles are counted in the five minute buckets of two ring
+    buffers spanning a day, with running sums for the last hour and day. Recording a
+    transition only touches the buckets that passed since the previous one, and the
+    memory used stays the same however long the zone runs.
+    """
+
+    __slots__ = (
+        "power",
+        "on_seconds",
+        "cycles",
+        "_on_since",
+        "_counted_until",
+        "_started_at",
+        "_bucket",
+        "_on",
+        "_starts",
+        "_on_hour",
+        "_on_day",
+        "_starts_hour",
+        "_starts_day",
+    )
+
+    def __init__(self, power: float, now: datetime) -> None:
+        """Initialize a new instance of the RuntimeStats class."""
+        # Power of the switch in watts, 0 when it isn't known
+        self.power = power
+        self.on_seconds = 0.0
+        self.cycles = 0
+        self._on_since: float | None = None
+        self._counted_until = 0.0
+        self._started_at = now.timestamp()
+        self._bucket = int(self._started_at // BUCKET_SECONDS)
+        self._on = array("d", bytes(8 * BUCKETS))
+        self._starts = array("L", [0]) * BUCKETS
+        self._on_hour = self._on_day = 0.0
+        self._starts_hour = self._starts_day = 0
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the switch is counted as on."""
+        return self._on_since is not None
+
+    def record(self, active: bool, now: datetime) -> bool:
+        """Record the state of the switch, returns whether it changed."""
+        if active == self.is_on:
+            return False
+
+        timestamp = now.timestamp()
+        self._count(timestamp)
+        if active:
+            self._on_since = self._counted_until = timestamp
+            self._starts[self._bucket % BUCKETS] += 1
+            self._starts_hour += 1
+            self._starts_day += 1
+            self.cycles += 1
+        else:
+            self._on_since = None
+        return True
+
+    def as_dict(self, now: datetime) -> dict[str, Any]:
+        """Return the statistics up to now."""
+        timestamp = now.timestamp()
+        self._count(timestamp)
+        hour = timestamp - max(
+            self._started_at, (self._bucket - BUCKETS_PER_HOUR + 1) * BUCKET_SECONDS
+        )
+        day = timestamp - max(
+            self._started_at, (self._bucket - BUCKETS + 1) * BUCKET_SECONDS
+        )
+        return {
+            "on_time": round(self.on_seconds),
+            "cycles": self.cycles,
+            "duty_cycle_1h": _percentage(self._on_hour, hour),
+            "duty_cycle_24h": _percentage(self._on_day, day),
+            "cycles_per_hour": self._starts_hour,
+            "cycles_24h": self._starts_day,
+            "energy_kwh": round(self.on_seconds * self.power / 3_600_000, 3)
+            if self.power
+            else None,
+        }
+
+    def as_stored(self) -> dict[str, Any]:
+        """Return the statistics to keep across restarts."""
+        return {
+            "on_seconds": self.on_seconds,
+            "cycles": self.cycles,
+            "started_at": self._started_at,
+            "bucket": self._bucket,
+            "on": [round(seconds, 1) for seconds in self._on],
+            "starts": self._starts.tolist(),
+        }
+
+    def restore(self, stored: dict[str, Any], now: datetime) -> None:
+        """Continue from stored statistics, the time since counts as off."""
+        if (
+            len(stored.get("on", ())) != BUCKETS
+            or len(stored.get("starts", ())) != BUCKETS
+        ):
+            return
+        self.on_seconds = stored["on_seconds"]
+        self.cycles = stored["cycles"]
+        self._started_at = min(stored["started_at"], now.timestamp())
+        self._bucket = stored["bucket"]
+        self._on = array("d", stored["on"])
+        self._starts = array("L", stored["starts"])
+        recent = [(self._bucket - step) % BUCKETS for step in range(BUCKETS_PER_HOUR)]
+        self._on_hour = sum(self._on[index] for index in recent)
+        self._on_day = sum(self._on)
+        self._starts_hour = sum(self._starts[index] for index in recent)
+        self._starts_day = sum(self._starts)
+        self._advance(int(now.timestamp() // BUCKET_SECONDS))
+
+    def _count(self, timestamp: float) -> None:
+        """Add the on-time up to the timestamp to the buckets it fell in."""
+        if self._on_since is None:
+            self._advance(int(timestamp // BUCKET_SECONDS))
+            return
+
+        counted = self._counted_until
+        if (skipped := timestamp - counted - BUCKETS * BUCKET_SECONDS) > 0:
+            # Only the last day fits in the buckets
+            self.on_seconds += skipped
+            counted += skipped
+        while counted < timestamp:
+            bucket = int(counted // BUCKET_SECONDS)
+            self._advance(bucket)
+            end = min(timestamp, (bucket + 1) * BUCKET_SECONDS)
+            seconds = end - counted
+            self._on[bucket % BUCKETS] += seconds
+            self._on_hour += seconds
+            self._on_day += seconds
+            self.on_seconds += seconds
+            counted = end
+        self._counted_until = timestamp
+        self._advance(int(timestamp // BUCKET_SECONDS))
+
+    def _advance(self, bucket: int) -> None:
+        """Move the current bucket forward, dropping what leaves the windows."""
+        if bucket <= self._bucket:
+            return
+        if bucket - self._bucket >= BUCKETS:
+            self._on = array("d", bytes(8 * BUCKETS))
+            self._starts = array("L", [0]) * BUCKETS
+            self._on_hour = self._on_day = 0.0
+            self._starts_hour = self._starts_day = 0
+            self._bucket = bucket
+            return
+
+        for current in range(self._bucket + 1, bucket + 1):
+            leaving = (current - BUCKETS_PER_HOUR) % BUCKETS
+            self._on_hour -= self._on[leaving]
+            self._starts_hour -= self._starts[leaving]
+            reused = current % BUCKETS
+            self._on_day -= self._on[reused]
+            self._starts_day -= self._starts[reused]
+            self._on[reused] = 0.0
+            self._starts[reused] = 0
+        # Running sums of floats drift, they never go below nothing
+        self._on_hour = max(self._on_hour, 0.0)
+        self._on_day = max(self._on_day, 0.0)
+        self._bucket = bucket
+
+
+def _percentage(part: float, whole: float) -> float | None:
+    return round(min(part / whole, 1.0) * 100, 1) if whole > 0 else None
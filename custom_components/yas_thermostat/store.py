@@ -0,0 +1,92 @@
+"""Runtime data of YAS Thermostat zones that survives a restart."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Collection
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_RUNTIME_STORE, DOMAIN
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.runtime"
+# Changes made within this many seconds of the first one are written together
+SAVE_DELAY = 30
+
+ZoneData = dict[str, Any]
+
+
+class RuntimeStore:
+    """A single storage file holding the runtime data of every zone.
+
+    The file is read once, before the first zones are restored. Zones only mark
+    themselves as changed, their data is collected when the write happens, so any
+    number of changes across all zones results in one write per SAVE_DELAY.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the RuntimeStore class."""
+        self._store = Store[dict[str, ZoneData]](hass, STORAGE_VERSION, STORAGE_KEY)
+        self._hass = hass
+        self._data: dict[str, ZoneData] = {}
+        self._changed: dict[str, Callable[[], ZoneData]] = {}
+        self._load_task: asyncio.Task[None] | None = None
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        """Read the storage file, only the first call reads it."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    def get(self, zone_id: str) -> ZoneData | None:
+        """Return the stored data of a zone, None if there's none."""
+        return self._data.get(zone_id)
+
+    @callback
+    def async_changed(self, zone_id: str, data_func: Callable[[], ZoneData]) -> None:
+        """Write the data of a zone with the next delayed write."""
+        self._changed[zone_id] = data_func
+        self._async_schedule_save()
+
+    @callback
+    def async_prune(self, zone_ids: Collection[str]) -> None:
+        """Drop the data of zones that are no longer configured."""
+        removed = [zone_id for zone_id in self._data if zone_id not in zone_ids]
+        if not removed:
+            return
+
+        for zone_id in removed:
+            del self._data[zone_id]
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        if not self._save_scheduled:
+            # Not pushed back by later changes, unlike calling async_delay_save again
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def _async_load(self) -> None:
+        if (data := await self._store.async_load()) is not None:
+            # Changes made before the file was read are newer
+            self._data = {**data, **self._data}
+
+    @callback
+    def _data_to_save(self) -> dict[str, ZoneData]:
+        self._save_scheduled = False
+        changed, self._changed = self._changed, {}
+        for zone_id, data_func in changed.items():
+            self._data[zone_id] = data_func()
+        return self._data
+
+
+@callback
+def async_get_runtime_store(hass: HomeAssistant) -> RuntimeStore:
+    """Return the runtime store shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get(DATA_RUNTIME_STORE)) is None:
+        store = domain_data[DATA_RUNTIME_STORE] = RuntimeStore(hass)
+    return store
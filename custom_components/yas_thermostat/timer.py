@@ -0,0 +1,138 @@
+"""Shared deadline timer for YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import heapq
+import itertools
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .clock import async_get_clock
+from .const import DATA_TIMERS, DOMAIN
+
+TimerAction = Callable[[datetime], None]
+
+# Compact the heap once cancelled entries make up more than this share of it
+COMPACT_RATIO = 0.5
+COMPACT_MIN_SIZE = 64
+
+
+class TimerHandle:
+    """A deadline scheduled on the timer heap."""
+
+    __slots__ = ("when", "action", "cancelled", "_heap")
+
+    def __init__(self, heap: TimerHeap, when: datetime, action: TimerAction) -> None:
+        """Initialize a new instance of the TimerHandle class."""
+        self._heap = heap
+        self.when = when
+        self.action = action
+        self.cancelled = False
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the deadline, the heap entry is dropped lazily."""
+        if self.cancelled is False:
+            self.cancelled = True
+            self._heap.async_on_cancelled()
+
+
+class TimerHeap:
+    """Deadlines of every zone served by a single Home Assistant timer.
+
+    Only the earliest deadline is ever armed. Cancelling or replacing a deadline just
+    flags its handle, the entry is skipped when it reaches the top of the heap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a new instance of the TimerHeap class."""
+        self._clock = async_get_clock(hass)
+        self._heap: list[tuple[datetime, int, TimerHandle]] = []
+        self._sequence = itertools.count()
+        self._cancelled_count = 0
+        self._armed_at: datetime | None = None
+        self._cancel_wakeup: CALLBACK_TYPE | None = None
+
+    def __len__(self) -> int:
+        """Return the number of live deadlines."""
+        return len(self._heap) - self._cancelled_count
+
+    @callback
+    def async_schedule(self, when: datetime, action: TimerAction) -> TimerHandle:
+        """Call the action with the current time once the deadline is reached."""
+        handle = TimerHandle(self, when, action)
+        heapq.heappush(self._heap, (when, next(self._sequence), handle))
+
+        if self._armed_at is None or when < self._armed_at:
+            self._async_arm(when)
+
+        return handle
+
+    @callback
+    def async_on_cancelled(self) -> None:
+        """Account for a cancelled handle, compacting the heap when it is mostly dead."""
+        self._cancelled_count += 1
+        if (
+            len(self._heap) >= COMPACT_MIN_SIZE
+            and self._cancelled_count > len(self._heap) * COMPACT_RATIO
+        ):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled_count = 0
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all deadlines and disarm the timer."""
+        self._heap.clear()
+        self._cancelled_count = 0
+        self._async_disarm()
+
+    @callback
+    def _async_arm(self, when: datetime) -> None:
+        self._async_disarm()
+        self._armed_at = when
+        self._cancel_wakeup = self._clock.async_track_point_in_time(
+            self._async_fire, when
+        )
+
+    @callback
+    def _async_disarm(self) -> None:
+        if self._cancel_wakeup is not None:
+            self._cancel_wakeup()
+            self._cancel_wakeup = None
+        self._armed_at = None
+
+    @callback
+    def _async_fire(self, _: datetime) -> None:
+        """Run every deadline that is due and arm the timer for the next one."""
+        self._cancel_wakeup = None
+        self._armed_at = None
+        now = self._clock.now()
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, handle = heapq.heappop(self._heap)
+            if handle.cancelled:
+                self._cancelled_count -= 1
+                continue
+            # Mark as done so a late cancel doesn't count it twice
+            handle.cancelled = True
+            handle.action(now)
+
+        # Drop cancelled entries at the top so the timer is armed for a live one
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled_count -= 1
+
+        if self._heap:
+            self._async_arm(self._heap[0][0])
+
+
+@callback
+def async_get_timer_heap(hass: HomeAssistant) -> TimerHeap:
+    """Return the timer heap shared by all zones, creating it if needed."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (timers := domain_data.get(DATA_TIMERS)) is None:
+        timers = domain_data[DATA_TIMERS] = TimerHeap(hass)
+    return timers
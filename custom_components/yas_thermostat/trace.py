@@ -0,0 +1,57 @@
+"""Decision trace of YAS Thermostat zones."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+from typing import Any, NamedTuple
+
+
+class DecisionRecord(NamedTuple):
+    """The inputs and outcome of a single evaluation."""
+
+    time: datetime
+    current_temp: float | None
+    temp_low: float
+    temp_high: float
+    tolerance: float
+    hvac_mode: str
+    fan_mode: str | None
+    cycle_locked: bool
+    openings_open: bool
+    openings_locked: bool
+    heating: bool
+    cooling: bool
+    fan: bool
+    # Names of the actuators that were commanded
+    commanded: tuple[str, ...]
+
+
+class DecisionTrace:
+    """The most recent decisions of a zone.
+
+    Records are plain tuples appended to a bounded deque, nothing is formatted until
+    the trace is read.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, size: int) -> None:
+        """Initialize a new instance of the DecisionTrace class."""
+        self._records: deque[DecisionRecord] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Return the number of records held."""
+        return len(self._records)
+
+    @property
+    def latest(self) -> DecisionRecord | None:
+        """Return the most recent record, None when there's none."""
+        return self._records[-1] if self._records else None
+
+    def append(self, record: DecisionRecord) -> None:
+        """Add a record, dropping the oldest one when the trace is full."""
+        self._records.append(record)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first."""
+        return [record._asdict() for record in self._records]
@@ -0,0 +1 @@
+"""Tests for the YAS Thermostat integration."""
@@ -0,0 +1,27 @@
+"""Fixtures shared by the YAS Thermostat tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from benchmarks.replay import DEFAULT_START, VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.const import DATA_CLOCK, DOMAIN
+
+
+@pytest.fixture
+async def hass(tmp_path) -> AsyncGenerator[StubHomeAssistant, None]:
+    """Return a stub Home Assistant running on the event loop of the test."""
+    hass = StubHomeAssistant(asyncio.get_running_loop(), str(tmp_path))
+    yield hass
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+def clock(hass: StubHomeAssistant) -> VirtualClock:
+    """Install a clock that only moves when the test advances it."""
+    clock = VirtualClock(hass, DEFAULT_START)
+    hass.data.setdefault(DOMAIN, {})[DATA_CLOCK] = clock
+    return clock
@@ -0,0 +1,182 @@
+"""Tests for the switch actuator."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON, STATE_ON
+from homeassistant.core import DOMAIN as HA_DOMAIN
+from homeassistant.exceptions import ServiceNotFound
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.actuator import SwitchActuator
+from custom_components.yas_thermostat.const import ActuatorMode
+from custom_components.yas_thermostat.metrics import ActuatorMetrics
+
+HEATER = "switch.heater"
+TIMEOUT = timedelta(seconds=30)
+
+
+def _actuator(hass: StubHomeAssistant) -> SwitchActuator:
+    return SwitchActuator(
+        hass, HEATER, TIMEOUT, ActuatorMode.CONFIRM, ActuatorMetrics()
+    )
+
+
+def _confirm(hass: StubHomeAssistant, actuator: SwitchActuator, state: str) -> None:
+    hass.states.async_set(HEATER, state)
+    actuator.async_handle_state(hass.states.get(HEATER))
+
+
+async def test_failed_call_clears_the_pending_command(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a call that raises leaves nothing pending, so the command is retried."""
+
+    async def _missing(call) -> None:
+        raise ServiceNotFound(call.domain, call.service)
+
+    hass.services.async_register(HA_DOMAIN, SERVICE_TURN_ON, _missing)
+    actuator = _actuator(hass)
+
+    assert await actuator.async_turn(True, None) is False
+    assert actuator.pending is None
+    assert actuator.target is False
+    assert actuator.async_needs(True)
+    assert actuator.as_dict()["pending"] is None
+
+    del hass.services._services[(HA_DOMAIN, SERVICE_TURN_ON)]
+    assert await actuator.async_turn(True, None) is True
+    assert actuator.pending is True
+    assert len(hass.services.calls) == 2
+    assert actuator._metrics.failures == 1
+
+
+async def test_cancelled_call_clears_the_pending_command(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a call cancelled while awaited leaves nothing pending."""
+    called = asyncio.Event()
+
+    async def _hang(call) -> None:
+        called.set()
+        await asyncio.Event().wait()
+
+    hass.services.async_register(HA_DOMAIN, SERVICE_TURN_ON, _hang)
+    actuator = _actuator(hass)
+
+    task = hass.async_create_task(actuator.async_turn(True, None))
+    await called.wait()
+    assert actuator.pending is True
+    task.cancel()
+    await hass.async_block_till_done()
+
+    assert task.cancelled()
+    assert actuator.pending is None
+    assert actuator.async_needs(True)
+
+
+async def test_late_failure_keeps_the_command_sent_after_it(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a failing call doesn't clear a command that was sent after it settled."""
+    actuator = _actuator(hass)
+
+    async def _confirm_then_fail(call) -> None:
+        await actuator.async_turn(False, None)
+        assert actuator.queued is False
+        # The switch confirms, which sends the queued command, before the call fails
+        _confirm(hass, actuator, STATE_ON)
+        raise ServiceNotFound(call.domain, call.service)
+
+    hass.services.async_register(HA_DOMAIN, SERVICE_TURN_ON, _confirm_then_fail)
+    hass.services.reflect_switches = False
+
+    assert await actuator.async_turn(True, None) is False
+    assert actuator.is_active is True
+    assert actuator.pending is False
+    await hass.async_block_till_done()
+    assert hass.services.calls[-1][1] == SERVICE_TURN_OFF
+
+
+async def test_latest_queued_command_wins(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test commands requested while one is in flight collapse into the latest."""
+    hass.services.reflect_switches = False
+    actuator = _actuator(hass)
+
+    assert await actuator.async_turn(True, None) is True
+    for active in (False, True, False):
+        assert await actuator.async_turn(active, None) is True
+    assert actuator.pending is True
+    assert actuator.queued is False
+    assert actuator.target is False
+    assert len(hass.services.calls) == 1
+
+    _confirm(hass, actuator, STATE_ON)
+    await hass.async_block_till_done()
+
+    assert actuator.pending is False
+    assert actuator.queued is None
+    assert [call[1] for call in hass.services.calls] == [
+        SERVICE_TURN_ON,
+        SERVICE_TURN_OFF,
+    ]
+    assert actuator._metrics.collapsed == 1
+
+
+async def test_going_back_to_the_state_in_flight_drops_the_queue(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test asking for the state in flight again only drops the queued command."""
+    hass.services.reflect_switches = False
+    actuator = _actuator(hass)
+
+    await actuator.async_turn(True, None)
+    await actuator.async_turn(False, None)
+    await actuator.async_turn(True, None)
+    assert actuator.queued is None
+
+    _confirm(hass, actuator, STATE_ON)
+    await hass.async_block_till_done()
+
+    assert actuator.pending is None
+    assert len(hass.services.calls) == 1
+
+
+async def test_unconfirmed_command_times_out(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a command the switch never confirms is given up after the timeout."""
+    hass.services.reflect_switches = False
+    actuator = _actuator(hass)
+
+    await actuator.async_turn(True, None)
+    await clock.async_advance_to(clock.now() + TIMEOUT - timedelta(seconds=1))
+    assert actuator.pending is True
+
+    await clock.async_advance_to(clock.now() + timedelta(seconds=1))
+    assert actuator.pending is None
+    assert actuator.target is False
+    assert actuator._metrics.timeouts == 1
+
+
+async def test_queued_command_is_dropped_when_moot(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a queued command isn't sent once the switch is already in its state."""
+    hass.services.reflect_switches = False
+    actuator = _actuator(hass)
+
+    await actuator.async_turn(True, None)
+    await actuator.async_turn(False, None)
+    assert actuator.queued is False
+
+    # The switch never turned on, so it already is where the queued command goes
+    await clock.async_advance_to(clock.now() + TIMEOUT)
+    assert actuator.pending is None
+    assert actuator.queued is None
+    assert len(hass.services.calls) == 1
+    assert actuator._metrics.collapsed == 1
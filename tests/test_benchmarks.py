@@ -0,0 +1,39 @@
+"""Tests for the helpers of the benchmarks."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from benchmarks.hot_path import compare
+from benchmarks.replay import VirtualClock
+
+
+def _results(**p50: float) -> dict:
+    return {"results": {name: {"p50_us": value} for name, value in p50.items()}}
+
+
+def test_compare_reports_regressions_past_the_threshold() -> None:
+    """Test only medians that grew past the threshold are reported."""
+    baseline = _results(evaluate=10.0, write=10.0, new_case=0.0)
+    results = _results(evaluate=12.0, write=13.0, new_case=5.0, added=1.0)
+
+    regressions = compare(results, baseline, 1.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("write:")
+
+
+async def test_virtual_clock_fires_wakeups_in_order(clock: VirtualClock) -> None:
+    """Test the virtual clock fires due wakeups in order and skips cancelled ones."""
+    start = clock.now()
+    fired = []
+    clock.async_call_later(timedelta(seconds=2), lambda now: fired.append(("b", now)))
+    clock.async_call_later(timedelta(seconds=1), lambda now: fired.append(("a", now)))
+    cancel = clock.async_call_later(timedelta(seconds=1), fired.append)
+    cancel()
+
+    await clock.async_advance_to(start + timedelta(seconds=1))
+    assert fired == [("a", start + timedelta(seconds=1))]
+
+    await clock.async_advance_to(start + timedelta(minutes=1))
+    assert fired[1] == ("b", start + timedelta(seconds=2))
+    assert clock.now() == start + timedelta(minutes=1)
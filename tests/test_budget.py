@@ -0,0 +1,234 @@
+"""Tests for the power budget shared by heaters and coolers."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from benchmarks.zones import create_zone, start_zone, zone_config
+from custom_components.yas_thermostat.budget import PowerBudget
+from custom_components.yas_thermostat.const import BudgetStrategy
+
+ROTATION = timedelta(minutes=30)
+
+
+class _Zones:
+    """Records which actuators were told that their grant changed."""
+
+    def __init__(self) -> None:
+        self.changed: list[str] = []
+
+    def callback(self, name: str):
+        return lambda: self.changed.append(name)
+
+
+def _budget(
+    hass: StubHomeAssistant,
+    max_active: int | None = None,
+    max_power: float | None = None,
+    strategy: BudgetStrategy = BudgetStrategy.PRIORITY,
+) -> PowerBudget:
+    return PowerBudget(hass, max_active, max_power, strategy, ROTATION)
+
+
+def _request(
+    budget: PowerBudget,
+    zones: _Zones,
+    name: str,
+    power: float = 0,
+    priority: int = 0,
+    deficit: float = 0,
+) -> bool:
+    return budget.async_request(
+        (name, "heater"), power, priority, deficit, zones.callback(name)
+    )
+
+
+async def test_max_active_limits_the_grants(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test actuators past max_active wait until a grant is released."""
+    budget, zones = _budget(hass, max_active=2), _Zones()
+
+    assert _request(budget, zones, "a")
+    assert _request(budget, zones, "b")
+    assert not _request(budget, zones, "c")
+    # Asking again while waiting keeps the place in line
+    assert not _request(budget, zones, "c")
+    assert budget.as_dict()["active"] == 2
+    assert budget.as_dict()["waiting"] == 1
+
+    budget.async_release(("a", "heater"))
+    assert zones.changed == ["c"]
+    assert _request(budget, zones, "c")
+    assert budget.as_dict()["waiting"] == 0
+
+
+async def test_max_power_limits_the_total(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test actuators wait while they would exceed max_power."""
+    budget, zones = _budget(hass, max_power=2000), _Zones()
+
+    assert _request(budget, zones, "a", power=1500)
+    assert not _request(budget, zones, "b", power=1500)
+    # Smaller demand doesn't overtake the head of the line
+    assert not _request(budget, zones, "c", power=500)
+
+    budget.async_release(("a", "heater"))
+    assert zones.changed == ["b", "c"]
+    assert budget.as_dict()["power"] == 2000
+
+    # A single actuator above the limit may still run on its own
+    budget.async_release(("b", "heater"))
+    budget.async_release(("c", "heater"))
+    assert _request(budget, zones, "big", power=3000)
+
+
+async def test_priority_orders_the_queue(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the highest priority is served first, equals in order of arrival."""
+    budget, zones = _budget(hass, max_active=1), _Zones()
+    assert _request(budget, zones, "running")
+    for name, priority in (("low", 0), ("first", 5), ("second", 5)):
+        assert not _request(budget, zones, name, priority=priority)
+
+    for _ in range(3):
+        budget.async_release(
+            (zones.changed[-1], "heater") if zones.changed else ("running", "heater")
+        )
+    assert zones.changed == ["first", "second", "low"]
+
+
+async def test_deficit_orders_the_queue(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the zone furthest from its target is served first."""
+    budget, zones = (
+        _budget(hass, max_active=1, strategy=BudgetStrategy.DEFICIT),
+        _Zones(),
+    )
+    assert _request(budget, zones, "running", deficit=1)
+    assert not _request(budget, zones, "near", deficit=0.5)
+    assert not _request(budget, zones, "far", deficit=3)
+
+    budget.async_release(("running", "heater"))
+    assert zones.changed == ["far"]
+
+    # A changed deficit moves the zone in line
+    assert not _request(budget, zones, "colder", deficit=1)
+    assert not _request(budget, zones, "near", deficit=2)
+    budget.async_release(("far", "heater"))
+    assert zones.changed == ["far", "near"]
+
+
+async def test_rotation_revokes_the_oldest_grant(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a grant held for the rotation interval makes way for an equal."""
+    budget, zones = _budget(hass, max_active=1), _Zones()
+    start = clock.now()
+    assert _request(budget, zones, "a")
+    await clock.async_advance_to(start + timedelta(minutes=10))
+    assert not _request(budget, zones, "b")
+
+    await clock.async_advance_to(start + ROTATION - timedelta(seconds=1))
+    assert zones.changed == []
+
+    await clock.async_advance_to(start + ROTATION)
+    assert zones.changed == ["a"]
+    assert budget.rotations == 1
+
+    # The zone evaluates, gives up the grant and queues up behind b
+    assert not _request(budget, zones, "a")
+    assert zones.changed == ["a", "b"]
+
+    await clock.async_advance_to(start + ROTATION * 2)
+    assert zones.changed == ["a", "b", "b"]
+    assert not _request(budget, zones, "b")
+    assert zones.changed == ["a", "b", "b", "a"]
+
+
+async def test_rotation_skips_grants_ahead_in_line(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test an older grant with a better place in line doesn't stop the rotation."""
+    budget, zones = _budget(hass, max_active=2), _Zones()
+    start = clock.now()
+    assert _request(budget, zones, "important", priority=5)
+    await clock.async_advance_to(start + timedelta(minutes=10))
+    assert _request(budget, zones, "normal")
+    assert not _request(budget, zones, "waiting")
+
+    # The oldest grant keeps running, the timer is armed for the next one
+    await clock.async_advance_to(start + ROTATION)
+    assert zones.changed == []
+
+    await clock.async_advance_to(start + timedelta(minutes=10) + ROTATION)
+    assert zones.changed == ["normal"]
+
+
+async def test_one_rotation_at_a_time(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test no other grant is revoked while a revoked one is still held."""
+    budget, zones = _budget(hass, max_active=2), _Zones()
+    start = clock.now()
+    assert _request(budget, zones, "a")
+    assert _request(budget, zones, "b")
+    assert not _request(budget, zones, "c")
+    assert not _request(budget, zones, "d")
+
+    await clock.async_advance_to(start + ROTATION * 3)
+    assert zones.changed == ["a"]
+
+    budget.async_release(("a", "heater"))
+    assert zones.changed == ["a", "c"]
+    await clock.async_advance_to(clock.now())
+    assert zones.changed == ["a", "c", "b"]
+    assert budget.rotations == 2
+
+
+async def test_held_actuator_counts_against_the_budget(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a held actuator gets a grant even past the limit, revoked ones stay so."""
+    budget, zones = _budget(hass, max_active=1), _Zones()
+    assert _request(budget, zones, "a")
+
+    budget.async_hold(("b", "heater"), 0, 0, 0, zones.callback("b"))
+    assert budget.as_dict()["active"] == 2
+    assert not _request(budget, zones, "c")
+
+    await clock.async_advance_to(clock.now() + ROTATION)
+    assert zones.changed == ["a"]
+    budget.async_hold(("a", "heater"), 0, 0, 0, zones.callback("a"))
+    assert not _request(budget, zones, "a")
+
+    budget.async_release(("b", "heater"))
+    assert zones.changed == ["a", "c"]
+
+
+async def test_cycle_locked_heater_holds_a_grant(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a heater held on by the cycle lock is counted by the budget."""
+    budget = _budget(hass, max_active=1)
+    zone = create_zone(
+        hass,
+        0,
+        zone_config(0, cycle_delay=timedelta(minutes=10), openings=[]),
+    )
+    zone._power_budget = budget
+    hass.states.async_set(zone._heater_switch_id, "on")
+    zone._state.is_cycle_locked = True
+    zone._state.cycle_lock_expiry = clock.now() + timedelta(minutes=10)
+
+    start_zone(hass, zone, 18)
+    await hass.async_block_till_done()
+
+    assert zone._heater.is_active
+    assert budget.as_dict()["active"] == 1
+    zones = _Zones()
+    assert not _request(budget, zones, "other")
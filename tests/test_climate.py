@@ -0,0 +1,92 @@
+"""Tests for the YAS Thermostat zones."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.const import STATE_ON
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from benchmarks.zones import create_zone, start_zone, zone_config
+
+DOOR = "binary_sensor.door"
+
+
+async def test_zones_are_not_polled(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test zones leave it to events and timers to request evaluations."""
+    zone = create_zone(hass, 0)
+    assert zone.should_poll is False
+
+
+async def test_cycle_lock_expiry_evaluates(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the heater turns off once the cycle lock expires, without a poll."""
+    zone = create_zone(
+        hass, 0, zone_config(0, cycle_delay=timedelta(minutes=5), openings=[])
+    )
+    start_zone(hass, zone, 18)
+    await hass.async_block_till_done()
+    assert zone._heater.is_active
+    assert zone._state.is_cycle_locked
+
+    hass.states.async_set(zone._temp_sensor_ids[0], "23")
+    await hass.async_block_till_done()
+    assert zone._heater.is_active
+
+    await clock.async_advance_to(clock.now() + timedelta(minutes=5))
+    assert not zone._heater.is_active
+
+
+async def test_openings_lock_expiry_evaluates(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the heater turns off once an opening stayed open, without a poll."""
+    zone = create_zone(
+        hass,
+        0,
+        zone_config(
+            0,
+            cycle_delay=timedelta(seconds=1),
+            opening_delay=timedelta(minutes=2),
+            openings=[DOOR],
+        ),
+    )
+    start_zone(hass, zone, 18)
+    await hass.async_block_till_done()
+    await clock.async_advance_to(clock.now() + timedelta(minutes=3))
+    assert zone._heater.is_active
+
+    hass.states.async_set(DOOR, STATE_ON)
+    await hass.async_block_till_done()
+    assert zone._heater.is_active
+
+    await clock.async_advance_to(clock.now() + timedelta(minutes=2))
+    assert not zone._heater.is_active
+
+
+async def test_stale_sensor_evaluates(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the heater turns off once the only sensor went silent, without a poll."""
+    zone = create_zone(
+        hass,
+        0,
+        zone_config(
+            0,
+            cycle_delay=timedelta(seconds=1),
+            stale_timeout=timedelta(minutes=10),
+            stale_behavior="off",
+            openings=[],
+        ),
+    )
+    start_zone(hass, zone, 18)
+    await hass.async_block_till_done()
+    await clock.async_advance_to(clock.now() + timedelta(minutes=9))
+    assert zone._heater.is_active
+
+    await clock.async_advance_to(clock.now() + timedelta(minutes=1))
+    assert zone.current_temperature is None
+    assert not zone._heater.is_active
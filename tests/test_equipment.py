@@ -0,0 +1,141 @@
+"""Tests for the equipment shared by several zones."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.const import STATE_OFF, STATE_ON
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from benchmarks.zones import create_zone, start_zone, zone_config
+from custom_components.yas_thermostat.actuator import SwitchActuator
+from custom_components.yas_thermostat.const import ActuatorMode
+from custom_components.yas_thermostat.equipment import (
+    EquipmentDemand,
+    async_get_equipment_manager,
+)
+
+FURNACE = "switch.furnace"
+TIMEOUT = timedelta(seconds=10)
+
+
+def _acquire(
+    hass: StubHomeAssistant, zone_id: str, shared: list[EquipmentDemand]
+) -> EquipmentDemand | None:
+    return async_get_equipment_manager(hass).async_acquire(
+        FURNACE,
+        zone_id,
+        timedelta(minutes=5),
+        TIMEOUT,
+        ActuatorMode.CONFIRM,
+        shared.append,
+    )
+
+
+async def test_switch_is_shared_by_the_second_zone(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the first zone keeps a switch to itself until a second one acquires it."""
+    first: list[EquipmentDemand] = []
+    second: list[EquipmentDemand] = []
+
+    assert _acquire(hass, "climate.first", first) is None
+    # Acquiring again, like after a reload, doesn't share the switch
+    assert _acquire(hass, "climate.first", first) is None
+    assert first == []
+
+    demand = _acquire(hass, "climate.second", second)
+    assert isinstance(demand, EquipmentDemand)
+    assert [type(item) for item in first] == [EquipmentDemand]
+    assert second == []
+
+    await first[0].async_turn(True, None)
+    assert demand.as_dict()["demand"] == ["climate.first"]
+    assert demand.as_dict()["zones"] == 2
+
+
+async def test_released_switch_goes_to_the_next_zone(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a zone that used a switch alone hands it over when it is removed."""
+    shared: list[EquipmentDemand] = []
+    assert _acquire(hass, "climate.first", shared) is None
+
+    async_get_equipment_manager(hass).async_release(FURNACE, "climate.first")
+    assert _acquire(hass, "climate.second", shared) is None
+    assert shared == []
+
+
+async def test_zones_of_different_entries_share_a_switch(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a zone added later turns the switch of a running zone into a shared one."""
+    first = create_zone(
+        hass,
+        0,
+        zone_config(
+            0, heater_switch=FURNACE, cycle_delay=timedelta(minutes=1), openings=[]
+        ),
+    )
+    start_zone(hass, first, 18)
+    await hass.async_block_till_done()
+    assert isinstance(first._heater, SwitchActuator)
+    assert hass.states.get(FURNACE).state == STATE_ON
+    await clock.async_advance_to(clock.now() + timedelta(minutes=1))
+
+    second = create_zone(
+        hass,
+        1,
+        zone_config(
+            1, heater_switch=FURNACE, cycle_delay=timedelta(minutes=1), openings=[]
+        ),
+    )
+    assert first._heater.is_shared
+    assert second._heater.is_shared
+    start_zone(hass, second, 22)
+    await hass.async_block_till_done()
+
+    # The first zone still demands heat, so the furnace stays on
+    assert first._heater.target
+    assert not second._heater.target
+    assert hass.states.get(FURNACE).state == STATE_ON
+
+    # Switch events now reach the zone through the shared switch only
+    assert "heater" not in first._switch_listeners
+
+
+async def test_cycle_locked_zone_keeps_driving_shared_switches(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the cycle lock of a zone doesn't freeze its demand on a shared switch."""
+    first = create_zone(
+        hass,
+        0,
+        zone_config(
+            0, heater_switch=FURNACE, cycle_delay=timedelta(minutes=10), openings=[]
+        ),
+    )
+    start_zone(hass, first, 18)
+    await hass.async_block_till_done()
+    assert first._state.is_cycle_locked
+
+    second = create_zone(
+        hass,
+        1,
+        zone_config(
+            1, heater_switch=FURNACE, cycle_delay=timedelta(minutes=10), openings=[]
+        ),
+    )
+    start_zone(hass, second, 22)
+    await hass.async_block_till_done()
+
+    # Still locked, the first zone carries its demand over to the shared furnace
+    assert first._state.is_cycle_locked
+    assert first._heater.target
+    assert hass.states.get(FURNACE).state == STATE_ON
+
+    hass.states.async_set(first._temp_sensor_ids[0], "23")
+    await hass.async_block_till_done()
+    assert first._state.is_cycle_locked
+    assert not first._heater.target
+    assert hass.states.get(FURNACE).state == STATE_OFF
@@ -0,0 +1,123 @@
+"""Tests for the shared opening index."""
+from __future__ import annotations
+
+from homeassistant.const import STATE_CLOSED, STATE_OFF, STATE_ON, STATE_OPEN
+from homeassistant.core import State
+
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.openings import OpeningIndex
+
+DOOR = "binary_sensor.door"
+WINDOW = "binary_sensor.window"
+HATCH = "binary_sensor.hatch"
+
+
+async def test_overlapping_groups_are_counted_separately(
+    hass: StubHomeAssistant,
+) -> None:
+    """Test an opening updates every group it belongs to, notifying on flips only."""
+    index = OpeningIndex(hass)
+    front: list[bool] = []
+    back: list[bool] = []
+    front_group, _ = index.async_subscribe([DOOR, WINDOW], front.append)
+    back_group, _ = index.async_subscribe([WINDOW, HATCH], back.append)
+
+    hass.states.async_set(WINDOW, STATE_ON)
+    assert (front_group.open_count, back_group.open_count) == (1, 1)
+    assert front == [True]
+    assert back == [True]
+
+    hass.states.async_set(DOOR, STATE_OPEN)
+    assert front_group.open_count == 2
+    assert front == [True]
+
+    hass.states.async_set(WINDOW, STATE_OFF)
+    assert (front_group.open_count, back_group.open_count) == (1, 0)
+    assert front == [True]
+    assert back == [True, False]
+
+    hass.states.async_set(DOOR, STATE_CLOSED)
+    assert not front_group.is_open
+    assert front == [True, False]
+
+
+async def test_repeated_open_states_are_counted_once(
+    hass: StubHomeAssistant,
+) -> None:
+    """Test an opening that stays open through another open state counts once."""
+    index = OpeningIndex(hass)
+    group, _ = index.async_subscribe([DOOR], lambda _: None)
+
+    hass.states.async_set(DOOR, STATE_ON)
+    hass.states.async_set(DOOR, STATE_OPEN)
+    assert group.open_count == 1
+
+    hass.states.async_set(DOOR, "unavailable")
+    assert group.open_count == 0
+
+
+async def test_zones_with_the_same_openings_share_a_group(
+    hass: StubHomeAssistant,
+) -> None:
+    """Test groups are shared and dropped once their last zone leaves."""
+    index = OpeningIndex(hass)
+    first: list[bool] = []
+    second: list[bool] = []
+    group, remove_first = index.async_subscribe([DOOR, WINDOW], first.append)
+    same, remove_second = index.async_subscribe([WINDOW, DOOR], second.append)
+    assert same is group
+    assert index.group_count == 1
+
+    remove_first()
+    hass.states.async_set(DOOR, STATE_ON)
+    assert first == []
+    assert second == [True]
+
+    remove_second()
+    assert index.group_count == 0
+    hass.states.async_set(DOOR, STATE_OFF)
+    assert second == [True]
+
+    # A new group reads the opening from its events again
+    group, _ = index.async_subscribe([DOOR], lambda _: None)
+    assert group.open_count == 0
+    hass.states.async_set(DOOR, STATE_ON)
+    assert group.open_count == 1
+
+
+async def test_new_group_counts_openings_already_open(
+    hass: StubHomeAssistant,
+) -> None:
+    """Test a group joining a tracked opening starts from its current state."""
+    index = OpeningIndex(hass)
+    index.async_subscribe([DOOR], lambda _: None)
+    hass.states.async_set(DOOR, STATE_ON)
+
+    group, _ = index.async_subscribe([DOOR, WINDOW], lambda _: None)
+    assert group.open_count == 1
+
+
+async def test_seed_counts_open_openings_silently(hass: StubHomeAssistant) -> None:
+    """Test seeding counts open openings without notifying and only once."""
+    index = OpeningIndex(hass)
+    notified: list[bool] = []
+    group, _ = index.async_subscribe([DOOR, WINDOW], notified.append)
+
+    hass.states.async_set(WINDOW, STATE_OFF)
+    index.async_seed(
+        {
+            DOOR: State(DOOR, STATE_ON),
+            WINDOW: State(WINDOW, STATE_ON),
+            HATCH: State(HATCH, STATE_ON),
+        }
+    )
+    # The window already reported through an event, the snapshot is older
+    assert group.open_count == 1
+    assert notified == []
+
+    index.async_seed({DOOR: State(DOOR, STATE_OFF)})
+    assert group.open_count == 1
+
+    hass.states.async_set(DOOR, STATE_OFF)
+    assert group.open_count == 0
+    assert notified == [False]
@@ -0,0 +1,121 @@
+"""Tests for the reconciliation of switches."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from homeassistant.const import SERVICE_TURN_ON, STATE_OFF, STATE_ON
+from homeassistant.core import DOMAIN as HA_DOMAIN
+from homeassistant.helpers import issue_registry as ir
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.actuator import SwitchActuator
+from custom_components.yas_thermostat.const import DOMAIN, ActuatorMode
+from custom_components.yas_thermostat.reconcile import (
+    INITIAL_RETRY_DELAY,
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    async_get_reconciler,
+)
+
+HEATER = "switch.heater"
+TIMEOUT = timedelta(seconds=5)
+ISSUE_ID = f"unresponsive_switch_{HEATER}"
+
+
+@pytest.fixture
+def issues(hass: StubHomeAssistant) -> ir.IssueRegistry:
+    """Return an issue registry on the stub Home Assistant."""
+    registry = hass.data[ir.DATA_REGISTRY] = ir.IssueRegistry(hass)
+    return registry
+
+
+@pytest.fixture
+def sent_at(hass: StubHomeAssistant, clock: VirtualClock) -> list[datetime]:
+    """Return the times the switch was turned on, it never reports back."""
+    times: list[datetime] = []
+
+    async def _turn_on(_) -> None:
+        times.append(clock.now())
+
+    hass.services.async_register(HA_DOMAIN, SERVICE_TURN_ON, _turn_on)
+    return times
+
+
+def _report(hass: StubHomeAssistant, actuator: SwitchActuator, state: str) -> None:
+    hass.states.async_set(HEATER, state)
+    actuator.async_handle_state(hass.states.get(HEATER))
+
+
+async def test_retries_back_off_then_raise_an_issue(
+    hass: StubHomeAssistant,
+    clock: VirtualClock,
+    issues: ir.IssueRegistry,
+    sent_at: list[datetime],
+) -> None:
+    """Test retries double their delay until the switch is reported unresponsive."""
+    start = clock.now()
+    actuator = SwitchActuator(hass, HEATER, TIMEOUT, ActuatorMode.CONFIRM)
+    await actuator.async_turn(True, None)
+
+    await clock.async_advance_to(start + timedelta(hours=2))
+
+    expected = [start]
+    for attempt in range(MAX_RETRIES):
+        delay = min(INITIAL_RETRY_DELAY * 2**attempt, MAX_RETRY_DELAY)
+        expected.append(expected[-1] + TIMEOUT + delay)
+    assert sent_at == expected
+    assert actuator.as_dict()["retries"] == MAX_RETRIES
+
+    issue = issues.async_get_issue(DOMAIN, ISSUE_ID)
+    assert issue is not None
+    assert issue.translation_placeholders == {"entity_id": HEATER}
+
+    # Left alone until it reports the intended state
+    _report(hass, actuator, STATE_ON)
+    assert actuator.as_dict()["retries"] == 0
+    assert issues.async_get_issue(DOMAIN, ISSUE_ID) is None
+
+
+async def test_switch_catching_up_stops_the_retries(
+    hass: StubHomeAssistant,
+    clock: VirtualClock,
+    issues: ir.IssueRegistry,
+    sent_at: list[datetime],
+) -> None:
+    """Test a switch that reports the intended state late isn't commanded again."""
+    start = clock.now()
+    actuator = SwitchActuator(hass, HEATER, TIMEOUT, ActuatorMode.CONFIRM)
+    await actuator.async_turn(True, None)
+    await clock.async_advance_to(start + TIMEOUT)
+    assert actuator.as_dict()["retries"] == 0
+    assert len(async_get_reconciler(hass)._retries) == 1
+
+    _report(hass, actuator, STATE_ON)
+    await clock.async_advance_to(start + timedelta(hours=1))
+
+    assert sent_at == [start]
+    assert async_get_reconciler(hass)._retries == {}
+
+
+async def test_new_intended_state_resets_the_backoff(
+    hass: StubHomeAssistant,
+    clock: VirtualClock,
+    issues: ir.IssueRegistry,
+    sent_at: list[datetime],
+) -> None:
+    """Test commanding another state drops the retries of the previous one."""
+    start = clock.now()
+    actuator = SwitchActuator(hass, HEATER, TIMEOUT, ActuatorMode.CONFIRM)
+    await actuator.async_turn(True, None)
+    await clock.async_advance_to(start + timedelta(seconds=100))
+    assert actuator.as_dict()["retries"] == 2
+
+    await actuator.async_turn(False, None)
+    assert actuator.as_dict()["retries"] == 0
+    _report(hass, actuator, STATE_OFF)
+
+    await clock.async_advance_to(start + timedelta(hours=1))
+    assert len(sent_at) == 3
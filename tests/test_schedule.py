@@ -0,0 +1,147 @@
+"""Tests for the weekly schedules."""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.schedule import (
+    MINUTES_PER_DAY,
+    ScheduledTransition,
+    ScheduleEngine,
+    compile_schedule,
+    latest_transition,
+)
+
+# The virtual clock starts on Sunday 2023-01-01 00:00 UTC
+MONDAY = datetime.fromisoformat("2023-01-02T00:00:00+00:00")
+
+
+class _Zone:
+    """Zone that records the transitions applied to it."""
+
+    def __init__(self, entity_id: str) -> None:
+        self.entity_id = entity_id
+        self.applied: list[ScheduledTransition] = []
+        self.evaluations = 0
+
+    def async_apply_transition(self, transition: ScheduledTransition) -> None:
+        self.applied.append(transition)
+
+    def async_write_settings(self) -> None:
+        pass
+
+    async def async_request_evaluation(self) -> None:
+        self.evaluations += 1
+
+
+def _transition(day: int, hour: int, preset: str) -> ScheduledTransition:
+    return ScheduledTransition(day * MINUTES_PER_DAY + hour * 60, preset, None, None)
+
+
+def _armed(clock: VirtualClock) -> list[datetime]:
+    return sorted(entry[0] for entry in clock._wakeups if entry[2] is not None)
+
+
+def test_compile_expands_days_in_order() -> None:
+    """Test transitions are expanded per day, the last of a minute coming last."""
+    transitions = compile_schedule(
+        [
+            {"at": time(22, 0), "preset_mode": "Sleep"},
+            {"at": time(7, 30), "days": ["sat", "sun"], "preset_mode": "Home"},
+            {"at": time(7, 30), "days": ["sun"], "preset_mode": "Away"},
+        ]
+    )
+
+    assert len(transitions) == 10
+    assert [t.minute for t in transitions] == sorted(t.minute for t in transitions)
+    sunday = 6 * MINUTES_PER_DAY + 7 * 60 + 30
+    assert [t.preset_mode for t in transitions if t.minute == sunday] == [
+        "Home",
+        "Away",
+    ]
+
+
+def test_latest_transition_wraps_around_the_week() -> None:
+    """Test the transition in effect may be one from the end of the previous week."""
+    transitions = [_transition(0, 7, "Home"), _transition(4, 22, "Away")]
+
+    assert latest_transition(transitions, None, MONDAY).preset_mode == "Away"
+    assert (
+        latest_transition(transitions, None, MONDAY + timedelta(hours=7)).preset_mode
+        == "Home"
+    )
+    assert latest_transition(transitions, MONDAY, MONDAY + timedelta(hours=6)) is None
+    assert (
+        latest_transition(transitions, MONDAY, MONDAY + timedelta(days=5)).preset_mode
+        == "Away"
+    )
+
+
+async def test_one_timer_serves_every_zone(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the engine only arms the next transition of any zone."""
+    engine = ScheduleEngine(hass)
+    bedroom, office = _Zone("climate.bedroom"), _Zone("climate.office")
+    engine.async_register(
+        bedroom, [_transition(0, 7, "Home"), _transition(0, 22, "Sleep")]
+    )
+    engine.async_register(office, [_transition(0, 9, "Work")])
+    assert _armed(clock) == [MONDAY + timedelta(hours=7)]
+
+    await clock.async_advance_to(MONDAY + timedelta(hours=9))
+    await hass.async_block_till_done()
+    assert [t.preset_mode for t in bedroom.applied] == ["Home"]
+    assert [t.preset_mode for t in office.applied] == ["Work"]
+    assert (bedroom.evaluations, office.evaluations) == (1, 1)
+    assert _armed(clock) == [MONDAY + timedelta(hours=22)]
+
+    await clock.async_advance_to(MONDAY + timedelta(days=7, hours=7))
+    await hass.async_block_till_done()
+    assert [t.preset_mode for t in bedroom.applied] == ["Home", "Sleep", "Home"]
+    assert [t.preset_mode for t in office.applied] == ["Work"]
+
+
+async def test_late_wakeup_applies_only_the_latest_missed(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a zone only gets its last missed transition when the timer runs late."""
+    engine = ScheduleEngine(hass)
+    zone = _Zone("climate.bedroom")
+    engine.async_register(
+        zone,
+        [
+            _transition(0, 7, "Home"),
+            _transition(0, 8, "Away"),
+            _transition(0, 9, "Home"),
+        ],
+    )
+
+    # The event loop was blocked past two of the transitions
+    clock._now = MONDAY + timedelta(hours=8, minutes=30)
+    await clock.async_advance_to(clock._now)
+    await hass.async_block_till_done()
+
+    assert [t.preset_mode for t in zone.applied] == ["Away"]
+    assert _armed(clock) == [MONDAY + timedelta(hours=9)]
+
+
+async def test_removed_zone_is_dropped_from_the_index(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test removing a zone drops its transitions and re-arms the timer."""
+    engine = ScheduleEngine(hass)
+    bedroom, office = _Zone("climate.bedroom"), _Zone("climate.office")
+    remove_bedroom = engine.async_register(bedroom, [_transition(0, 7, "Home")])
+    remove_office = engine.async_register(office, [_transition(0, 9, "Work")])
+
+    remove_bedroom()
+    assert _armed(clock) == [MONDAY + timedelta(hours=9)]
+
+    remove_office()
+    assert _armed(clock) == []
+
+    await clock.async_advance_to(MONDAY + timedelta(days=1))
+    await hass.async_block_till_done()
+    assert bedroom.applied == office.applied == []
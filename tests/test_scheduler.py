@@ -0,0 +1,91 @@
+"""Tests for the single-flight update scheduler."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.scheduler import UpdateScheduler
+
+
+class _Evaluation:
+    """Evaluation that blocks until released and records how often it ran."""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def __call__(self) -> None:
+        self.runs += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+
+
+async def test_triggers_during_an_evaluation_are_coalesced(
+    hass: StubHomeAssistant,
+) -> None:
+    """Test triggers arriving mid evaluation fold into one follow up evaluation."""
+    evaluation = _Evaluation()
+    scheduler = UpdateScheduler(hass, "zone", evaluation)
+
+    first = scheduler.async_schedule()
+    await asyncio.sleep(0)
+    assert scheduler.is_running
+    followers = [scheduler.async_schedule() for _ in range(5)]
+    assert all(future is followers[0] for future in followers)
+
+    evaluation.release.set()
+    await asyncio.gather(first, *followers)
+
+    assert evaluation.runs == 2
+    assert scheduler.as_dict() == {"triggers": 6, "evaluations": 2, "coalesced": 4}
+    assert not scheduler.is_running
+
+
+async def test_errors_reach_waiting_callers(hass: StubHomeAssistant) -> None:
+    """Test the error of an evaluation is raised to callers of async_request."""
+    evaluation = _Evaluation()
+    evaluation.error = ValueError("broken")
+    evaluation.release.set()
+    scheduler = UpdateScheduler(hass, "zone", evaluation)
+
+    with pytest.raises(ValueError, match="broken"):
+        await scheduler.async_request()
+
+    # The scheduler keeps working after a failed evaluation
+    evaluation.error = None
+    await scheduler.async_request()
+    assert evaluation.runs == 2
+
+
+async def test_errors_of_event_triggered_runs_are_logged(
+    hass: StubHomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an evaluation only triggered by events logs its error."""
+    evaluation = _Evaluation()
+    evaluation.error = ValueError("broken")
+    evaluation.release.set()
+    scheduler = UpdateScheduler(hass, "zone", evaluation)
+
+    with caplog.at_level(logging.ERROR):
+        assert await scheduler.async_schedule() is None
+
+    assert "Error evaluating zone" in caplog.text
+
+
+async def test_shutdown_releases_waiting_callers(hass: StubHomeAssistant) -> None:
+    """Test shutting down cancels the evaluation and releases its waiters."""
+    evaluation = _Evaluation()
+    scheduler = UpdateScheduler(hass, "zone", evaluation)
+
+    scheduler.async_schedule()
+    await asyncio.sleep(0)
+    waiting = scheduler.async_schedule()
+    scheduler.async_shutdown()
+
+    assert await waiting is None
+    assert not scheduler.is_running
@@ -0,0 +1,75 @@
+"""Tests for the diagnostic sensors of the zones."""
+from __future__ import annotations
+
+from homeassistant.helpers.entity import EntityCategory
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from benchmarks.zones import create_zone, start_zone, zone_config
+from custom_components.yas_thermostat.const import DISCOVERY_ZONES
+from custom_components.yas_thermostat.sensor import (
+    ZoneLatencySensor,
+    ZoneTraceSensor,
+    async_setup_platform,
+)
+
+
+async def test_sensors_are_added_for_zones_with_metrics(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test zones get a sensor for their metrics and for their trace."""
+    zones = [
+        create_zone(hass, 0, zone_config(0, metrics=True)),
+        create_zone(hass, 1, zone_config(1)),
+        create_zone(hass, 2, zone_config(2, trace_size=0)),
+    ]
+    added = []
+
+    await async_setup_platform(hass, {}, added.extend, None)
+    assert added == []
+
+    await async_setup_platform(hass, {}, added.extend, {DISCOVERY_ZONES: zones})
+    assert [sensor.name for sensor in added] == [
+        "Zone 0 Decision Latency",
+        "Zone 0 Decision Trace",
+        "Zone 1 Decision Trace",
+    ]
+    assert all(sensor.entity_category == EntityCategory.DIAGNOSTIC for sensor in added)
+
+
+async def test_latency_sensor_publishes_the_histograms(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the latency sensor reports the mean and the metrics of the zone."""
+    zone = create_zone(hass, 0, zone_config(0, metrics=True))
+    sensor = ZoneLatencySensor(zone)
+    assert sensor.native_value is None
+
+    zone.metrics.decision.record(0.002)
+    zone.metrics.decision.record(0.004)
+    zone.metrics.actuator("heater").commands = 3
+
+    assert sensor.native_value == 3.0
+    attributes = sensor.extra_state_attributes
+    assert attributes["decision"]["count"] == 2
+    assert attributes["decision"]["buckets_ms"]["le_2"] == 1
+    assert attributes["decision"]["buckets_ms"]["le_5"] == 1
+    assert attributes["actuators"]["heater"]["commands"] == 3
+
+
+async def test_trace_sensor_publishes_the_decisions(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the trace sensor reports the latest decision and the recent ones."""
+    zone = create_zone(hass, 0, zone_config(0, trace_size=5))
+    sensor = ZoneTraceSensor(zone)
+    assert sensor.native_value is None
+    assert sensor.extra_state_attributes == {"decisions": []}
+
+    start_zone(hass, zone, 18)
+    await hass.async_block_till_done()
+
+    assert sensor.native_value == clock.now()
+    decisions = sensor.extra_state_attributes["decisions"]
+    assert decisions[-1]["heating"] is True
+    assert decisions[-1]["current_temp"] == 18
@@ -0,0 +1,115 @@
+"""Tests for the runtime data kept across restarts."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import os
+from typing import Any
+
+import pytest
+
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.store import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    RuntimeStore,
+)
+
+
+class _Saves:
+    """Records the delayed writes of a store instead of running them."""
+
+    def __init__(self) -> None:
+        self.pending: list[Callable[[], Any]] = []
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float) -> None:
+        assert delay == SAVE_DELAY
+        self.pending.append(data_func)
+
+    def run(self) -> Any:
+        return self.pending.pop(0)()
+
+
+@pytest.fixture
+def saves(monkeypatch: pytest.MonkeyPatch) -> _Saves:
+    """Keep the delayed writes of the stores from reaching the event loop."""
+    saves = _Saves()
+    monkeypatch.setattr(
+        "homeassistant.helpers.storage.Store.async_delay_save",
+        lambda _, data_func, delay: saves.async_delay_save(data_func, delay),
+    )
+    return saves
+
+
+def _write_file(hass: StubHomeAssistant, data: dict[str, Any]) -> None:
+    path = hass.config.path(".storage", STORAGE_KEY)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"version": STORAGE_VERSION, "key": STORAGE_KEY, "data": data}, file)
+
+
+async def test_changes_are_written_together(
+    hass: StubHomeAssistant, saves: _Saves
+) -> None:
+    """Test any number of changes result in one write, collected when it happens."""
+    store = RuntimeStore(hass)
+    await store.async_load()
+    bedroom = {"on_time": 1}
+
+    store.async_changed("climate.bedroom", lambda: dict(bedroom))
+    bedroom["on_time"] = 2
+    store.async_changed("climate.bedroom", lambda: dict(bedroom))
+    store.async_changed("climate.office", lambda: {"on_time": 5})
+    assert len(saves.pending) == 1
+
+    assert saves.run() == {
+        "climate.bedroom": {"on_time": 2},
+        "climate.office": {"on_time": 5},
+    }
+    assert store.get("climate.bedroom") == {"on_time": 2}
+
+    # The next change schedules another write
+    store.async_changed("climate.office", lambda: {"on_time": 6})
+    assert len(saves.pending) == 1
+    assert saves.run()["climate.office"] == {"on_time": 6}
+
+
+async def test_prune_drops_unconfigured_zones(
+    hass: StubHomeAssistant, saves: _Saves
+) -> None:
+    """Test pruning drops the data of removed zones and only then writes."""
+    _write_file(
+        hass, {"climate.bedroom": {"on_time": 1}, "climate.attic": {"on_time": 2}}
+    )
+    store = RuntimeStore(hass)
+    await store.async_load()
+
+    store.async_prune(["climate.bedroom", "climate.office"])
+    assert store.get("climate.attic") is None
+    assert len(saves.pending) == 1
+    assert saves.run() == {"climate.bedroom": {"on_time": 1}}
+
+    store.async_prune(["climate.bedroom"])
+    assert saves.pending == []
+
+
+async def test_load_keeps_earlier_changes(
+    hass: StubHomeAssistant, saves: _Saves
+) -> None:
+    """Test the file is read once and data changed before that wins."""
+    _write_file(
+        hass, {"climate.bedroom": {"on_time": 1}, "climate.office": {"on_time": 2}}
+    )
+    store = RuntimeStore(hass)
+    assert store.get("climate.bedroom") is None
+
+    store.async_changed("climate.office", lambda: {"on_time": 3})
+    saves.run()
+    await store.async_load()
+    assert store.get("climate.bedroom") == {"on_time": 1}
+    assert store.get("climate.office") == {"on_time": 3}
+
+    _write_file(hass, {})
+    await store.async_load()
+    assert store.get("climate.bedroom") == {"on_time": 1}
@@ -0,0 +1,141 @@
+"""Tests for the shared deadline timer."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from benchmarks.replay import VirtualClock
+from benchmarks.stub import StubHomeAssistant
+from custom_components.yas_thermostat.timer import COMPACT_MIN_SIZE, TimerHeap
+
+
+def _armed(clock: VirtualClock) -> list[datetime]:
+    return sorted(entry[0] for entry in clock._wakeups if entry[2] is not None)
+
+
+async def test_deadlines_run_in_order_on_one_wakeup(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test deadlines run in order while only the earliest one is armed."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    ran: list[tuple[str, datetime]] = []
+    for name, minutes in (("c", 3), ("a", 1), ("b", 2), ("a2", 1)):
+        timers.async_schedule(
+            start + timedelta(minutes=minutes),
+            lambda now, name=name: ran.append((name, now)),
+        )
+
+    assert len(timers) == 4
+    assert _armed(clock) == [start + timedelta(minutes=1)]
+
+    await clock.async_advance_to(start + timedelta(minutes=2))
+    assert [name for name, _ in ran] == ["a", "a2", "b"]
+    assert ran[-1][1] == start + timedelta(minutes=2)
+    assert _armed(clock) == [start + timedelta(minutes=3)]
+
+    await clock.async_advance_to(start + timedelta(minutes=3))
+    assert [name for name, _ in ran] == ["a", "a2", "b", "c"]
+    assert len(timers) == 0
+    assert _armed(clock) == []
+
+
+async def test_cancelled_deadlines_are_skipped_lazily(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a cancelled deadline stays in the heap until it reaches the top."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    ran: list[str] = []
+    first = timers.async_schedule(
+        start + timedelta(minutes=1), lambda _: ran.append("first")
+    )
+    timers.async_schedule(start + timedelta(minutes=2), lambda _: ran.append("second"))
+
+    first.cancel()
+    first.cancel()
+    assert len(timers) == 1
+    assert len(timers._heap) == 2
+    # The wakeup isn't moved, it finds nothing due and arms for the next deadline
+    assert _armed(clock) == [start + timedelta(minutes=1)]
+
+    await clock.async_advance_to(start + timedelta(minutes=1))
+    assert ran == []
+    assert len(timers._heap) == 1
+    assert _armed(clock) == [start + timedelta(minutes=2)]
+
+    await clock.async_advance_to(start + timedelta(minutes=2))
+    assert ran == ["second"]
+    assert len(timers) == 0
+
+
+async def test_cancelling_after_the_deadline_ran_is_ignored(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test cancelling a deadline that already ran doesn't skew the live count."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    handle = timers.async_schedule(start + timedelta(minutes=1), lambda _: None)
+    timers.async_schedule(start + timedelta(minutes=2), lambda _: None)
+
+    await clock.async_advance_to(start + timedelta(minutes=1))
+    handle.cancel()
+    assert len(timers) == 1
+
+
+async def test_mostly_cancelled_heap_is_compacted(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test the heap drops cancelled entries once they make up most of it."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    handles = [
+        timers.async_schedule(start + timedelta(seconds=index), lambda _: None)
+        for index in range(1, COMPACT_MIN_SIZE + 1)
+    ]
+
+    for handle in handles[: COMPACT_MIN_SIZE // 2]:
+        handle.cancel()
+    assert len(timers._heap) == COMPACT_MIN_SIZE
+
+    handles[COMPACT_MIN_SIZE // 2].cancel()
+    assert len(timers._heap) == COMPACT_MIN_SIZE // 2 - 1
+    assert len(timers) == COMPACT_MIN_SIZE // 2 - 1
+    assert all(not entry[2].cancelled for entry in timers._heap)
+
+
+async def test_deadline_scheduled_by_an_action_runs(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test a deadline scheduled while the due ones run is armed and runs."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    ran: list[datetime] = []
+
+    def _reschedule(now: datetime) -> None:
+        ran.append(now)
+        if len(ran) < 3:
+            timers.async_schedule(now + timedelta(minutes=5), _reschedule)
+
+    timers.async_schedule(start + timedelta(minutes=5), _reschedule)
+    await clock.async_advance_to(start + timedelta(hours=1))
+
+    assert ran == [start + timedelta(minutes=minutes) for minutes in (5, 10, 15)]
+    assert _armed(clock) == []
+
+
+async def test_earlier_deadline_rearms_the_wakeup(
+    hass: StubHomeAssistant, clock: VirtualClock
+) -> None:
+    """Test scheduling an earlier deadline replaces the armed wakeup."""
+    timers = TimerHeap(hass)
+    start = clock.now()
+    timers.async_schedule(start + timedelta(minutes=10), lambda _: None)
+    timers.async_schedule(start + timedelta(minutes=20), lambda _: None)
+    assert _armed(clock) == [start + timedelta(minutes=10)]
+
+    timers.async_schedule(start + timedelta(minutes=5), lambda _: None)
+    assert _armed(clock) == [start + timedelta(minutes=5)]
+
+    timers.async_shutdown()
+    assert len(timers) == 0
+    assert _armed(clock) == []